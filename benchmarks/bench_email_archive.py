@@ -0,0 +1,85 @@
+# benchmarks/bench_email_archive.py
+"""
+Размер сохранения и время загрузки в длинной игре.
+
+    python benchmarks/bench_email_archive.py [--days 1 200] [--per-day 40]
+
+Игра проходит заданное число дней с per-day письмами в день (половина
+прочитана), с архивом (правила по умолчанию из config.json) и без
+правил хранения. С архивом сохранение 200-го дня должно быть близко к
+сохранению 1-го дня: в снимок попадает только свежая почта.
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.email_retention import RetentionPolicy, set_default_policy  # noqa: E402
+from core.game_state import GameState  # noqa: E402
+
+
+def play(days: int, per_day: int) -> GameState:
+    """Игра, прожившая days дней"""
+    state = GameState(first_name="Иван", last_name="Петров")
+    state.save(1)
+    system = state.email_system
+    for day in range(1, days + 1):
+        system.day = day
+        for number in range(per_day):
+            email_id = system.add_email("email.templates.system_notification.sender",
+                                        f"email.subjects.task_{number % 20}",
+                                        f"email.templates.task_{number % 20}.template")
+            if number % 2:
+                system.mark_as_read(email_id)
+        system.enforce_retention()
+        state.save(1)
+    return state
+
+
+def run(days: int, per_day: int, policy: RetentionPolicy) -> dict:
+    set_default_policy(policy)
+    with tempfile.TemporaryDirectory() as directory:
+        cwd = os.getcwd()
+        os.chdir(directory)
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                state = play(days, per_day)
+                state.save(1)
+                start = time.perf_counter()
+                loaded = GameState.load(1)
+                load_ms = (time.perf_counter() - start) * 1e3
+            size = sum(os.path.getsize(os.path.join("saves", name))
+                       for name in os.listdir("saves") if not name.startswith("slot_1.archive"))
+            return {"hot": loaded.email_system.get_total_count(),
+                    "archived": loaded.email_system.archive.count(),
+                    "size": size, "load_ms": load_ms}
+        finally:
+            os.chdir(cwd)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Архив писем в длинной игре")
+    parser.add_argument("--days", type=int, nargs="+", default=[1, 200])
+    parser.add_argument("--per-day", type=int, default=40)
+    args = parser.parse_args(argv)
+
+    policies = [
+        ("архив", RetentionPolicy.from_config({"max_emails": 100})),
+        ("без правил", RetentionPolicy()),
+    ]
+    print(f"{'дней':>5}  {'правила':<11} {'в почте':>8} {'в архиве':>9} {'снимок+журнал, КБ':>18} {'загрузка, мс':>13}")
+    for days in args.days:
+        for name, policy in policies:
+            result = run(days, args.per_day, policy)
+            print(f"{days:>5}  {name:<11} {result['hot']:>8} {result['archived']:>9} "
+                  f"{result['size'] / 1024:>18.1f} {result['load_ms']:>13.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+# benchmarks/bench_email_memory.py
+"""
+Память на одно письмо и время загрузки EmailSystem.from_dict.
+
+    python benchmarks/bench_email_memory.py [--sizes 1000 100000]
+
+Сравнивается прежнее представление письма (dataclass с __dict__ и
+собственным словарём параметров) с текущим Email (__slots__,
+интернированные ключи, общие словари параметров). Данные писем
+проходят через json, как при загрузке сохранения.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.bench_save_formats import build_emails  # noqa: E402
+from core.email_system import Email, EmailSystem  # noqa: E402
+
+
+@dataclass
+class DataclassEmail:
+    """Прежнее представление письма"""
+    id: int
+    sender_key: str
+    subject_key: str
+    template_key: str
+    parameters: Dict[str, Any]
+    date: str
+    read: bool = False
+    important: bool = False
+    is_spam: bool = False
+    spam_type: Optional[str] = None
+
+
+def traced_size(build) -> int:
+    """Сколько памяти занимает результат build(), байт"""
+    tracemalloc.start()
+    result = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return size
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Память писем и скорость загрузки")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 100000])
+    args = parser.parse_args(argv)
+
+    print(f"{'писем':>8}  {'dataclass, Б/письмо':>20} {'Email, Б/письмо':>16} {'выигрыш':>8} {'from_dict, мс':>14}")
+    for size in args.sizes:
+        data = json.loads(json.dumps(build_emails(size)))
+        records = data["inbox"] + data["sent"]
+
+        old_size = traced_size(lambda: [DataclassEmail(**json.loads(json.dumps(record))) for record in records])
+        new_size = traced_size(lambda: [Email.from_dict(json.loads(json.dumps(record))) for record in records])
+
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            EmailSystem.from_dict(data)
+        load_ms = (time.perf_counter() - start) * 1000
+
+        print(f"{size:>8}  {old_size / size:>20.0f} {new_size / size:>16.0f} "
+              f"{old_size / new_size:>7.1f}x {load_ms:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+# benchmarks/bench_email_store.py
+"""
+Время запросов к EmailSystem в зависимости от числа писем.
+
+    python benchmarks/bench_email_store.py [--sizes 1000 100000] [--ops 10000]
+
+Запросы, которые интерфейс делает каждый тик (поиск по id, счётчики,
+проверки писем МВД), не должны замедляться с ростом почтового ящика.
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.bench_save_formats import build_emails  # noqa: E402
+from core.email_system import EmailSystem  # noqa: E402
+
+
+def measure(func, ops: int) -> float:
+    """Среднее время одного вызова, мкс"""
+    start = time.perf_counter()
+    for _ in range(ops):
+        func()
+    return (time.perf_counter() - start) / ops * 1e6
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Запросы к хранилищу писем")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 100000])
+    parser.add_argument("--ops", type=int, default=10000)
+    args = parser.parse_args(argv)
+
+    random.seed(1)
+    print(f"{'писем':>8}  {'запрос':<24} {'мкс/вызов':>10}")
+    for size in args.sizes:
+        with contextlib.redirect_stdout(io.StringIO()):
+            system = EmailSystem.from_dict(build_emails(size))
+        ids = [random.randrange(size) for _ in range(args.ops)]
+        id_iter = iter(ids * 2)
+
+        queries = [
+            ("get_email_by_id", lambda: system.get_email_by_id(next(id_iter))),
+            ("get_unread_count", system.get_unread_count),
+            ("get_total_count", system.get_total_count),
+            ("get_important_count", system.get_important_count),
+            ("get_spam_count(type)", lambda: system.get_spam_count("crypto")),
+            ("has_unread_mvd_emails", system.has_unread_mvd_emails),
+            ("has_read_mvd_emails", system.has_read_mvd_emails),
+            ("is_mvd", lambda: system.is_mvd(next(id_iter))),
+        ]
+        for name, query in queries:
+            print(f"{size:>8}  {name:<24} {measure(query, args.ops):>10.3f}")
+
+        # Изменения: прочтение и удаление
+        with contextlib.redirect_stdout(io.StringIO()):
+            unique_ids = iter(random.sample(range(size), min(size, args.ops)))
+
+            def toggle_read():
+                email_id = next(unique_ids)
+                system.mark_as_read(email_id)
+                system.mark_as_unread(email_id)
+
+            toggle_us = measure(toggle_read, min(size, args.ops))
+            delete_ids = iter(random.sample(range(size), min(size, args.ops)))
+            delete_us = measure(lambda: system.delete_email(next(delete_ids)), min(size, args.ops))
+        print(f"{size:>8}  {'mark_as_read + unread':<24} {toggle_us:>10.3f}")
+        print(f"{size:>8}  {'delete_email':<24} {delete_us:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+# benchmarks/bench_mail_search.py
+"""
+Время поиска по почте.
+
+    python benchmarks/bench_mail_search.py [--sizes 1000 100000] [--ops 100]
+
+Почта собирается из настоящих писем на русском: приветствие и письма МВД
+по шаблонам, спам из генератора, системные уведомления. Индекс строится
+один раз (первый поиск), дальше каждый запрос из строки поиска должен
+выполняться за миллисекунды даже на 100 000 писем.
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.email_retention import RetentionPolicy  # noqa: E402
+from core.email_system import EmailSystem  # noqa: E402
+from core.spam_generator import get_spam_generator  # noqa: E402
+from simple_translation import translation  # noqa: E402
+
+
+QUERIES = ["иван", "ив", "мвд", "проверка безопасности", "is:unread", "is:important is:unread",
+           "is:mvd", "spam:scam", "иван is:unread", "нет_такого_слова"]
+
+# Тексты системных уведомлений
+NOTIFICATIONS = [
+    "Плановое обновление базы данных завершено",
+    "Проверка безопасности сети: обнаружено подозрительное подключение",
+    "Сервер почты будет перезагружен в 18:00",
+    "Резервное копирование журналов выполнено",
+]
+
+# Писем в игровой день
+EMAILS_PER_DAY = 100
+
+
+def build_mail(size: int) -> EmailSystem:
+    """Входящие из size настоящих писем (без правил хранения - все остаются в почте)"""
+    random.seed(size)
+    system = EmailSystem(player_name="Иван Петров", reputation=10, money=12345.5)
+    system.retention = RetentionPolicy(archive=False)
+    spam = get_spam_generator()
+    for number in range(size):
+        system.day = number // EMAILS_PER_DAY + 1
+        if number % 50 == 0:
+            email_id = system.add_template_email("mvd_mission_1_intro")
+        elif number % 50 == 25:
+            email_id = system.add_template_email("system_welcome")
+        elif number % 3 == 0:
+            email_id = system.add_spam_email(spam.generate_spam_data(player_name=system.player_name))
+        else:
+            email_id = system.add_template_email(
+                "system_notification", message=random.choice(NOTIFICATIONS),
+                sender=translation.t("email.templates.system_notification.sender", "Система"),
+                subject=translation.t("email.templates.system_notification.subject", "Уведомление"))
+        if number % 2 == 0:
+            system.mark_as_read(email_id)
+    return system
+
+
+def measure(func, ops: int) -> float:
+    """Среднее время одного вызова, мс"""
+    start = time.perf_counter()
+    for _ in range(ops):
+        func()
+    return (time.perf_counter() - start) / ops * 1e3
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Поиск по почте")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 100000])
+    parser.add_argument("--ops", type=int, default=100)
+    args = parser.parse_args(argv)
+
+    print(f"{'писем':>8}  {'запрос':<26} {'найдено':>8} {'мс/запрос':>10}")
+    for size in args.sizes:
+        with contextlib.redirect_stdout(io.StringIO()):
+            translation.load_translations("ru")
+            system = build_mail(size)
+            start = time.perf_counter()
+            system.search("иван")
+            build_ms = (time.perf_counter() - start) * 1e3
+        print(f"{size:>8}  {'(построение индекса)':<26} {'':>8} {build_ms:>10.1f}")
+
+        for query in QUERIES:
+            found = len(system.search(query))
+            elapsed = measure(lambda: system.search(query), args.ops)
+            print(f"{size:>8}  {query:<26} {found:>8} {elapsed:>10.3f}")
+
+        # Новое письмо попадает в индекс сразу
+        with contextlib.redirect_stdout(io.StringIO()):
+            add_ms = measure(lambda: system.add_system_notification("Проверка индекса"), args.ops)
+        print(f"{size:>8}  {'add_email (с индексом)':<26} {'':>8} {add_ms:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
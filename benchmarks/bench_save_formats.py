@@ -0,0 +1,98 @@
+# benchmarks/bench_save_formats.py
+"""
+Сравнение форматов сохранений: размер файла, время записи и чтения.
+
+    python benchmarks/bench_save_formats.py [--sizes 10 1000 100000] [--repeat 3]
+
+Для каждого размера почтового ящика строится GameState с заданным числом
+писем, и его to_dict() сериализуется каждым форматом из core.serializers
+(плюс прежний формат - JSON с отступами).
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.email_system import EmailSystem  # noqa: E402
+from core.game_state import GameState  # noqa: E402
+from core.serializers import BinarySerializer, JsonSerializer  # noqa: E402
+
+
+SPAM_TYPES = ["lottery", "prince", "pharmacy", "crypto"]
+
+
+def build_emails(email_count: int) -> dict:
+    """Словарь системы почты с email_count письмами"""
+    folders = {"inbox": [], "sent": [], "draft": []}
+    for email_id in range(email_count):
+        is_spam = email_id % 3 == 0
+        folder = "sent" if email_id % 10 == 0 else "inbox"
+        folders[folder].append({
+            "id": email_id,
+            "sender_key": "email.templates.mvd_mission.sender" if email_id % 50 == 0 else "email.senders.boss",
+            "subject_key": f"email.subjects.task_{email_id % 20}",
+            "template_key": f"email.templates.task_{email_id % 20}.template",
+            "parameters": {"player_name": "Иван Петров", "day": email_id // 50 + 1,
+                           "reputation": 10, "money": 12345.5},
+            "date": f"{8 + email_id % 10:02d}:{email_id % 60:02d}",
+            "read": email_id % 2 == 0,
+            "important": email_id % 7 == 0,
+            "is_spam": is_spam,
+            "spam_type": SPAM_TYPES[email_id % len(SPAM_TYPES)] if is_spam else None,
+        })
+    data = dict(folders)
+    data.update({"next_email_id": email_count, "player_name": "Иван Петров",
+                 "day": 42, "reputation": 10, "money": 12345.5})
+    return data
+
+
+def build_save(email_count: int) -> dict:
+    """Словарь сохранения с email_count письмами"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        state = GameState(first_name="Иван", last_name="Петров", day=42, money=12345.5)
+        state.email_system = EmailSystem.from_dict(build_emails(email_count))
+        return state.to_dict()
+
+
+def measure(func, repeat: int) -> float:
+    """Лучшее время из repeat запусков, мс"""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best * 1000
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Сравнение форматов сохранений")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 1000, 100000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    formats = [
+        ("json (indent=2)", JsonSerializer(pretty=True)),
+        ("json", JsonSerializer()),
+        ("binary", BinarySerializer()),
+        ("binary (без zlib)", BinarySerializer(compress=False)),
+    ]
+
+    print(f"{'писем':>8}  {'формат':<18} {'размер, КБ':>11} {'запись, мс':>11} {'чтение, мс':>11}")
+    for size in args.sizes:
+        data = build_save(size)
+        for name, serializer in formats:
+            raw = serializer.dumps(data)
+            assert serializer.loads(raw) == data
+            dump_ms = measure(lambda: serializer.dumps(data), args.repeat)
+            load_ms = measure(lambda: serializer.loads(raw), args.repeat)
+            print(f"{size:>8}  {name:<18} {len(raw) / 1024:>11.1f} {dump_ms:>11.1f} {load_ms:>11.1f}")
+
+
+if __name__ == "__main__":
+    main()
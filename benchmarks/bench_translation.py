@@ -0,0 +1,101 @@
+# benchmarks/bench_translation.py
+"""
+Скорость translation.t() на настоящих ключах translations/*.json.
+
+    python benchmarks/bench_translation.py [--rounds 20]
+
+Сравнивается прежний поиск (разбор ключа по точкам и спуск по вложенным
+словарям) и скомпилированная плоская таблица, для обычных ключей, ключей
+с подстановками и отсутствующих ключей.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from simple_translation import compile_formats, flatten_translations, translation  # noqa: E402
+
+
+def nested_t(translations: dict, key: str, default=None, **kwargs):
+    """Прежняя реализация t(): спуск по дереву на каждый вызов"""
+    try:
+        keys = key.split('.')
+        value = translations
+        for k in keys:
+            if isinstance(value, dict) and k in value:
+                value = value[k]
+            else:
+                if default is not None:
+                    return default
+                return f"[{key}]"
+        if kwargs and isinstance(value, str):
+            try:
+                return value.format(**kwargs)
+            except KeyError:
+                return value
+        return str(value) if value is not None else f"[{key}]"
+    except Exception:
+        if default is not None:
+            return default
+        return f"[{key}]"
+
+
+def placeholder_values(fields) -> dict:
+    """Значения для всех подстановок строки"""
+    return {name: 1 for name in fields or ()}
+
+
+def measure(func, keys, rounds: int) -> float:
+    """Среднее время одного вызова, нс"""
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for key in keys:
+            func(key)
+    return (time.perf_counter() - start) / (rounds * len(keys)) * 1e9
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Поиск переводов")
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    translations_dir = os.path.join(translation.get_base_path(), "translations")
+    print(f"{'язык':<6} {'ключи':<16} {'ключей':>7} {'было, нс':>10} {'стало, нс':>10} {'ускорение':>10}")
+    for name in sorted(os.listdir(translations_dir)):
+        if not name.endswith(".json"):
+            continue
+        with open(os.path.join(translations_dir, name), "r", encoding="utf-8") as f:
+            tree = json.load(f)
+        with contextlib.redirect_stdout(io.StringIO()):
+            translation.translations = tree
+
+        flat = flatten_translations(tree)
+        leaf_keys = [key for key, value in flat.items() if isinstance(value, str)]
+        formats = compile_formats(flat)
+        kwargs = {key: placeholder_values(fields) for key, (_, fields) in formats.items()}
+        missing_keys = [f"{key}.missing" for key in leaf_keys]
+
+        cases = [
+            ("обычные", leaf_keys, {}),
+            ("с подстановкой", list(formats), kwargs),
+            ("отсутствующие", missing_keys, {}),
+        ]
+        for case, keys, key_kwargs in cases:
+            if not keys:
+                continue
+            with contextlib.redirect_stdout(io.StringIO()):
+                before = measure(lambda key: nested_t(tree, key, "x", **key_kwargs.get(key, {})),
+                                 keys, args.rounds)
+                after = measure(lambda key: translation.t(key, "x", **key_kwargs.get(key, {})),
+                                keys, args.rounds)
+            print(f"{name[:-5]:<6} {case:<16} {len(keys):>7} {before:>10.0f} {after:>10.0f} {before / after:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,391 @@
+# build_translations.py
+"""
+Проверка переводов и сборка готовых пакетов языков.
+
+    python build_translations.py                  - проверить и собрать пакеты
+    python build_translations.py --check          - только проверить
+    python build_translations.py --strict         - код возврата 1 при ошибках
+    python build_translations.py --report FILE    - отчёт в JSON
+
+Исходники игры просматриваются (ast) в поиске ключей перевода:
+    - прямые вызовы translation.t("ключ", "умолчание") и tr(...);
+    - строки-ключи в таблицах (SKILLS, STORY_DIFFICULTY_KEYS, ...);
+    - f-строки вида f"email.templates.{name}.sender" - шаблон ключа.
+
+Каждый translations/<язык>.json сравнивается с эталонным языком (--reference,
+по умолчанию ru): недостающие и лишние ключи, несовпадение типа (строка
+вместо раздела) и подстановок {name}. Ключи из кода, которых нет в эталоне,
+умолчания в коде с другими подстановками и ключи, которые код читает как
+строку, но под которыми есть вложенные ключи (t("a.b") и t("a.b.c")),
+тоже попадают в отчёт.
+
+Пакет языка (translations/bundles/<язык>.bundle) - уже скомпилированная
+таблица в формате кэша translation_catalog: недостающие ключи дополнены
+из эталона, поэтому в игре t() не уходит в запасные значения. Пакет
+хранит размеры и mtime исходных JSON; если JSON правили после сборки,
+игра берёт JSON, а не устаревший пакет. Сборка прерывается, если в пакете
+под ключом, который код читает как строку, оказался раздел - иначе t()
+вернул бы словарь, и format() упал бы при построении окна.
+"""
+
+import argparse
+import ast
+import json
+import os
+import re
+import sys
+
+from translation_catalog import (BUNDLE_DIR, BUNDLE_SUFFIX, compile_formats, file_stamp,
+                                 flatten_translations, write_compiled)
+
+
+# Каталоги, которые не относятся к коду игры
+SKIP_DIRS = {"__pycache__", "venv", ".venv", ".git", "build", "dist", "cache", "saves", "benchmarks"}
+
+# Похоже на ключ перевода: "раздел.подраздел.ключ"
+KEY_RE = re.compile(r"^[a-z][a-z0-9_]*(\.[A-Za-z0-9_]+)+$")
+
+# Функции, первый аргумент которых - ключ перевода
+TRANSLATE_FUNCS = {"t", "tr"}
+
+
+class KeyUsage:
+    """Ключи перевода, найденные в исходниках"""
+
+    def __init__(self):
+        self.direct = {}     # ключ -> [(файл, строка, умолчание или None)]
+        self.literals = {}   # строка, похожая на ключ -> [(файл, строка)]
+        self.patterns = {}   # шаблон f-строки -> [(файл, строка)]
+        self.dynamic_calls = 0  # t(переменная) - ключ известен только во время игры
+
+    def pattern_regexes(self):
+        return [re.compile(pattern) for pattern in self.patterns]
+
+
+def _call_name(node: ast.Call):
+    func = node.func
+    if isinstance(func, ast.Attribute):
+        return func.attr
+    if isinstance(func, ast.Name):
+        return func.id
+    return None
+
+
+def _joined_pattern(node: ast.JoinedStr):
+    """f"email.templates.{name}.sender" -> регулярное выражение для ключей"""
+    parts = []
+    literal = ""
+    for value in node.values:
+        if isinstance(value, ast.Constant) and isinstance(value.value, str):
+            literal += value.value
+            parts.append(re.escape(value.value))
+        else:
+            parts.append(r"[A-Za-z0-9_]+")
+    if not re.match(r"^[a-z][a-z0-9_]*\.", literal):
+        return None
+    return "^" + "".join(parts) + "$"
+
+
+def scan_file(path: str, usage: KeyUsage, root: str):
+    with open(path, "r", encoding="utf-8-sig") as f:
+        source = f.read()
+    try:
+        tree = ast.parse(source, filename=path)
+    except SyntaxError as e:
+        print(f"⚠️ Не удалось разобрать {path}: {e}")
+        return
+    rel_path = os.path.relpath(path, root)
+
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Call) and _call_name(node) in TRANSLATE_FUNCS and node.args:
+            first = node.args[0]
+            if isinstance(first, ast.Constant) and isinstance(first.value, str):
+                default = None
+                if len(node.args) > 1:
+                    default = node.args[1]
+                for keyword in node.keywords:
+                    if keyword.arg == "default":
+                        default = keyword.value
+                if not (isinstance(default, ast.Constant) and isinstance(default.value, str)):
+                    default = None
+                else:
+                    default = default.value
+                usage.direct.setdefault(first.value, []).append((rel_path, node.lineno, default))
+            elif not isinstance(first, ast.JoinedStr):
+                usage.dynamic_calls += 1
+        elif isinstance(node, ast.JoinedStr):
+            pattern = _joined_pattern(node)
+            if pattern:
+                usage.patterns.setdefault(pattern, []).append((rel_path, node.lineno))
+        elif isinstance(node, ast.Constant) and isinstance(node.value, str) and KEY_RE.match(node.value):
+            usage.literals.setdefault(node.value, []).append((rel_path, node.lineno))
+
+
+def scan_sources(root: str) -> KeyUsage:
+    """Просмотреть все *.py игры"""
+    usage = KeyUsage()
+    for directory, dirs, files in os.walk(root):
+        dirs[:] = sorted(d for d in dirs if d not in SKIP_DIRS and not d.startswith("."))
+        for name in sorted(files):
+            if name.endswith(".py"):
+                scan_file(os.path.join(directory, name), usage, root)
+    # Сам вызов t("ключ") тоже строка-ключ; в literals оставляем только косвенные
+    for key in usage.direct:
+        usage.literals.pop(key, None)
+    return usage
+
+
+def placeholders(value):
+    """Имена подстановок строки (None - строка с ошибкой в {})"""
+    if not isinstance(value, str):
+        return frozenset()
+    compiled = compile_formats({"": value}).get("")
+    return compiled[1] if compiled else frozenset()
+
+
+def load_languages(translations_dir: str):
+    """Язык -> (путь, дерево)"""
+    languages = {}
+    for name in sorted(os.listdir(translations_dir)):
+        if name.endswith(".json"):
+            path = os.path.join(translations_dir, name)
+            with open(path, "r", encoding="utf-8") as f:
+                languages[name[:-5]] = (path, json.load(f))
+    return languages
+
+
+def _leaves(flat: dict):
+    return {key for key, value in flat.items() if not isinstance(value, dict)}
+
+
+def check_language(flat: dict, reference_flat: dict) -> dict:
+    """Расхождения языка с эталоном"""
+    ref_leaves = _leaves(reference_flat)
+    leaves = _leaves(flat)
+    result = {
+        "missing": sorted(ref_leaves - leaves - flat.keys()),
+        "extra": sorted(leaves - ref_leaves - reference_flat.keys()),
+        "type_mismatch": [],
+        "placeholder_mismatch": [],
+    }
+    for key in sorted(flat.keys() & reference_flat.keys()):
+        value, ref_value = flat[key], reference_flat[key]
+        if isinstance(value, dict) != isinstance(ref_value, dict):
+            result["type_mismatch"].append(key)
+        elif isinstance(value, str) and isinstance(ref_value, str):
+            fields, ref_fields = placeholders(value), placeholders(ref_value)
+            if fields != ref_fields:
+                result["placeholder_mismatch"].append({
+                    "key": key,
+                    "expected": sorted(ref_fields or ()),
+                    "found": sorted(fields) if fields is not None else "ошибка в {}",
+                })
+    return result
+
+
+def check_code(reference_flat: dict, usage: KeyUsage) -> dict:
+    """Ключи из кода, которых нет в эталоне, и умолчания с другими подстановками"""
+    missing = {}
+    defaults = []
+    for key, places in sorted(usage.direct.items()):
+        if key not in reference_flat:
+            missing[key] = [f"{path}:{line}" for path, line, _ in places]
+            continue
+        ref_fields = placeholders(reference_flat[key])
+        for path, line, default in places:
+            if default is not None and placeholders(default) != ref_fields:
+                defaults.append({"key": key, "place": f"{path}:{line}",
+                                 "expected": sorted(ref_fields or ()),
+                                 "found": sorted(placeholders(default) or ())})
+
+    regexes = usage.pattern_regexes()
+    used = set(usage.direct) | set(usage.literals)
+    unused = sorted(
+        key for key in _leaves(reference_flat)
+        if key not in used and not any(regex.match(key) for regex in regexes)
+    )
+    return {"missing_in_reference": missing, "default_placeholder_mismatch": defaults,
+            "leaf_section_conflict": leaf_conflicts(reference_flat, usage), "unused": unused}
+
+
+def leaf_conflicts(reference_flat: dict, usage: KeyUsage) -> dict:
+    """
+    Ключи, которые код читает как строку, но которые заняты разделом:
+    в эталоне под ключом раздел или в коде есть ключи глубже (t("a.b") и t("a.b.c")).
+    """
+    sections = {key.rsplit(".", 1)[0] for key in usage.direct if "." in key}
+    prefixes = set()
+    for section in sections:
+        parts = section.split(".")
+        prefixes.update(".".join(parts[:i]) for i in range(1, len(parts) + 1))
+    return {
+        key: [f"{path}:{line}" for path, line, _ in places]
+        for key, places in sorted(usage.direct.items())
+        if key in prefixes or isinstance(reference_flat.get(key), dict)
+    }
+
+
+def code_defaults(reference_flat: dict, usage: KeyUsage) -> dict:
+    """
+    Ключи из кода, которых нет в эталоне -> умолчание из кода.
+
+    Берутся только умолчания без подстановок, одинаковые во всех вызовах:
+    t() вернёт ту же строку, но найдёт её в таблице, а не в запасном пути.
+    """
+    defaults = {}
+    for key, places in usage.direct.items():
+        if key in reference_flat:
+            continue
+        values = {default for _, _, default in places}
+        if len(values) == 1:
+            value = values.pop()
+            if value is not None and "{" not in value:
+                defaults[key] = value
+    return defaults
+
+
+def add_defaults(tree: dict, defaults: dict, leaves=frozenset()) -> dict:
+    """
+    Вписать умолчания из кода в дерево.
+
+    Ключи, которые конфликтуют с разделами, пропускаются; раздел не
+    создаётся и там, где код читает строку (leaves - ключи прямых вызовов t()),
+    иначе t() вернул бы вместо неё словарь.
+    """
+    for key, value in sorted(defaults.items()):
+        *sections, leaf = key.split(".")
+        node = tree
+        path = ""
+        for section in sections:
+            path = f"{path}.{section}" if path else section
+            child = node.get(section)
+            if child is None:
+                if path in leaves:
+                    break
+                child = node[section] = {}
+            elif not isinstance(child, dict):
+                break
+            node = child
+        else:
+            node.setdefault(leaf, value)
+    return tree
+
+
+def merge_tree(reference, tree):
+    """Дерево языка, дополненное недостающими ключами эталона"""
+    merged = dict(reference)
+    for key, value in tree.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = merge_tree(merged[key], value)
+        else:
+            merged[key] = value
+    return merged
+
+
+def build_bundle(language: str, path: str, tree: dict, reference: str, languages: dict,
+                 defaults: dict, out_dir: str, leaves=frozenset()) -> str:
+    """Записать пакет языка (leaves - ключи, которые код читает как строку)"""
+    sources = {path}
+    ref_path, ref_tree = languages[reference]
+    # merge_tree копирует разделы, поэтому исходное дерево не меняется
+    tree = merge_tree(ref_tree, tree)
+    sources.add(ref_path)
+    add_defaults(tree, defaults, leaves)
+    flat = flatten_translations(tree)
+    sections = sorted(key for key in leaves if isinstance(flat.get(key), dict))
+    if sections:
+        raise ValueError(f"в пакете {language} разделы вместо строк: {', '.join(sections)}")
+    stamps = {os.path.abspath(source): file_stamp(source) for source in sorted(sources)}
+    bundle_path = os.path.join(out_dir, f"{language}{BUNDLE_SUFFIX}")
+    write_compiled(bundle_path, stamps, tree, flat)
+    return bundle_path
+
+
+def _print_list(title: str, items, limit: int):
+    if not items:
+        return
+    print(f"   {title}: {len(items)}")
+    for item in list(items)[:limit]:
+        print(f"      {item}")
+    if len(items) > limit:
+        print(f"      ... ещё {len(items) - limit}")
+
+
+def main(argv=None):
+    root = os.path.dirname(os.path.abspath(__file__))
+    parser = argparse.ArgumentParser(description="Проверка и сборка переводов Office Hacker")
+    parser.add_argument("--translations", default=os.path.join(root, "translations"),
+                        help="каталог с <язык>.json")
+    parser.add_argument("--reference", default="ru", help="эталонный язык")
+    parser.add_argument("--out", help="каталог пакетов (по умолчанию translations/bundles)")
+    parser.add_argument("--check", action="store_true", help="только проверить, пакеты не собирать")
+    parser.add_argument("--strict", action="store_true",
+                        help="код возврата 1, если есть недостающие ключи или ошибки подстановок")
+    parser.add_argument("--report", metavar="FILE", help="записать полный отчёт в JSON")
+    parser.add_argument("--limit", type=int, default=10, help="сколько примеров выводить в списках")
+    args = parser.parse_args(argv)
+
+    languages = load_languages(args.translations)
+    if args.reference not in languages:
+        print(f"❌ Эталонный язык {args.reference} не найден в {args.translations}")
+        return 1
+
+    usage = scan_sources(root)
+    reference_flat = flatten_translations(languages[args.reference][1])
+    code = check_code(reference_flat, usage)
+    print(f"🔍 Код: {sum(len(p) for p in usage.direct.values())} вызовов с {len(usage.direct)} ключами, "
+          f"{len(usage.literals)} ключей в таблицах, {len(usage.patterns)} шаблонов f-строк, "
+          f"{usage.dynamic_calls} вызовов с ключом из переменной")
+    _print_list(f"нет в {args.reference}.json (всегда умолчание из кода)",
+                [f"{key}  ({', '.join(places)})" for key, places in code["missing_in_reference"].items()],
+                args.limit)
+    _print_list("умолчание в коде с другими подстановками",
+                [f"{item['key']} ({item['place']}): {item['found']} вместо {item['expected']}"
+                 for item in code["default_placeholder_mismatch"]], args.limit)
+    _print_list("читаются как строка, но заняты разделом",
+                [f"{key}  ({', '.join(places)})" for key, places in code["leaf_section_conflict"].items()],
+                args.limit)
+    _print_list(f"не используются в коде ({args.reference}.json)", code["unused"], args.limit)
+
+    report = {"reference": args.reference, "code": code, "languages": {}}
+    errors = (len(code["missing_in_reference"]) + len(code["default_placeholder_mismatch"])
+              + len(code["leaf_section_conflict"]))
+    for language, (path, tree) in languages.items():
+        result = check_language(flatten_translations(tree), reference_flat)
+        report["languages"][language] = result
+        problems = (len(result["missing"]) + len(result["type_mismatch"])
+                    + len(result["placeholder_mismatch"]))
+        errors += problems
+        mark = "✅" if not problems else "⚠️"
+        print(f"{mark} {language}: недостаёт {len(result['missing'])}, лишних {len(result['extra'])}, "
+              f"тип {len(result['type_mismatch'])}, подстановки {len(result['placeholder_mismatch'])}")
+        _print_list("недостаёт", result["missing"], args.limit)
+        _print_list("лишние", result["extra"], args.limit)
+        _print_list("строка вместо раздела (или наоборот)", result["type_mismatch"], args.limit)
+        _print_list("подстановки", [f"{item['key']}: {item['found']} вместо {item['expected']}"
+                                    for item in result["placeholder_mismatch"]], args.limit)
+
+    if args.report:
+        with open(args.report, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"📝 Отчёт: {args.report}")
+
+    if not args.check:
+        out_dir = args.out or os.path.join(args.translations, BUNDLE_DIR)
+        defaults = code_defaults(reference_flat, usage)
+        print(f"📦 Умолчаний из кода в пакетах: {len(defaults)}")
+        leaves = frozenset(usage.direct)
+        for language, (path, tree) in languages.items():
+            try:
+                bundle_path = build_bundle(language, path, tree, args.reference, languages, defaults,
+                                           out_dir, leaves)
+            except ValueError as e:
+                print(f"❌ {e}")
+                return 1
+            print(f"📦 {language}: {bundle_path} ({os.path.getsize(bundle_path)} байт)")
+
+    return 1 if args.strict and errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,75 @@
+# convert_saves.py
+"""
+Конвертер слотов сохранений между форматами.
+
+    python convert_saves.py binary              - все слоты в двоичный формат
+    python convert_saves.py json --slot 0       - слот 0 обратно в JSON
+    python convert_saves.py --export exported   - выгрузить слоты в читаемый JSON
+
+Снимок и журнал слота сливаются и записываются новым снимком в выбранном
+формате (старый файл уходит в backups/ как при обычном сохранении).
+"""
+
+import argparse
+import os
+import sys
+
+from core.save_journal import get_save_journal, list_slots
+from core.serializers import SERIALIZERS, JsonSerializer, get_serializer
+
+
+def convert_slot(slot: int, saves_dir: str, format_name: str):
+    """Переписать слот в заданном формате"""
+    journal = get_save_journal(slot, saves_dir)
+    data = journal.read()
+    old_path = journal.base_path
+    old_size = os.path.getsize(old_path)
+
+    journal.rewrite(data, get_serializer(format_name))
+
+    new_path = journal.base_path
+    print(f"Слот {slot}: {old_path} ({old_size} байт) -> {new_path} ({os.path.getsize(new_path)} байт)")
+
+
+def export_slot(slot: int, saves_dir: str, export_dir: str):
+    """Выгрузить слот в читаемый JSON (снимок вместе с журналом)"""
+    data = get_save_journal(slot, saves_dir).read()
+    os.makedirs(export_dir, exist_ok=True)
+    path = os.path.join(export_dir, f"slot_{slot}.json")
+    with open(path, "wb") as f:
+        f.write(JsonSerializer(pretty=True).dumps(data))
+    print(f"Слот {slot} выгружен в {path}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Конвертер сохранений Office Hacker")
+    parser.add_argument("format", nargs="?", choices=sorted(SERIALIZERS),
+                        help="формат, в который переписать слоты")
+    parser.add_argument("--slot", type=int, action="append", help="номер слота (по умолчанию все)")
+    parser.add_argument("--saves", default="saves", help="каталог сохранений")
+    parser.add_argument("--export", metavar="DIR", help="выгрузить слоты в читаемый JSON в каталог DIR")
+    args = parser.parse_args(argv)
+
+    if not args.format and not args.export:
+        parser.error("укажите формат или --export")
+
+    slots = args.slot or list_slots(args.saves)
+    if not slots:
+        print("Сохранения не найдены")
+        return 1
+
+    errors = 0
+    for slot in slots:
+        try:
+            if args.export:
+                export_slot(slot, args.saves, args.export)
+            if args.format:
+                convert_slot(slot, args.saves, args.format)
+        except Exception as e:
+            errors += 1
+            print(f"Слот {slot}: ошибка - {e}")
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,244 @@
+# core/email_archive.py
+"""
+Архив писем слота (холодное хранилище).
+
+Старые прочитанные и удалённые по правилам хранения письма уходят из
+EmailSystem в архив, поэтому сохранение и загрузка затрагивают только
+свежую почту. Архив - два файла, в которые только дописывают:
+    saves/slot_N.archive      - записи JSON по одной на строку
+                                {"folder", "archived_day", "email"};
+    saves/slot_N.archive.idx  - для каждой записи смещение и длина
+                                (RECORD_SIZE байт), по нему страница
+                                читается одним seek без разбора всего архива.
+
+Записи нумеруются по порядку добавления. Новые записи сначала лежат в
+памяти и попадают на диск вместе с сохранением, которое фиксирует их
+удаление из почты (ArchiveCommit, выполняется в SaveJob).
+
+У каждого слота свой поток сохранения, поэтому сохранения в разные слоты
+могут завершиться в любом порядке. ArchiveCommit запоминает сами записи
+(а не их число), а архив помнит, какие записи этой сессии уже лежат в
+каком файле: каждый файл получает ровно записи своего сохранения, а из
+памяти уходят только записи, дописанные в текущий файл архива.
+"""
+
+import json
+import os
+import struct
+import threading
+from typing import Dict, List, Optional, Tuple
+
+from core.save_writer import save_writer
+
+
+# Запись индекса: смещение и длина строки архива
+_RECORD = struct.Struct("<QI")
+RECORD_SIZE = _RECORD.size
+
+
+# Размер блока при копировании архива в другой слот
+COPY_CHUNK = 1 << 20
+
+
+def index_path_for(path: str) -> str:
+    return f"{path}.idx"
+
+
+def _copy_prefix(src: str, dst: str, size: int):
+    """Заменить dst первыми size байтами src"""
+    with open(src, "rb") as f_src, open(dst + ".tmp", "wb") as f_dst:
+        while size > 0:
+            chunk = f_src.read(min(size, COPY_CHUNK))
+            if not chunk:
+                break
+            f_dst.write(chunk)
+            size -= len(chunk)
+    os.replace(dst + ".tmp", dst)
+
+
+class EmailArchive:
+    """Архив писем одного слота: записи на диске + ещё не сохранённые"""
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path  # None - архив ещё не привязан к слоту
+        self._pending: List[Tuple[int, dict]] = []  # (номер, запись), ещё не записанные в path
+        self._disk_count: Optional[int] = None  # Записей на диске (после проверки индекса)
+        self._next_seq = 0  # Номер следующей записи сессии
+        self._written: Dict[str, List[int]] = {}  # Файл архива -> номера дописанных записей сессии
+        self._lock = threading.RLock()
+
+    def add(self, folder: str, email, archived_day: int):
+        """Добавить письмо в архив (на диск попадёт при сохранении)"""
+        with self._lock:
+            self._pending.append((self._next_seq, {"folder": folder, "archived_day": archived_day,
+                                                   "email": email.to_dict()}))
+            self._next_seq += 1
+
+    def pending_count(self) -> int:
+        with self._lock:
+            return len(self._pending)
+
+    def count(self) -> int:
+        """Сколько писем в архиве"""
+        with self._lock:
+            return self._get_disk_count() + len(self._pending)
+
+    def read_range(self, start: int, stop: int) -> List[dict]:
+        """Записи архива с номерами [start, stop)"""
+        with self._lock:
+            disk_count = self._get_disk_count()
+            start = max(0, start)
+            records = []
+            if start < min(stop, disk_count):
+                records.extend(self._read_disk(start, min(stop, disk_count)))
+            if stop > disk_count:
+                records.extend(record for _, record in
+                               self._pending[max(start, disk_count) - disk_count:stop - disk_count])
+            return records
+
+    def iter_newest(self, position: int, page_size: int = 256):
+        """Записи от номера position - 1 к самым старым: (номер, запись)"""
+        while position > 0:
+            start = max(0, position - page_size)
+            records = self.read_range(start, position)
+            for offset in range(len(records) - 1, -1, -1):
+                yield start + offset, records[offset]
+            position = start
+
+    def _get_disk_count(self) -> int:
+        if self._disk_count is None:
+            self._disk_count = self._check_index(self.path)
+        return self._disk_count
+
+    @staticmethod
+    def _check_index(path: Optional[str]) -> int:
+        """Число записей в файле архива; индекс перестраивается, если он не совпадает с архивом"""
+        if not path or not os.path.exists(path):
+            return 0
+        data_size = os.path.getsize(path)
+        index_path = index_path_for(path)
+        index_size = os.path.getsize(index_path) if os.path.exists(index_path) else 0
+
+        count = index_size // RECORD_SIZE
+        if count and index_size % RECORD_SIZE == 0:
+            with open(index_path, "rb") as f:
+                f.seek((count - 1) * RECORD_SIZE)
+                offset, length = _RECORD.unpack(f.read(RECORD_SIZE))
+            if offset + length == data_size:
+                return count
+        elif not data_size:
+            return 0
+
+        # Индекса нет или он отстал от архива (сбой при записи) - строим заново
+        print(f"[АРХИВ] Перестройка индекса архива {path}")
+        entries = bytearray()
+        offset = 0
+        count = 0
+        with open(path, "rb") as f:
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break  # Недописанная строка в конце
+                entries += _RECORD.pack(offset, len(line))
+                offset += len(line)
+                count += 1
+        save_writer.write_atomic(index_path, bytes(entries))
+        if offset != data_size:
+            # Обрезаем недописанный хвост, чтобы новые записи начинались с новой строки
+            with open(path, "r+b") as f:
+                f.truncate(offset)
+        return count
+
+    def _read_disk(self, start: int, stop: int) -> List[dict]:
+        with open(index_path_for(self.path), "rb") as f:
+            f.seek(start * RECORD_SIZE)
+            entries = list(_RECORD.iter_unpack(f.read((stop - start) * RECORD_SIZE)))
+        if not entries:
+            return []
+        first_offset = entries[0][0]
+        last_offset, last_length = entries[-1]
+        with open(self.path, "rb") as f:
+            f.seek(first_offset)
+            data = f.read(last_offset + last_length - first_offset)
+
+        records = []
+        for offset, length in entries:
+            line = data[offset - first_offset:offset - first_offset + length]
+            try:
+                records.append(json.loads(line))
+            except ValueError:
+                print(f"[АРХИВ] Повреждённая запись архива {self.path} (смещение {offset})")
+                records.append(None)
+        return records
+
+    def prepare_commit(self, target_path: str) -> 'ArchiveCommit':
+        """Подготовить запись архива вместе с сохранением в слот target_path"""
+        with self._lock:
+            return ArchiveCommit(self, self.path, target_path, list(self._pending), self._next_seq)
+
+    def _commit(self, source_path: Optional[str], target_path: str,
+                records: List[Tuple[int, dict]], seq_limit: int):
+        with self._lock:
+            index_path = index_path_for(target_path)
+            if source_path != target_path:
+                # Игра сохраняется в другой слот (или новая игра поверх старого
+                # слота): архив слота заменяется архивом этой игры на момент
+                # подготовки сохранения - без записей, добавленных позже
+                self._copy_archive(source_path, target_path, seq_limit)
+
+            written = self._written.setdefault(target_path, [])
+            present = set(written)
+            records = [(seq, record) for seq, record in records if seq not in present]
+            if records:
+                offset = os.path.getsize(target_path) if os.path.exists(target_path) else 0
+                lines = [(json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")
+                         for _, record in records]
+                entries = bytearray()
+                for line in lines:
+                    entries += _RECORD.pack(offset, len(line))
+                    offset += len(line)
+                # Сначала данные, потом индекс: недописанный индекс восстанавливается по данным
+                save_writer.append(target_path, b"".join(lines))
+                save_writer.append(index_path, bytes(entries))
+                written.extend(seq for seq, _ in records)
+
+            if target_path == self.path or source_path == self.path:
+                # Архив игры теперь в target_path; в памяти остаётся то, чего там ещё нет
+                self.path = target_path
+                self._disk_count = None
+                present = set(written)
+                self._pending = [(seq, record) for seq, record in self._pending if seq not in present]
+
+    def _copy_archive(self, source_path: Optional[str], target_path: str, seq_limit: int):
+        """Скопировать архив source_path в target_path без записей сессии с номером >= seq_limit"""
+        index_path = index_path_for(target_path)
+        source_written = self._written.get(source_path, [])
+        kept = [seq for seq in source_written if seq < seq_limit]
+        # Индекс источника проверяется (и при нужде чинится) до копирования
+        count = self._check_index(source_path) - (len(source_written) - len(kept))
+        if count > 0:
+            source_index = index_path_for(source_path)
+            with open(source_index, "rb") as f:
+                f.seek((count - 1) * RECORD_SIZE)
+                offset, length = _RECORD.unpack(f.read(RECORD_SIZE))
+            for src, dst, size in ((source_path, target_path, offset + length),
+                                   (source_index, index_path, count * RECORD_SIZE)):
+                _copy_prefix(src, dst, size)
+        else:
+            save_writer.remove(target_path)
+            save_writer.remove(index_path)
+        self._written[target_path] = kept
+
+
+class ArchiveCommit:
+    """Запись новых записей архива на диск (выполняется вместе с SaveJob)"""
+
+    def __init__(self, archive: EmailArchive, source_path: Optional[str], target_path: str,
+                 records: List[Tuple[int, dict]], seq_limit: int):
+        self.archive = archive
+        self.source_path = source_path
+        self.target_path = target_path
+        self.records = records  # Записи, убранные из почты к моменту сохранения
+        self.seq_limit = seq_limit  # Записи с этим номером и дальше добавлены после
+
+    def run(self):
+        self.archive._commit(self.source_path, self.target_path, self.records, self.seq_limit)
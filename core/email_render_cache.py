@@ -0,0 +1,83 @@
+# core/email_render_cache.py
+"""
+Кэш отрисованных писем.
+
+Текст письма зависит только от шаблона, параметров (не меняются после
+создания письма) и языка, поэтому готовый текст и HTML хранятся в
+LRU-кэше: id письма -> {(язык, вид): текст}. При смене языка все кэши
+очищаются через один общий обработчик translation.on_language_changed.
+"""
+
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Callable
+
+from simple_translation import translation
+
+
+class EmailRenderCache:
+    """LRU-кэш отрисованного текста и HTML писем"""
+
+    def __init__(self, max_size: int = 512):
+        self.max_size = max_size  # Сколько писем держать в кэше
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[int, dict]" = OrderedDict()
+        self._lock = threading.Lock()
+        _register(self)
+
+    def get_or_render(self, email_id: int, kind: str, render: Callable[[], str]) -> str:
+        """Готовый текст письма или результат render() (который запоминается)"""
+        key = (translation.language, kind)
+        with self._lock:
+            rendered = self._entries.get(email_id)
+            if rendered is not None and key in rendered:
+                self._entries.move_to_end(email_id)
+                self.hits += 1
+                return rendered[key]
+            self.misses += 1
+
+        value = render()
+        with self._lock:
+            rendered = self._entries.get(email_id)
+            if rendered is None:
+                rendered = self._entries[email_id] = {}
+                if len(self._entries) > self.max_size:
+                    self._entries.popitem(last=False)
+            else:
+                self._entries.move_to_end(email_id)
+            rendered[key] = value
+        return value
+
+    def discard(self, email_id: int):
+        """Забыть письмо (удалено или заменено)"""
+        with self._lock:
+            self._entries.pop(email_id, None)
+
+    def clear(self):
+        """Очистить кэш"""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        """Счётчики попаданий и промахов"""
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._entries)}
+
+
+# Живые кэши; обработчик смены языка регистрируется один раз на всех
+_caches = weakref.WeakSet()
+_callback_registered = False
+
+
+def _clear_all_caches():
+    for cache in list(_caches):
+        cache.clear()
+
+
+def _register(cache: EmailRenderCache):
+    global _callback_registered
+    _caches.add(cache)
+    if not _callback_registered:
+        translation.on_language_changed(_clear_all_caches)
+        _callback_registered = True
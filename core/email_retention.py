@@ -0,0 +1,66 @@
+# core/email_retention.py
+"""
+Правила хранения писем.
+
+EmailSystem проверяет правила при каждом новом письме и при смене дня,
+поэтому почтовый ящик (и размер сохранения) не растёт в длинной игре:
+    max_count     - сколько писем держать во входящих;
+    max_age_days  - сколько игровых дней хранить письма (входящие и отправленные);
+    spam_first    - при переполнении сначала удалять спам;
+    archive       - удалённые письма дописываются в архив слота
+                    (saves/slot_N.archive, см. core.email_archive)
+                    при следующем сохранении;
+    hot_days      - прочитанные письма старше стольких дней переносятся
+                    в архив (только при включённом archive).
+
+Важные письма не удаляются и не переносятся в архив никогда.
+"""
+
+from typing import Optional
+
+
+class RetentionPolicy:
+    """Правила хранения писем"""
+
+    def __init__(self, max_count: Optional[int] = None, max_age_days: Optional[int] = None,
+                 spam_first: bool = True, archive: bool = True, hot_days: Optional[int] = None):
+        self.max_count = max_count
+        self.max_age_days = max_age_days
+        self.spam_first = spam_first
+        self.archive = archive
+        self.hot_days = hot_days
+
+    def __repr__(self):
+        return (f"RetentionPolicy(max_count={self.max_count!r}, max_age_days={self.max_age_days!r}, "
+                f"spam_first={self.spam_first!r}, archive={self.archive!r}, hot_days={self.hot_days!r})")
+
+    @classmethod
+    def from_config(cls, email_config: dict) -> 'RetentionPolicy':
+        """Правила из раздела email конфигурации"""
+        max_count = email_config.get("max_emails")
+        max_age_days = None
+        if email_config.get("auto_delete_old", False):
+            max_age_days = email_config.get("max_email_age_days", 7)
+        hot_days = email_config.get("archive_read_after_days", 3)
+        return cls(
+            max_count=max_count if max_count and max_count > 0 else None,
+            max_age_days=max_age_days,
+            spam_first=email_config.get("spam_first_eviction", True),
+            archive=email_config.get("archive_evicted", True),
+            hot_days=hot_days if hot_days is not None and hot_days >= 0 else None
+        )
+
+
+# Правила по умолчанию: без ограничений, пока не применена конфигурация
+_default_policy = RetentionPolicy()
+
+
+def get_default_policy() -> RetentionPolicy:
+    """Правила хранения для систем почты без своих правил"""
+    return _default_policy
+
+
+def set_default_policy(policy: RetentionPolicy):
+    """Задать правила хранения по умолчанию"""
+    global _default_policy
+    _default_policy = policy
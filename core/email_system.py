@@ -1,28 +1,95 @@
 # core/email_system.py
 
+import itertools
 import json
-from dataclasses import dataclass, asdict
-from typing import List, Optional, Dict, Any
+import sys
+from typing import Callable, List, Optional, Dict, Any
 import random
 from datetime import datetime
+from core.email_archive import EmailArchive
+from core.email_render_cache import EmailRenderCache
+from core.email_retention import RetentionPolicy, get_default_policy
 from core.email_templates import get_story_email_for_day, get_story_difficulty, get_story_deadline
 from simple_translation import translation
 import re
 
 
-@dataclass
+# Общие словари параметров писем: одинаковые наборы параметров
+# (имя, день, репутация, баланс) хранятся в одном экземпляре
+_SHARED_PARAMETERS: Dict[tuple, Dict[str, Any]] = {}
+_SHARED_PARAMETERS_LIMIT = 4096
+
+# Ключ отправителя -> письмо от МВД (отправителей немного, проверка одна на ключ)
+_MVD_SENDERS: Dict[str, bool] = {}
+
+
+def _intern(value):
+    """Строки ключей и параметров храним в одном экземпляре"""
+    return sys.intern(value) if type(value) is str else value
+
+
+def _share_parameters(parameters: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Общий экземпляр словаря параметров.
+    
+    Параметры письма после создания не изменяются, поэтому письма с
+    одинаковыми параметрами могут ссылаться на один словарь.
+    """
+    if not parameters:
+        return _SHARED_PARAMETERS.setdefault((), {})
+    try:
+        # Типы входят в ключ: 1, 1.0 и True равны, но форматируются по-разному
+        key = (tuple(parameters.items()), tuple(map(type, parameters.values())))
+        shared = _SHARED_PARAMETERS.get(key)
+    except TypeError:
+        # Нехэшируемые значения - оставляем собственный словарь
+        return parameters
+    if shared is not None:
+        return shared
+    
+    shared = {_intern(name): _intern(value) for name, value in parameters.items()}
+    if len(_SHARED_PARAMETERS) < _SHARED_PARAMETERS_LIMIT:
+        _SHARED_PARAMETERS[key] = shared
+    return shared
+
+
 class Email:
-    """Класс для представления электронного письма"""
-    id: int
-    sender_key: str  # Ключ отправителя
-    subject_key: str  # Ключ темы
-    template_key: str  # Ключ шаблона
-    parameters: Dict[str, Any]  # Параметры для форматирования
-    date: str
-    read: bool = False
-    important: bool = False
-    is_spam: bool = False  # Флаг спам-письма
-    spam_type: Optional[str] = None  # Тип спама (если спам)
+    """
+    Класс для представления электронного письма.
+    
+    Компактная запись со __slots__: без __dict__ у каждого письма, ключи
+    перевода интернированы, одинаковые словари параметров общие.
+    """
+    
+    __slots__ = ("id", "sender_key", "subject_key", "template_key", "parameters",
+                 "date", "read", "important", "is_spam", "spam_type", "day")
+    
+    def __init__(self, id: int, sender_key: str, subject_key: str, template_key: str,
+                 parameters: Dict[str, Any], date: str, read: bool = False,
+                 important: bool = False, is_spam: bool = False, spam_type: Optional[str] = None,
+                 day: Optional[int] = None):
+        self.id = id
+        self.sender_key = _intern(sender_key)  # Ключ отправителя
+        self.subject_key = _intern(subject_key)  # Ключ темы
+        self.template_key = _intern(template_key)  # Ключ шаблона
+        self.parameters = _share_parameters(parameters)  # Параметры для форматирования (не изменяются)
+        self.date = _intern(date)
+        self.read = read
+        self.important = important
+        self.is_spam = is_spam  # Флаг спам-письма
+        self.spam_type = _intern(spam_type)  # Тип спама (если спам)
+        self.day = day  # Игровой день получения (для правил хранения)
+    
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+    
+    __hash__ = None
+    
+    def __repr__(self):
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"Email({fields})"
     
     def get_sender(self) -> str:
         """Получить отправителя с учетом перевода"""
@@ -48,9 +115,10 @@ class Email:
             print(f"Ошибка при форматировании письма {self.id}: {e}")
             return content_template
     
-    def get_html_content(self) -> str:
+    def get_html_content(self, content: str = None) -> str:
         """Получить содержимое письма в HTML формате с поддержкой ссылок"""
-        content = self.get_content()
+        if content is None:
+            content = self.get_content()
         
         # Проверяем, есть ли в контенте HTML теги
         if '<' in content and '>' in content:
@@ -75,8 +143,12 @@ class Email:
     
     def is_mvd_email(self) -> bool:
         """Проверить, является ли письмо от МВД"""
-        mvd_keywords = ["мвд", "mvd", "министерство", "министерства"]
-        return any(keyword in self.sender_key.lower() for keyword in mvd_keywords)
+        is_mvd = _MVD_SENDERS.get(self.sender_key)
+        if is_mvd is None:
+            mvd_keywords = ["мвд", "mvd", "министерство", "министерства"]
+            is_mvd = any(keyword in self.sender_key.lower() for keyword in mvd_keywords)
+            _MVD_SENDERS[self.sender_key] = is_mvd
+        return is_mvd
     
     def to_dict(self) -> dict:
         """Преобразовать письмо в словарь"""
@@ -85,33 +157,50 @@ class Email:
             "sender_key": self.sender_key,
             "subject_key": self.subject_key,
             "template_key": self.template_key,
-            "parameters": self.parameters,
+            "parameters": dict(self.parameters),
             "date": self.date,
             "read": self.read,
             "important": self.important,
             "is_spam": self.is_spam,
-            "spam_type": self.spam_type
+            "spam_type": self.spam_type,
+            "day": self.day
         }
     
     @classmethod
     def from_dict(cls, data: dict) -> 'Email':
         """Создать письмо из словаря"""
+        get = data.get
         return cls(
-            id=data.get("id", 0),
-            sender_key=data.get("sender_key", ""),
-            subject_key=data.get("subject_key", ""),
-            template_key=data.get("template_key", ""),
-            parameters=data.get("parameters", {}),
-            date=data.get("date", ""),
-            read=data.get("read", False),
-            important=data.get("important", False),
-            is_spam=data.get("is_spam", False),
-            spam_type=data.get("spam_type", None)
+            get("id", 0),
+            get("sender_key", ""),
+            get("subject_key", ""),
+            get("template_key", ""),
+            get("parameters") or {},
+            get("date", ""),
+            get("read", False),
+            get("important", False),
+            get("is_spam", False),
+            get("spam_type"),
+            get("day")
         )
 
 
 class EmailSystem:
-    """Система управления почтой"""
+    """
+    Система управления почтой.
+    
+    Письма хранятся в индексированном хранилище: id -> письмо, по папке
+    упорядоченный словарь id -> письмо (порядок поступления) и счётчики
+    (непрочитанные, важные, письма МВД во входящих, спам по типам), которые
+    поддерживаются при каждом изменении. Поэтому запросы интерфейса
+    (поиск по id, счётчики, письма МВД) не перебирают все письма.
+    """
+    
+    FOLDERS = ("inbox", "sent", "draft")
+    
+    # Поля системы (кроме самих писем), которые попадают в сохранение
+    STATE_FIELDS = ("next_email_id", "unread_emails", "emails_received_today", "mvd_email_read",
+                    "player_name", "day", "reputation", "money")
     
     def __init__(self, player_name: str = "", day: int = 1, reputation: int = 0, money: float = 0.0):
         self.player_name = player_name
@@ -119,15 +208,41 @@ class EmailSystem:
         self.reputation = reputation
         self.money = money
         
-        self.inbox: List[Email] = []
-        self.sent: List[Email] = []
-        self.draft: List[Email] = []
+        # Хранилище писем
+        self._emails: Dict[int, Email] = {}
+        self._folders: Dict[str, Dict[int, Email]] = {folder: {} for folder in self.FOLDERS}
+        self._email_folders: Dict[int, str] = {}  # id -> папка
+        
+        # Счётчики и вторичные индексы
+        self._mvd_ids = set()  # Письма от МВД (определяется один раз при добавлении)
+        self._mvd_inbox: Dict[int, Email] = {}  # Письма МВД во входящих (по порядку)
+        self._mvd_unread = 0  # Непрочитанные письма МВД во входящих
+        self._important_count = 0
+        self._spam_counts: Dict[str, int] = {}
+        self._spam_inbox: Dict[int, Email] = {}  # Спам во входящих (по порядку)
+        
+        # Правила хранения (None - правила по умолчанию из конфигурации)
+        self.retention: Optional[RetentionPolicy] = None
+        self.archive = EmailArchive()  # Холодное хранилище (привязывается к слоту при загрузке)
         
         self.next_email_id = 1
         self.unread_emails = 0
         self.emails_received_today = False
         self.mvd_email_read = False  # Флаг прочтения письма от МВД
         
+        # Готовый текст и HTML писем (сбрасывается при смене языка)
+        self._render_cache = EmailRenderCache()
+        self._search_index = None  # Поисковый индекс (создаётся при первом поиске)
+        
+        # Подписчики на изменения писем: callback(событие, письмо)
+        # события: "added", "updated", "removed", "reset" (письмо - None)
+        self._listeners: List[Callable[[str, Optional[Email]], None]] = []
+        
+        # Отслеживание изменений для журнала сохранений
+        self._changed_emails: Dict[int, Email] = {}
+        self._deleted_email_ids = set()
+        self._saved_state: Dict[str, Any] = {}
+        
         # НЕ ИСПОЛЬЗУЕМ СТАРУЮ СИСТЕМУ СПЕЦИАЛЬНЫХ ПИСЕМ
         # Теперь сюжетные письма будут генерироваться через email_templates
     
@@ -157,22 +272,18 @@ class EmailSystem:
             read=False,
             important=important,
             is_spam=is_spam,
-            spam_type=spam_type
+            spam_type=spam_type,
+            day=self.day
         )
         
-        self.inbox.append(email)
+        self._insert_email(email, "inbox")
         self.next_email_id += 1
-        
-        if not email.read:
-            self.unread_emails += 1
-        
-        # Проверяем, является ли это письмо от МВД
-        if email.is_mvd_email():
-            # Если это первое письмо от МВД, ставим флаг, что оно еще не прочитано
-            # (потому что только что добавлено и read=False)
-            pass
+        self._changed_emails[email.id] = email
         
         print(f"[EMAIL] Добавлено письмо: {email.get_subject()} от {email.get_sender()}")
+        
+        # Ящик не растёт: лишние письма удаляются сразу, а не раз в день
+        self.enforce_retention()
         return email.id
     
     def add_template_email(self, template_name: str, **kwargs) -> int:
@@ -229,34 +340,165 @@ class EmailSystem:
             date=date
         )
     
+    @property
+    def inbox(self) -> List[Email]:
+        return list(self._folders["inbox"].values())
+    
+    @property
+    def sent(self) -> List[Email]:
+        return list(self._folders["sent"].values())
+    
+    @property
+    def draft(self) -> List[Email]:
+        return list(self._folders["draft"].values())
+    
+    def add_listener(self, callback: Callable[[str, Optional[Email]], None]):
+        """Подписаться на добавление, изменение и удаление писем"""
+        if callback not in self._listeners:
+            self._listeners.append(callback)
+    
+    def remove_listener(self, callback: Callable[[str, Optional[Email]], None]):
+        """Отписаться от изменений писем"""
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+    
+    def _notify(self, event: str, email: Optional[Email] = None):
+        for callback in list(self._listeners):
+            try:
+                callback(event, email)
+            except Exception as e:
+                print(f"[EMAIL] Ошибка в подписчике на изменения почты: {e}")
+    
+    def _insert_email(self, email: Email, folder: str):
+        """Добавить письмо в хранилище и обновить счётчики"""
+        if email.id in self._emails:
+            # Письмо с таким id заменяется целиком
+            self._remove_email(email.id)
+        if email.day is None:
+            # Письма из старых сохранений считаются полученными сегодня
+            email.day = self.day
+        self._emails[email.id] = email
+        self._folders[folder][email.id] = email
+        self._email_folders[email.id] = folder
+        
+        if not email.read:
+            self.unread_emails += 1
+        if email.important:
+            self._important_count += 1
+        if email.is_spam:
+            spam_type = email.spam_type or ""
+            self._spam_counts[spam_type] = self._spam_counts.get(spam_type, 0) + 1
+            if folder == "inbox":
+                self._spam_inbox[email.id] = email
+        if email.is_mvd_email():
+            self._mvd_ids.add(email.id)
+            if folder == "inbox":
+                self._mvd_inbox[email.id] = email
+                if not email.read:
+                    self._mvd_unread += 1
+        
+        self._notify("added", email)
+    
+    def _remove_email(self, email_id: int, notify: bool = True) -> Optional[Email]:
+        """Убрать письмо из хранилища и обновить счётчики"""
+        email = self._emails.pop(email_id, None)
+        if email is None:
+            return None
+        folder = self._email_folders.pop(email_id)
+        del self._folders[folder][email_id]
+        self._render_cache.discard(email_id)
+        
+        if not email.read:
+            self.unread_emails -= 1
+        if email.important:
+            self._important_count -= 1
+        if email.is_spam:
+            spam_type = email.spam_type or ""
+            self._spam_counts[spam_type] -= 1
+            if not self._spam_counts[spam_type]:
+                del self._spam_counts[spam_type]
+            self._spam_inbox.pop(email_id, None)
+        if email_id in self._mvd_ids:
+            self._mvd_ids.discard(email_id)
+            if self._mvd_inbox.pop(email_id, None) is not None and not email.read:
+                self._mvd_unread -= 1
+        
+        if notify:
+            self._notify("removed", email)
+        return email
+    
+    def _set_read(self, email: Email, read: bool):
+        """Сменить флаг прочтения с учётом счётчиков"""
+        email.read = read
+        delta = -1 if read else 1
+        self.unread_emails += delta
+        if email.id in self._mvd_inbox:
+            self._mvd_unread += delta
+        self._changed_emails[email.id] = email
+        self._notify("updated", email)
+    
     def get_emails(self, folder: str = "inbox") -> List[Email]:
         """Получить письма из указанной папки"""
-        if folder == "inbox":
-            return self.inbox
-        elif folder == "sent":
-            return self.sent
-        elif folder == "draft":
-            return self.draft
-        else:
+        if folder not in self._folders:
             print(f"[EMAIL] Неизвестная папка: {folder}")
             return []
+        return list(self._folders[folder].values())
+    
+    def get_folder_count(self, folder: str = "inbox") -> int:
+        """Количество писем в папке"""
+        return len(self._folders.get(folder, ()))
+    
+    def get_folder_ids(self, folder: str = "inbox"):
+        """id писем папки (представление, без копирования)"""
+        return self._folders.get(folder, {}).keys()
+    
+    def get_email_folder(self, email_id: int) -> Optional[str]:
+        """Папка, в которой лежит письмо"""
+        return self._email_folders.get(email_id)
     
     def get_email_by_id(self, email_id: int) -> Optional[Email]:
         """Найти письмо по ID"""
-        for email in self.inbox + self.sent + self.draft:
-            if email.id == email_id:
-                return email
-        return None
+        return self._emails.get(email_id)
+    
+    def render_content(self, email_id: int) -> str:
+        """Текст письма на текущем языке (из кэша, если уже отрисован)"""
+        email = self._emails.get(email_id)
+        if email is None:
+            return ""
+        return self._render_cache.get_or_render(email_id, "text", email.get_content)
+    
+    def render_html(self, email_id: int) -> str:
+        """HTML письма на текущем языке (из кэша, если уже отрисован)"""
+        email = self._emails.get(email_id)
+        if email is None:
+            return ""
+        return self._render_cache.get_or_render(
+            email_id, "html", lambda: email.get_html_content(self.render_content(email_id))
+        )
+    
+    def get_render_stats(self) -> dict:
+        """Попадания и промахи кэша отрисовки писем"""
+        return self._render_cache.stats()
+    
+    def search(self, query: str, folder: Optional[str] = "inbox") -> List[int]:
+        """id писем, подходящих под поисковый запрос (см. core.mail_search)"""
+        if self._search_index is None:
+            from core.mail_search import MailSearchIndex
+            self._search_index = MailSearchIndex(self)
+        return self._search_index.search(query, folder)
+    
+    def is_mvd(self, email_id: int) -> bool:
+        """Письмо от МВД (без повторного разбора отправителя)"""
+        return email_id in self._mvd_ids
     
     def mark_as_read(self, email_id: int) -> bool:
         """Пометить письмо как прочитанное"""
         email = self.get_email_by_id(email_id)
         if email and not email.read:
-            email.read = True
-            self.unread_emails -= 1
+            self._set_read(email, True)
             
             # Проверяем, является ли это письмо от МВД
-            if email.is_mvd_email():
+            if email_id in self._mvd_ids:
                 self.mvd_email_read = True
                 print(f"[EMAIL] Письмо от МВД отмечено как прочитанное")
             
@@ -270,11 +512,10 @@ class EmailSystem:
         """Пометить письмо как непрочитанное"""
         email = self.get_email_by_id(email_id)
         if email and email.read:
-            email.read = False
-            self.unread_emails += 1
+            self._set_read(email, False)
             
             # Если это письмо от МВД, снимаем флаг
-            if email.is_mvd_email():
+            if email_id in self._mvd_ids:
                 self.mvd_email_read = False
             
             return True
@@ -282,16 +523,11 @@ class EmailSystem:
     
     def delete_email(self, email_id: int) -> bool:
         """Удалить письмо"""
-        # Ищем во всех папках
-        for folder in [self.inbox, self.sent, self.draft]:
-            for i, email in enumerate(folder):
-                if email.id == email_id:
-                    if not email.read:
-                        self.unread_emails -= 1
-                    del folder[i]
-                    print(f"[EMAIL] Письмо {email_id} удалено")
-                    return True
-        return False
+        if self._remove_email(email_id) is None:
+            return False
+        self._forget_email(email_id)
+        print(f"[EMAIL] Письмо {email_id} удалено")
+        return True
     
     def get_unread_count(self) -> int:
         """Получить количество непрочитанных писем"""
@@ -299,17 +535,95 @@ class EmailSystem:
     
     def get_total_count(self) -> int:
         """Получить общее количество писем"""
-        return len(self.inbox) + len(self.sent) + len(self.draft)
+        return len(self._emails)
     
-    def clear_old_emails(self, days_old: int = 7):
-        """Очистить старые письма"""
-        # Пока просто очищаем все, кроме важных
-        old_count = len(self.inbox)
-        self.inbox = [email for email in self.inbox if email.important]
-        self.sent = [email for email in self.sent if email.important]
-        self.unread_emails = len([email for email in self.inbox if not email.read])
+    def get_important_count(self) -> int:
+        """Количество важных писем"""
+        return self._important_count
+    
+    def get_spam_count(self, spam_type: str = None) -> int:
+        """Количество спам-писем (всех или заданного типа)"""
+        if spam_type is None:
+            return sum(self._spam_counts.values())
+        return self._spam_counts.get(spam_type, 0)
+    
+    def get_spam_counts(self) -> Dict[str, int]:
+        """Количество спам-писем по типам"""
+        return dict(self._spam_counts)
+    
+    def get_retention_policy(self) -> RetentionPolicy:
+        """Действующие правила хранения писем"""
+        return self.retention if self.retention is not None else get_default_policy()
+    
+    def _expired_emails(self, max_age_days: int, read_only: bool = False) -> List[Email]:
+        """Неважные письма входящих и отправленных старше max_age_days дней"""
+        oldest_day = self.day - max_age_days
+        expired = []
+        for folder in ("inbox", "sent"):
+            # Письма лежат в порядке поступления: дальше только более новые
+            for email in self._folders[folder].values():
+                if email.day >= oldest_day:
+                    break
+                if not email.important and (email.read or not read_only):
+                    expired.append(email)
+        return expired
+    
+    def _overflow_emails(self, max_count: int, spam_first: bool, skip) -> List[Email]:
+        """Самые старые неважные письма сверх max_count во входящих"""
+        excess = self.get_folder_count("inbox") - max_count - sum(
+            1 for email_id in skip if self._email_folders.get(email_id) == "inbox")
+        if excess <= 0:
+            return []
         
-        print(f"[EMAIL] Очищено {old_count - len(self.inbox)} старых писем")
+        candidates = self._folders["inbox"].values()
+        if spam_first:
+            candidates = itertools.chain(self._spam_inbox.values(), candidates)
+        overflow = []
+        chosen = set(skip)
+        for email in candidates:
+            if email.important or email.id in chosen:
+                continue
+            overflow.append(email)
+            chosen.add(email.id)
+            if len(overflow) == excess:
+                break
+        return overflow
+    
+    def _evict(self, emails: List[Email], archive: bool) -> int:
+        """Удалить письма по правилам хранения (с отправкой в архив)"""
+        for email in emails:
+            if archive:
+                self.archive.add(self._email_folders[email.id], email, self.day)
+            self._remove_email(email.id)
+            self._forget_email(email.id)
+        return len(emails)
+    
+    def enforce_retention(self) -> int:
+        """Убрать из почты (в архив) письма сверх правил хранения; возвращает их число"""
+        policy = self.get_retention_policy()
+        expired = []
+        if policy.max_age_days is not None:
+            expired = self._expired_emails(policy.max_age_days)
+        if policy.archive and policy.hot_days is not None:
+            # Прочитанная старая почта уходит в холодное хранилище
+            expired_ids = {email.id for email in expired}
+            expired += [email for email in self._expired_emails(policy.hot_days, read_only=True)
+                        if email.id not in expired_ids]
+        overflow = []
+        if policy.max_count is not None:
+            overflow = self._overflow_emails(policy.max_count, policy.spam_first,
+                                             [email.id for email in expired])
+        
+        removed = self._evict(expired + overflow, policy.archive)
+        if removed:
+            where = "перенесено в архив" if policy.archive else "удалено"
+            print(f"[EMAIL] По правилам хранения {where} писем: {removed}")
+        return removed
+    
+    def clear_old_emails(self, days_old: int = 7):
+        """Удалить неважные письма старше days_old игровых дней"""
+        removed = self._evict(self._expired_emails(days_old), self.get_retention_policy().archive)
+        print(f"[EMAIL] Очищено {removed} старых писем")
         
         # Сбрасываем флаги для нового дня
         self.emails_received_today = False
@@ -321,7 +635,7 @@ class EmailSystem:
             print(f"[EMAIL] Письма уже были добавлены сегодня")
             return
         
-        self.clear_old_emails()
+        self.enforce_retention()
         
         # 1. Системное приветствие (не от МВД, но важное)
         print("[EMAIL] Добавляем системное приветствие")
@@ -347,7 +661,7 @@ class EmailSystem:
         )
         
         self.emails_received_today = True
-        print(f"[EMAIL] Добавлено {len(self.inbox)} начальных писем")
+        print(f"[EMAIL] Добавлено {self.get_folder_count('inbox')} начальных писем")
     
     def generate_daily_emails(self):
         """Сгенерировать ежедневные письма"""
@@ -398,7 +712,7 @@ class EmailSystem:
             )
         
         self.emails_received_today = True
-        print(f"[EMAIL] Сгенерировано {len(self.inbox)} писем")
+        print(f"[EMAIL] Сгенерировано {self.get_folder_count('inbox')} писем")
     
     def add_mission_email(self, mission_name: str, difficulty: str, deadline: str, description: str):
         """Добавить письмо с заданием"""
@@ -439,37 +753,65 @@ class EmailSystem:
     
     def has_unread_mvd_emails(self) -> bool:
         """Есть ли непрочитанные письма от МВД"""
-        for email in self.inbox:
-            if email.is_mvd_email() and not email.read:
-                return True
-        return False
+        return self._mvd_unread > 0
     
     def has_read_mvd_emails(self) -> bool:
         """Есть ли прочитанные письма от МВД"""
-        for email in self.inbox:
-            if email.is_mvd_email() and email.read:
-                return True
-        return False
+        return len(self._mvd_inbox) > self._mvd_unread
     
     def get_mvd_emails(self) -> List[Email]:
         """Получить все письма от МВД"""
-        return [email for email in self.inbox if email.is_mvd_email()]
+        return list(self._mvd_inbox.values())
+    
+    def _forget_email(self, email_id: int):
+        """Отметить удаление письма для журнала сохранений"""
+        self._changed_emails.pop(email_id, None)
+        self._deleted_email_ids.add(email_id)
+    
+    def _state_dict(self) -> dict:
+        """Поля системы без писем"""
+        return {name: getattr(self, name) for name in self.STATE_FIELDS}
+    
+    def pop_changes(self) -> Optional[dict]:
+        """Забрать изменения с прошлого сохранения (для журнала) и сбросить их"""
+        state = self._state_dict()
+        changed_state = {name: value for name, value in state.items()
+                         if name not in self._saved_state or self._saved_state[name] != value}
+        
+        upsert = [
+            {"folder": self._email_folders.get(email_id, "inbox"), "email": email.to_dict()}
+            for email_id, email in self._changed_emails.items()
+        ]
+        deleted = sorted(self._deleted_email_ids)
+        
+        self.mark_saved()
+        
+        if not changed_state and not upsert and not deleted:
+            return None
+        
+        changes = {}
+        if changed_state:
+            changes["state"] = changed_state
+        if upsert:
+            changes["upsert"] = upsert
+        if deleted:
+            changes["delete"] = deleted
+        return changes
+    
+    def mark_saved(self):
+        """Текущее состояние записано на диск целиком"""
+        self._changed_emails.clear()
+        self._deleted_email_ids.clear()
+        self._saved_state = self._state_dict()
     
     def to_dict(self) -> dict:
         """Преобразовать систему в словарь для сохранения"""
-        return {
-            "inbox": [email.to_dict() for email in self.inbox],
-            "sent": [email.to_dict() for email in self.sent],
-            "draft": [email.to_dict() for email in self.draft],
-            "next_email_id": self.next_email_id,
-            "unread_emails": self.unread_emails,
-            "emails_received_today": self.emails_received_today,
-            "mvd_email_read": self.mvd_email_read,
-            "player_name": self.player_name,
-            "day": self.day,
-            "reputation": self.reputation,
-            "money": self.money
+        data = {
+            folder: [email.to_dict() for email in self._folders[folder].values()]
+            for folder in self.FOLDERS
         }
+        data.update(self._state_dict())
+        return data
     
     @classmethod
     def from_dict(cls, data: dict) -> 'EmailSystem':
@@ -482,19 +824,16 @@ class EmailSystem:
         )
         
         email_system.next_email_id = data.get("next_email_id", 1)
-        email_system.unread_emails = data.get("unread_emails", 0)
         email_system.emails_received_today = data.get("emails_received_today", False)
         email_system.mvd_email_read = data.get("mvd_email_read", False)
         
-        # Восстанавливаем письма
-        for email_data in data.get("inbox", []):
-            email_system.inbox.append(Email.from_dict(email_data))
-        
-        for email_data in data.get("sent", []):
-            email_system.sent.append(Email.from_dict(email_data))
+        # Восстанавливаем письма (счётчик непрочитанных пересчитывается по ним)
+        for folder in email_system.FOLDERS:
+            for email_data in data.get(folder, []):
+                email_system._insert_email(Email.from_dict(email_data), folder)
         
-        for email_data in data.get("draft", []):
-            email_system.draft.append(Email.from_dict(email_data))
+        # Загруженное состояние совпадает с диском
+        email_system.mark_saved()
         
-        print(f"[EMAIL] Загружено {len(email_system.inbox)} писем, непрочитанных: {email_system.unread_emails}")
+        print(f"[EMAIL] Загружено {email_system.get_folder_count('inbox')} писем, непрочитанных: {email_system.unread_emails}")
         return email_system
\ No newline at end of file
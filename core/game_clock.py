@@ -0,0 +1,171 @@
+# core/game_clock.py
+"""
+Единые игровые часы.
+
+Игровое время продвигает только GameClock: один тик - одно обращение к
+GameState.update_time. Часы не зависят от Qt - их двигает драйвер
+(ui/clock_driver.py - один QTimer; headless-прогон может вызывать tick()
+в цикле). Виджеты не опрашивают время своими таймерами, а подписываются
+на события часов:
+    ClockTick    - время продвинулось (каждый тик);
+    HourChanged  - сменился игровой час;
+    DayChanged   - сменился игровой день (конец смены или полночь).
+Подписчики - связанные методы - хранятся по слабым ссылкам: удалённый
+виджет просто перестаёт получать события.
+"""
+
+import weakref
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Type
+
+
+@dataclass(frozen=True)
+class ClockTick:
+    """Игровое время продвинулось"""
+    minutes: int
+    day: int
+    hour: int
+    minute: int
+
+
+@dataclass(frozen=True)
+class HourChanged:
+    """Сменился игровой час"""
+    previous_hour: int
+    hour: int
+    day: int
+
+
+@dataclass(frozen=True)
+class DayChanged:
+    """Сменился игровой день"""
+    previous_day: int
+    day: int
+
+
+class GameClock:
+    """Игровые часы: пауза, масштаб времени и события тиков"""
+
+    def __init__(self, minutes_per_tick: int = 1, tick_interval_ms: int = 1000):
+        self.game_state = None
+        self.minutes_per_tick = minutes_per_tick
+        self.tick_interval_ms = tick_interval_ms  # Реальное время тика при масштабе 1x
+        self.time_scale = 1.0
+        self.paused = True
+        self._listeners: Dict[type, List] = {}
+        self._state_listeners: List[Callable[[], None]] = []  # Драйверы: пауза/масштаб изменились
+
+    # --- Подписки ---
+
+    def subscribe(self, event_type: Type, callback: Callable):
+        """Вызывать callback(event) для событий event_type"""
+        if getattr(callback, "__self__", None) is not None:
+            ref = weakref.WeakMethod(callback)
+        else:
+            ref = lambda callback=callback: callback
+        self._listeners.setdefault(event_type, []).append(ref)
+
+    def unsubscribe(self, event_type: Type, callback: Callable):
+        self._listeners[event_type] = [
+            ref for ref in self._listeners.get(event_type, []) if ref() not in (None, callback)
+        ]
+
+    def on_state_changed(self, callback: Callable[[], None]):
+        """Подписка драйвера на смену паузы и масштаба"""
+        self._state_listeners.append(callback)
+
+    def publish(self, event):
+        listeners = self._listeners.get(type(event))
+        if not listeners:
+            return
+        alive = []
+        for ref in listeners:
+            callback = ref()
+            if callback is None:
+                continue
+            alive.append(ref)
+            try:
+                callback(event)
+            except RuntimeError as e:
+                # Объект Qt уже удалён, а обёртка ещё жива
+                print(f"[ЧАСЫ] Подписчик {type(event).__name__} недоступен: {e}")
+                alive.pop()
+            except Exception as e:
+                print(f"[ЧАСЫ] Ошибка подписчика {type(event).__name__}: {e}")
+        if len(alive) != len(listeners):
+            self._listeners[type(event)] = alive
+
+    # --- Управление ---
+
+    def attach(self, game_state):
+        """Привязать часы к игре (новая игра или загрузка)"""
+        self.game_state = game_state
+        if game_state is not None:
+            # Пауза часов и пауза в сохранении - одно и то же состояние
+            if self.paused:
+                game_state.pause_game_time()
+            else:
+                game_state.resume_game_time()
+        self._state_changed()
+
+    def pause(self):
+        if self.game_state is not None:
+            self.game_state.pause_game_time()
+        if not self.paused:
+            self.paused = True
+            self._state_changed()
+
+    def resume(self):
+        if self.game_state is not None:
+            self.game_state.resume_game_time()
+        if self.paused:
+            self.paused = False
+            self._state_changed()
+
+    def set_time_scale(self, scale: float):
+        """Скорость времени: тики идут в scale раз чаще"""
+        scale = max(0.1, float(scale))
+        if scale != self.time_scale:
+            self.time_scale = scale
+            self._state_changed()
+
+    @property
+    def running(self) -> bool:
+        return not self.paused and self.game_state is not None
+
+    @property
+    def interval_ms(self) -> int:
+        """Реальный интервал между тиками с учётом масштаба"""
+        return max(1, int(self.tick_interval_ms / self.time_scale))
+
+    def _state_changed(self):
+        for callback in self._state_listeners:
+            callback()
+
+    # --- Ход времени ---
+
+    def tick(self):
+        """Один тик часов (вызывает драйвер)"""
+        if self.running:
+            self.advance(self.minutes_per_tick)
+
+    def advance(self, minutes: int):
+        """Продвинуть игровое время и разослать события"""
+        state = self.game_state
+        if state is None or state.game_time.get('is_paused', False):
+            return
+        previous_hour = state.game_time.get('current_hour', 9)
+        previous_day = state.day
+
+        state.update_time(minutes)
+
+        hour = state.game_time.get('current_hour', 9)
+        if hour != previous_hour:
+            self.publish(HourChanged(previous_hour, hour, state.day))
+        if state.day != previous_day:
+            self.publish(DayChanged(previous_day, state.day))
+        self.publish(ClockTick(minutes, state.day, hour, state.game_time.get('current_minute', 0)))
+
+
+# Общие игровые часы
+game_clock = GameClock()
@@ -1,14 +1,17 @@
 # core/game_state.py
 
-import json
-import os
+import copy
 from datetime import datetime
 from dataclasses import dataclass, asdict, field
 from typing import Dict, List, Optional, Tuple
 import random
 import time
 
+from core.email_archive import EmailArchive
 from core.email_system import EmailSystem
+from core.save_journal import SaveJob, get_save_journal
+from core.save_migrations import SAVE_FORMAT_VERSION, migrate
+from core.skills import default_skills, get_skill_name
 from simple_translation import translation
 
 
@@ -28,7 +31,7 @@ class GameState:
     shift_started: bool = False
     reputation: int = 0
     money: float = 500.0
-    skills: Dict[str, int] = field(default_factory=dict)
+    skills: Dict[str, int] = field(default_factory=dict)  # id навыка -> уровень (см. core.skills)
     
     # Игровое время
     game_time: Dict = field(default_factory=dict)
@@ -65,14 +68,7 @@ class GameState:
     
     def __post_init__(self):
         if not self.skills:
-            self.skills = {
-                tr("game_state.skill_hacking", "Взлом"): 1,
-                tr("game_state.skill_social_engineering", "Социальная инженерия"): 1,
-                tr("game_state.skill_programming", "Программирование"): 1,
-                tr("game_state.skill_stealth", "Скрытность"): 1,
-                tr("game_state.skill_analysis", "Анализ"): 1,
-                tr("game_state.skill_network_security", "Сетевая безопасность"): 1
-            }
+            self.skills = default_skills()
         
         # Инициализация игрового времени
         if not self.game_time:
@@ -127,6 +123,11 @@ class GameState:
                 reputation=self.reputation,
                 money=self.money
             )
+        
+        # Состояние журнала сохранений: с каким снимком синхронизированы поля
+        self._journal_slot = None
+        self._journal_generation = None
+        self._saved_fields = {}
     
     @property
     def player_name(self):
@@ -191,188 +192,163 @@ class GameState:
             self.welcome_email_sent = True
             print("[ИГРА] Отправлено приветственное письмо")
     
-    def save(self, slot: int = None):
-        """Сохранить игру"""
+    # Поля, которые попадают в сохранение (кроме системы почты)
+    SAVE_FIELDS = (
+        'first_name', 'last_name', 'day', 'shift_started', 'reputation', 'money', 'skills',
+        'game_time', 'time_paused', 'error_email_sent', 'mvd_mission_email_sent',
+        'welcome_email_sent', 'cutscene_shown', 'save_slot', 'last_hour_checked',
+        'spam_cooldown', 'spam_types_sent_today', 'special_emails_config',
+        'shift_time', 'energy', 'stress'
+    )
+    
+    def _save_fields(self) -> dict:
+        """Основные поля для сохранения (копия, не связанная с живым состоянием)"""
+        data = {name: getattr(self, name) for name in self.SAVE_FIELDS}
+        data['spam_types_sent_today'] = list(self.spam_types_sent_today)
+        return copy.deepcopy(data)
+    
+    def to_dict(self) -> dict:
+        """Преобразовать состояние в словарь для полного сохранения"""
+        data = self._save_fields()
+        data["format_version"] = SAVE_FORMAT_VERSION
+        
+        # Сохраняем систему почты
+        if self.email_system:
+            data["email_system"] = self.email_system.to_dict()
+        
+        return data
+    
+    def _pop_save_delta(self) -> Optional[dict]:
+        """Собрать изменения с прошлого сохранения для журнала"""
+        fields = self._save_fields()
+        changed = {name: value for name, value in fields.items()
+                   if name not in self._saved_fields or self._saved_fields[name] != value}
+        self._saved_fields = fields
+        
+        delta = {}
+        if changed:
+            delta["fields"] = changed
+        if self.email_system:
+            email_changes = self.email_system.pop_changes()
+            if email_changes:
+                delta["emails"] = email_changes
+        return delta or None
+    
+    def get_slot_metadata(self) -> dict:
+        """Краткие сведения о сохранении для индекса слотов"""
+        return {
+            'first_name': self.first_name,
+            'last_name': self.last_name,
+            'day': self.day,
+            'money': self.money
+        }
+    
+    def prepare_save(self, slot: int = None) -> SaveJob:
+        """
+        Подготовить сохранение: снять неизменяемую копию данных.
+        
+        Вызывается в потоке интерфейса; запись на диск (SaveJob.run)
+        можно выполнять в фоновом потоке.
+        """
         # Если слот не указан, используем текущий save_slot
         if slot is None:
             slot = self.save_slot
-            
-        filename = f"saves/slot_{slot}.json"
-        os.makedirs("saves", exist_ok=True)
         
         # Обновляем слот сохранения
         self.save_slot = slot
         
-        # Создаем словарь для сохранения
-        data = {}
-        
-        # Сохраняем основные поля
-        data['first_name'] = self.first_name
-        data['last_name'] = self.last_name
-        data['day'] = self.day
-        data['shift_started'] = self.shift_started
-        data['reputation'] = self.reputation
-        data['money'] = self.money
-        data['skills'] = self.skills
-        data['game_time'] = self.game_time
-        data['time_paused'] = self.time_paused
-        data['error_email_sent'] = self.error_email_sent
-        data['mvd_mission_email_sent'] = self.mvd_mission_email_sent
-        data['welcome_email_sent'] = self.welcome_email_sent
-        data['cutscene_shown'] = self.cutscene_shown
-        data['save_slot'] = self.save_slot
-        data['last_hour_checked'] = self.last_hour_checked
-        data['spam_cooldown'] = self.spam_cooldown
-        data['spam_types_sent_today'] = list(self.spam_types_sent_today)
-        data['special_emails_config'] = self.special_emails_config
-        data['shift_time'] = self.shift_time
-        data['energy'] = self.energy
-        data['stress'] = self.stress
+        journal = get_save_journal(slot)
         
-        # Сохраняем систему почты
-        if self.email_system:
-            data["email_system"] = self.email_system.to_dict()
+        # Письма, убранные по правилам хранения, дописываются в архив слота
+        archive = self.email_system.archive.prepare_commit(journal.archive_path) if self.email_system else None
         
-        with open(filename, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        if (self._journal_slot == slot and self._journal_generation == journal.generation
+                and journal.exists()):
+            # Дописываем в журнал только изменения
+            return SaveJob(journal, journal.generation, delta=self._pop_save_delta(),
+                           metadata=self.get_slot_metadata(), archive=archive)
         
-        print(tr("game.save_success", "[СОХРАНЕНИЕ] Игра сохранена в {filename}").format(filename=filename))
+        # Первое сохранение в этот слот - полный снимок
+        data = self.to_dict()
+        self._journal_slot = slot
+        self._journal_generation = journal.new_generation()
+        self._saved_fields = {name: data[name] for name in self.SAVE_FIELDS}
+        if self.email_system:
+            self.email_system.mark_saved()
+        return SaveJob(journal, self._journal_generation, snapshot=data,
+                       metadata=self.get_slot_metadata(), archive=archive)
+    
+    def save(self, slot: int = None):
+        """Сохранить игру"""
+        job = self.prepare_save(slot)
+        job.run()
+        
+        print(tr("game.save_success", "[СОХРАНЕНИЕ] Игра сохранена в {filename}").format(filename=job.filename))
     
     @classmethod
     def load(cls, slot: int = 0):
         """Загрузить игру"""
-        filename = f"saves/slot_{slot}.json"
-        if os.path.exists(filename):
+        journal = get_save_journal(slot)
+        filename = journal.base_path
+        if journal.exists():
             try:
-                with open(filename, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    
-                    # Преобразуем spam_types_sent_today из list обратно в set
-                    if 'spam_types_sent_today' in data and isinstance(data['spam_types_sent_today'], list):
-                        data['spam_types_sent_today'] = set(data['spam_types_sent_today'])
-                    
-                    # Обратная совместимость со старыми сохранениями
-                    if 'player_name' in data and ('first_name' not in data or not data['first_name']):
-                        if 'player_name' in data:
-                            parts = data['player_name'].split()
-                            data['first_name'] = parts[0] if len(parts) > 0 else ""
-                            data['last_name'] = parts[1] if len(parts) > 1 else ""
-                    
-                    # Обновляем названия навыков
-                    if 'skills' in data:
-                        old_to_new = {
-                            'hacking': tr("game_state.skill_hacking", "Взлом"),
-                            'social_engineering': tr("game_state.skill_social_engineering", "Социальная инженерия"),
-                            'programming': tr("game_state.skill_programming", "Программирование"),
-                            'stealth': tr("game_state.skill_stealth", "Скрытность"),
-                            'analysis': tr("game_state.skill_analysis", "Анализ"),
-                            'network_security': tr("game_state.skill_network_security", "Сетевая безопасность")
-                        }
-                        new_skills = {}
-                        for key, value in data['skills'].items():
-                            new_key = old_to_new.get(key, key)
-                            new_skills[new_key] = value
-                        
-                        # Добавляем недостающие навыки
-                        required_skills = [
-                            tr("game_state.skill_analysis", "Анализ"),
-                            tr("game_state.skill_network_security", "Сетевая безопасность")
-                        ]
-                        for skill in required_skills:
-                            if skill not in new_skills:
-                                new_skills[skill] = 1
-                        data['skills'] = new_skills
-                    
-                    # Обработка системы почты
-                    email_system_data = data.get('email_system')
-                    email_system = None
-                    if email_system_data:
-                        email_system = EmailSystem.from_dict(email_system_data)
-                    data['email_system'] = email_system
-                    
-                    # Добавляем недостающие поля для совместимости
-                    default_fields = [
-                        ('shift_time', 0),
-                        ('energy', 100),
-                        ('stress', 0),
-                        ('time_paused', False),
-                        ('error_email_sent', False),
-                        ('mvd_mission_email_sent', False),
-                        ('welcome_email_sent', False),
-                        ('save_slot', slot),
-                        ('last_hour_checked', 9),
-                        ('spam_cooldown', {}),
-                        ('spam_types_sent_today', set()),
-                        ('cutscene_shown', False),
-                        ('special_emails_config', {
-                            "error_message": {
-                                "enabled": True,
-                                "required_tasks": 1,
-                                "required_time": 30,
-                                "description": tr("game_state.special_email_config", "Письмо ERROR - отправляется через 30 минут игрового времени после выполнения первой задачи")
-                            },
-                            "mvd_mission_1_intro": {
-                                "enabled": True,
-                                "required_tasks": 1,
-                                "required_time": 30,
-                                "description": tr("game_state.special_email_config", "Первое задание МВД - отправляется через 30 минут игрового времени после выполнения первой задачи")
-                            }
-                        })
-                    ]
-                    
-                    for field_name, default_value in default_fields:
-                        if field_name not in data:
-                            data[field_name] = default_value
-                    
-                    # Загружаем игровое время
-                    if 'game_time' not in data:
-                        data['game_time'] = {
-                            'current_hour': 9,
-                            'current_minute': 0,
-                            'day': data.get('day', 1),
-                            'month': 1,
-                            'year': 2140,
-                            'is_paused': False,
-                            'time_speed': 1.0,
-                            'workday_start': 9,
-                            'workday_end': 18
-                        }
-                    else:
-                        # Обновляем год для старых сохранений
-                        if data['game_time'].get('year', 1984) == 1984:
-                            data['game_time']['year'] = 2140
-                        # Обновляем скорость времени
-                        if data['game_time'].get('time_speed', 6.0) != 1.0:
-                            data['game_time']['time_speed'] = 1.0
-                    
-                    # Создаем экземпляр GameState
-                    game_state = cls(
-                        first_name=data.get('first_name', ''),
-                        last_name=data.get('last_name', ''),
-                        day=data.get('day', 1),
-                        shift_started=data.get('shift_started', False),
-                        reputation=data.get('reputation', 0),
-                        money=data.get('money', 500.0),
-                        skills=data.get('skills', {}),
-                        game_time=data.get('game_time', {}),
-                        time_paused=data.get('time_paused', False),
-                        error_email_sent=data.get('error_email_sent', False),
-                        mvd_mission_email_sent=data.get('mvd_mission_email_sent', False),
-                        welcome_email_sent=data.get('welcome_email_sent', False),
-                        cutscene_shown=data.get('cutscene_shown', False),
-                        save_slot=data.get('save_slot', slot),
-                        last_hour_checked=data.get('last_hour_checked', 9),
-                        spam_cooldown=data.get('spam_cooldown', {}),
-                        spam_types_sent_today=data.get('spam_types_sent_today', set()),
-                        special_emails_config=data.get('special_emails_config', {}),
-                        email_system=data.get('email_system'),
-                        shift_time=data.get('shift_time', 0),
-                        energy=data.get('energy', 100),
-                        stress=data.get('stress', 0)
-                    )
-                    
-                    return game_state
-                    
+                data = journal.read()
+                
+                # Старые сохранения доводим до текущего формата и один раз
+                # перезаписываем слот, чтобы следующие загрузки это не повторяли
+                data, migrated = migrate(data, slot)
+                if migrated:
+                    try:
+                        journal.rewrite(data)
+                    except Exception as e:
+                        print(f"[СОХРАНЕНИЕ] Не удалось перезаписать слот {slot} после миграции: {e}")
+                
+                # Преобразуем spam_types_sent_today из list обратно в set
+                if isinstance(data.get('spam_types_sent_today'), list):
+                    data['spam_types_sent_today'] = set(data['spam_types_sent_today'])
+                
+                # Обработка системы почты
+                email_system_data = data.get('email_system')
+                email_system = None
+                if email_system_data:
+                    email_system = EmailSystem.from_dict(email_system_data)
+                    # Старая почта остаётся на диске и читается страницами
+                    email_system.archive = EmailArchive(journal.archive_path)
+                data['email_system'] = email_system
+                
+                # Создаем экземпляр GameState
+                game_state = cls(
+                    first_name=data.get('first_name', ''),
+                    last_name=data.get('last_name', ''),
+                    day=data.get('day', 1),
+                    shift_started=data.get('shift_started', False),
+                    reputation=data.get('reputation', 0),
+                    money=data.get('money', 500.0),
+                    skills=data.get('skills', {}),
+                    game_time=data.get('game_time', {}),
+                    time_paused=data.get('time_paused', False),
+                    error_email_sent=data.get('error_email_sent', False),
+                    mvd_mission_email_sent=data.get('mvd_mission_email_sent', False),
+                    welcome_email_sent=data.get('welcome_email_sent', False),
+                    cutscene_shown=data.get('cutscene_shown', False),
+                    save_slot=data.get('save_slot', slot),
+                    last_hour_checked=data.get('last_hour_checked', 9),
+                    spam_cooldown=data.get('spam_cooldown', {}),
+                    spam_types_sent_today=data.get('spam_types_sent_today', set()),
+                    special_emails_config=data.get('special_emails_config', {}),
+                    email_system=data.get('email_system'),
+                    shift_time=data.get('shift_time', 0),
+                    energy=data.get('energy', 100),
+                    stress=data.get('stress', 0)
+                )
+                
+                # Дальше сохраняем в этот слот через журнал; поля запишутся
+                # первой же записью, письма - только изменённые
+                game_state._journal_slot = slot
+                game_state._journal_generation = journal.generation
+                
+                return game_state
+                
             except Exception as e:
                 print(tr("game.load_error", "[ОШИБКА] Не удалось загрузить сохранение: {error}").format(error=e))
                 game_state = cls()
@@ -691,12 +667,11 @@ class GameState:
         
         self.game_time['day'] = self.day
         
-        self.email_system.clear_old_emails()
+        self.email_system.day = self.day
+        self.email_system.enforce_retention()
         self.email_system.emails_received_today = False
         self.email_system.mvd_email_read = False
         
-        self.email_system.day = self.day
-        
         return shift_bonus
     
     def end_shift(self):
@@ -722,8 +697,8 @@ class GameState:
             tr("game.statistics.unread_emails", "Непрочитанных писем"): self.unread_emails,
             tr("game.statistics.game_date", "Игровая дата"): self.get_formatted_date(),
             tr("game.statistics.shift_progress", "Прогресс смены"): f"{self.get_workday_progress():.1f}%",
-            tr("game.statistics.skills", "Навыки"): {skill: f"{level}/10 ({self.get_skill_level_name(level)})" 
-                      for skill, level in self.skills.items()},
+            tr("game.statistics.skills", "Навыки"): {get_skill_name(skill_id): f"{level}/10 ({self.get_skill_level_name(level)})" 
+                      for skill_id, level in self.skills.items()},
             tr("game.statistics.cutscene_shown", "Кат-сцена показана"): 
                 tr("game.yes", "Да") if self.cutscene_shown else tr("game.no", "Нет"),
             tr("game.statistics.save_slot", "Слот сохранения"): self.save_slot
@@ -0,0 +1,249 @@
+# core/mail_search.py
+"""
+Поиск по почте.
+
+Инвертированный индекс по отрисованным на текущем языке отправителю,
+теме и тексту письма: слово -> множество id писем. Индекс строится
+лениво при первом поиске, дальше обновляется по событиям EmailSystem
+(добавление и удаление писем) и целиком перестраивается при следующем
+поиске после смены языка.
+
+Запрос - слова через пробел (каждое ищется как префикс) и фильтры:
+    is:unread  is:read  is:important  is:mvd  is:spam  spam:<тип>
+
+Письма из архива слота в индекс не входят: при подгрузке страниц архива
+они проверяются по тому же запросу через email_matches().
+"""
+
+import re
+import threading
+import weakref
+from bisect import bisect_left
+from typing import Dict, List, Optional, Set, Tuple
+
+from simple_translation import translation
+
+
+_WORD_RE = re.compile(r"\w+")
+_TAG_RE = re.compile(r"<[^>]+>")
+
+
+def tokenize(text: str) -> Set[str]:
+    """Слова текста в нижнем регистре"""
+    return set(_WORD_RE.findall(text.lower()))
+
+
+def parse_query(query: str) -> Tuple[List[str], List[str], List[str]]:
+    """Запрос -> (слова, фильтры is:, типы spam:)"""
+    words, flags, spam_types = [], [], []
+    for part in query.lower().split():
+        if part.startswith("is:"):
+            flags.append(part[3:])
+        elif part.startswith("spam:") and len(part) > 5:
+            spam_types.append(part[5:])
+        else:
+            words.extend(_WORD_RE.findall(part))
+    return words, flags, spam_types
+
+
+def email_text(email) -> str:
+    """Текст письма для поиска: отправитель, тема и текст без разметки"""
+    body = _TAG_RE.sub(" ", email.get_content())
+    return f"{email.get_sender()} {email.get_subject()} {body}"
+
+
+def email_matches(email, query: str) -> bool:
+    """Подходит ли письмо под запрос (без индекса - для писем из архива)"""
+    words, flags, spam_types = parse_query(query)
+    for flag in flags:
+        check = FLAG_FILTERS.get(flag)
+        if flag == "read":
+            if not email.read:
+                return False
+        elif check is None or not check(None, email):
+            return False
+    for spam_type in spam_types:
+        if not email.is_spam or (email.spam_type or "").lower() != spam_type:
+            return False
+    if words:
+        tokens = tokenize(email_text(email))
+        for word in words:
+            if not any(token.startswith(word) for token in tokens):
+                return False
+    return True
+
+
+class MailSearchIndex:
+    """Инвертированный индекс писем одной системы почты"""
+
+    def __init__(self, email_system):
+        self.email_system = email_system
+        self._postings: Dict[str, Set[int]] = {}  # слово -> id писем
+        self._email_tokens: Dict[int, Set[str]] = {}  # id письма -> его слова
+        self._sorted_tokens: List[str] = []  # для поиска по префиксу
+        self._sorted_dirty = False
+        # Фильтры - множества id, поэтому запрос сводится к пересечениям
+        self._flags: Dict[str, Set[int]] = {name: set() for name in FLAG_FILTERS}
+        self._spam_types: Dict[str, Set[int]] = {}  # тип спама -> id писем
+        self._built = False
+        self._language = None
+        self._lock = threading.RLock()
+
+        email_system.add_listener(self._on_email_changed)
+        _indexes.add(self)
+        _register_language_callback()
+
+    def invalidate(self):
+        """Перестроить индекс при следующем поиске"""
+        with self._lock:
+            self._built = False
+
+    def _update_flags(self, email):
+        email_id = email.id
+        for name, check in FLAG_FILTERS.items():
+            if check(self.email_system, email):
+                self._flags[name].add(email_id)
+            else:
+                self._flags[name].discard(email_id)
+
+    def _add(self, email):
+        tokens = tokenize(email_text(email))
+        self._email_tokens[email.id] = tokens
+        for token in tokens:
+            postings = self._postings.get(token)
+            if postings is None:
+                self._postings[token] = {email.id}
+                self._sorted_dirty = True
+            else:
+                postings.add(email.id)
+
+        self._update_flags(email)
+        if email.is_spam:
+            self._spam_types.setdefault((email.spam_type or "").lower(), set()).add(email.id)
+
+    def _remove(self, email_id: int):
+        for token in self._email_tokens.pop(email_id, ()):
+            postings = self._postings.get(token)
+            if postings is None:
+                continue
+            postings.discard(email_id)
+            if not postings:
+                del self._postings[token]
+                self._sorted_dirty = True
+
+        for ids in self._flags.values():
+            ids.discard(email_id)
+        for spam_type, ids in list(self._spam_types.items()):
+            ids.discard(email_id)
+            if not ids:
+                del self._spam_types[spam_type]
+
+    def _ensure_built(self):
+        if self._built and self._language == translation.language:
+            return
+        self._postings = {}
+        self._email_tokens = {}
+        self._flags = {name: set() for name in FLAG_FILTERS}
+        self._spam_types = {}
+        for folder in self.email_system.FOLDERS:
+            for email in self.email_system.get_emails(folder):
+                self._add(email)
+        self._sorted_dirty = True
+        self._built = True
+        self._language = translation.language
+
+    def _on_email_changed(self, event: str, email):
+        with self._lock:
+            if not self._built:
+                return
+            if event == "added":
+                self._remove(email.id)
+                self._add(email)
+            elif event == "updated":
+                self._update_flags(email)
+            elif event == "removed":
+                self._remove(email.id)
+            elif event == "reset":
+                # Массовое удаление: убираем из индекса то, чего больше нет
+                for email_id in list(self._email_tokens):
+                    if self.email_system.get_email_by_id(email_id) is None:
+                        self._remove(email_id)
+
+    def _prefix_matches(self, prefix: str) -> Set[int]:
+        """id писем, в которых есть слово, начинающееся с prefix"""
+        if self._sorted_dirty:
+            self._sorted_tokens = sorted(self._postings)
+            self._sorted_dirty = False
+        tokens = self._sorted_tokens
+        result = set()
+        position = bisect_left(tokens, prefix)
+        while position < len(tokens) and tokens[position].startswith(prefix):
+            result |= self._postings[tokens[position]]
+            position += 1
+        return result
+
+    def search(self, query: str, folder: Optional[str] = "inbox") -> List[int]:
+        """id писем, подходящих под запрос (по порядку поступления)"""
+        with self._lock:
+            self._ensure_built()
+
+            words, flags, spam_types = parse_query(query)
+            matches = [self._prefix_matches(word) for word in words]
+            for name in flags:
+                if name in self._flags:
+                    matches.append(self._flags[name])
+                elif name == "read":
+                    matches.append(self._email_tokens.keys() - self._flags["unread"])
+                else:
+                    matches.append(set())
+            matches.extend(self._spam_types.get(spam_type, set()) for spam_type in spam_types)
+
+            if folder is not None:
+                matches.append(self.email_system.get_folder_ids(folder))
+            if not matches:
+                matches.append(self._email_tokens.keys())
+
+            # Начинаем с самого маленького множества
+            matches.sort(key=len)
+            ids = set(matches[0])
+            for other in matches[1:]:
+                if isinstance(other, set):
+                    ids.intersection_update(other)
+                else:
+                    # Представление ключей папки не копируем в множество
+                    ids = {email_id for email_id in ids if email_id in other}
+                if not ids:
+                    break
+            return sorted(ids)
+
+
+def _is_mvd(email_system, email) -> bool:
+    if email_system is None:
+        return email.is_mvd_email()
+    return email_system.is_mvd(email.id)
+
+
+# Фильтры is:<имя> - (система почты или None, письмо) -> подходит ли письмо
+FLAG_FILTERS = {
+    "unread": lambda email_system, email: not email.read,
+    "important": lambda email_system, email: email.important,
+    "mvd": _is_mvd,
+    "spam": lambda email_system, email: email.is_spam,
+}
+
+
+# Живые индексы; при смене языка все перестраиваются при следующем поиске
+_indexes = weakref.WeakSet()
+_callback_registered = False
+
+
+def _invalidate_all():
+    for index in list(_indexes):
+        index.invalidate()
+
+
+def _register_language_callback():
+    global _callback_registered
+    if not _callback_registered:
+        translation.on_language_changed(_invalidate_all)
+        _callback_registered = True
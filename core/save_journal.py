@@ -0,0 +1,367 @@
+# core/save_journal.py
+"""
+Журнал сохранений для GameState.
+
+Слот состоит из двух файлов:
+    saves/slot_N.json|.sav - компактный базовый снимок состояния
+                             (формат - core.serializers, см. saves.format)
+    saves/slot_N.journal   - дописываемый лог изменений (одна JSON-запись на строку)
+
+Каждая запись журнала содержит только то, что изменилось с прошлого сохранения:
+изменённые поля GameState, изменённые поля EmailSystem, добавленные/изменённые
+письма и id удалённых писем. Все операции записи идемпотентны (установка поля,
+upsert письма целиком, удаление по id), поэтому повторное применение журнала
+к уже уплотнённому снимку даёт тот же результат.
+
+Все записи идут через save_writer: снимок заменяется атомарно (с ротацией
+резервных копий в backups/), журнал дописывается с пакетным fsync.
+
+Когда журнал разрастается, он уплотняется в фоне: снимок и журнал читаются
+с диска, сливаются и записываются новым снимком. Живое состояние игры при
+этом не трогается.
+"""
+
+import json
+import os
+import threading
+from datetime import datetime
+from typing import Dict, Optional
+
+from core.save_migrations import SAVE_FORMAT_VERSION, get_format_version
+from core.save_writer import save_writer
+from core.serializers import SERIALIZERS, SaveSerializer, detect_serializer, get_serializer
+from core.slot_index import get_slot_index, text_checksum
+
+
+EMAIL_FOLDERS = ("inbox", "sent", "draft")
+
+
+class SaveJournal:
+    """Базовый снимок + журнал изменений одного слота"""
+
+    # Минимальный размер журнала (в байтах), после которого имеет смысл уплотнять
+    COMPACT_MIN_BYTES = 64 * 1024
+
+    def __init__(self, slot: int, saves_dir: str = "saves"):
+        self.slot = slot
+        self.saves_dir = saves_dir
+        self.journal_path = os.path.join(saves_dir, f"slot_{slot}.journal")
+        self.archive_path = os.path.join(saves_dir, f"slot_{slot}.archive")
+
+        # Блокировка защищает пару файлов слота от одновременной записи
+        self._lock = threading.RLock()
+        self._compact_thread: Optional[threading.Thread] = None
+
+        # Номер снимка: меняется при подготовке каждого полного сохранения,
+        # чтобы журнал не дописывали изменениями относительно чужого снимка
+        self.generation = 0
+        # Счётчик фактических записей снимка (для фонового уплотнения)
+        self._snapshot_writes = 0
+
+    def path_for(self, serializer: SaveSerializer) -> str:
+        """Путь к снимку слота в заданном формате"""
+        return os.path.join(self.saves_dir, f"slot_{self.slot}{serializer.extension}")
+
+    def current_serializer(self) -> SaveSerializer:
+        """Формат существующего снимка слота (или формат по умолчанию)"""
+        for serializer in SERIALIZERS.values():
+            if os.path.exists(self.path_for(serializer)):
+                return serializer
+        return get_serializer()
+
+    @property
+    def base_path(self) -> str:
+        """Существующий снимок слота (или путь для формата по умолчанию)"""
+        return self.path_for(self.current_serializer())
+
+    def exists(self) -> bool:
+        """Есть ли базовый снимок слота"""
+        return os.path.exists(self.base_path)
+
+    def new_generation(self) -> int:
+        """Начать новый снимок: журнал старого снимка больше не дописывается"""
+        with self._lock:
+            self.generation += 1
+            return self.generation
+
+    def invalidate(self, generation: int):
+        """Запись не удалась - следующее сохранение должно быть полным снимком"""
+        with self._lock:
+            if self.generation == generation:
+                self.generation += 1
+
+    @property
+    def index(self):
+        return get_slot_index(self.saves_dir)
+
+    def write_snapshot(self, data: dict, generation: int = None,
+                       serializer: SaveSerializer = None) -> Optional[str]:
+        """Записать полный снимок и сбросить журнал; возвращает контрольную сумму"""
+        if generation is not None and generation != self.generation:
+            # Уже подготовлен более новый снимок - этот можно не писать
+            return None
+        serializer = serializer or get_serializer()
+        content = serializer.dumps(data)
+        path = self.path_for(serializer)
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return None
+            # Резервная копия журнала сдвигается вместе с копией снимка
+            save_writer.rotate_backups(self.journal_path)
+            save_writer.write_atomic(path, content, backup=True)
+            save_writer.remove(self.journal_path)
+            # Снимок в другом формате больше не нужен
+            for other in SERIALIZERS.values():
+                other_path = self.path_for(other)
+                if other_path != path and os.path.exists(other_path):
+                    save_writer.rotate_backups(other_path)
+                    save_writer.remove(other_path)
+            self._snapshot_writes += 1
+        return text_checksum(content)
+
+    def rewrite(self, data: dict, serializer: SaveSerializer = None) -> str:
+        """Перезаписать слот готовыми данными (по умолчанию - в текущем формате слота)"""
+        if serializer is None:
+            serializer = self.current_serializer()
+        self.new_generation()
+        checksum = self.write_snapshot(data, serializer=serializer)
+        self.index.update(
+            self.slot,
+            format_version=get_format_version(data),
+            checksum=checksum,
+            first_name=data.get('first_name', ''),
+            last_name=data.get('last_name', ''),
+            day=data.get('day', 1),
+            money=data.get('money', 0)
+        )
+        return checksum
+
+    def append(self, delta: dict, generation: int = None) -> bool:
+        """Дописать запись об изменениях в журнал"""
+        line = json.dumps(delta, ensure_ascii=False, separators=(",", ":"))
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                # Изменения относятся к снимку, который уже заменён
+                return False
+            save_writer.append(self.journal_path, line + "\n")
+
+        if self.needs_compaction():
+            self.compact_async()
+        return True
+
+    def read(self) -> dict:
+        """Прочитать снимок и применить к нему журнал"""
+        with self._lock:
+            with open(self.base_path, "rb") as f:
+                content = f.read()
+            journal_text = self._read_journal_text()
+
+        entry = self.index.get(self.slot)
+        if entry and entry.get("checksum") and entry["checksum"] != text_checksum(content):
+            print(f"[СОХРАНЕНИЕ] Контрольная сумма слота {self.slot} не совпадает с индексом")
+
+        data = detect_serializer(content).loads(content)
+        return apply_deltas(data, self._parse_journal(journal_text))
+
+    def needs_compaction(self) -> bool:
+        """Журнал стал больше снимка - пора уплотнять"""
+        try:
+            journal_size = os.path.getsize(self.journal_path)
+        except OSError:
+            return False
+        if journal_size < self.COMPACT_MIN_BYTES:
+            return False
+        try:
+            base_size = os.path.getsize(self.base_path)
+        except OSError:
+            base_size = 0
+        return journal_size > base_size
+
+    def compact_async(self):
+        """Запустить уплотнение журнала в фоновом потоке"""
+        if self._compact_thread is not None and self._compact_thread.is_alive():
+            return
+        self._compact_thread = threading.Thread(
+            target=self.compact, name=f"save-compact-{self.slot}", daemon=True
+        )
+        self._compact_thread.start()
+
+    def compact(self):
+        """Слить журнал в новый базовый снимок"""
+        try:
+            with self._lock:
+                snapshot_writes = self._snapshot_writes
+                path = self.base_path
+                with open(path, "rb") as f:
+                    content = f.read()
+                journal_text = self._read_journal_text()
+
+            # Слияние и сериализация идут без блокировки - append не ждёт
+            # (снимок остаётся в том формате, в котором был записан)
+            serializer = detect_serializer(content)
+            data = apply_deltas(serializer.loads(content), self._parse_journal(journal_text))
+            content = serializer.dumps(data)
+
+            with self._lock:
+                if self._snapshot_writes != snapshot_writes:
+                    # Пока сливали, слот перезаписали полным снимком
+                    return
+                # Всё, что дописали во время слияния, переносим в новый журнал
+                tail = self._read_journal_text()[len(journal_text):]
+                save_writer.write_atomic(path, content)
+                self.index.update(self.slot, checksum=text_checksum(content))
+                if tail:
+                    save_writer.write_atomic(self.journal_path, tail)
+                else:
+                    save_writer.remove(self.journal_path)
+
+            print(f"[СОХРАНЕНИЕ] Журнал слота {self.slot} уплотнён")
+        except Exception as e:
+            print(f"[СОХРАНЕНИЕ] Ошибка уплотнения журнала слота {self.slot}: {e}")
+
+    def wait_compaction(self, timeout: float = None):
+        """Дождаться окончания фонового уплотнения"""
+        if self._compact_thread is not None:
+            self._compact_thread.join(timeout)
+
+    def _read_journal_text(self) -> str:
+        if not os.path.exists(self.journal_path):
+            return ""
+        with open(self.journal_path, "r", encoding="utf-8") as f:
+            return f.read()
+
+    @staticmethod
+    def _parse_journal(text: str):
+        for line in text.splitlines():
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                # Оборванная последняя строка после аварийного завершения
+                print("[СОХРАНЕНИЕ] Пропущена повреждённая запись журнала")
+
+
+class SaveJob:
+    """
+    Подготовленное сохранение слота.
+
+    Создаётся в потоке интерфейса (GameState.prepare_save) и содержит
+    неизменяемую копию данных, поэтому run() - сериализацию и запись на
+    диск - можно выполнять в любом потоке.
+    """
+
+    def __init__(self, journal: SaveJournal, generation: int,
+                 snapshot: Optional[dict] = None, delta: Optional[dict] = None,
+                 metadata: Optional[dict] = None, archive=None):
+        self.journal = journal
+        self.generation = generation
+        self.snapshot = snapshot
+        self.delta = delta
+        self.metadata = metadata or {}  # Сведения для индекса слотов
+        self.archive = archive  # Запись архива писем (ArchiveCommit) после снимка или журнала
+
+    @property
+    def slot(self) -> int:
+        return self.journal.slot
+
+    @property
+    def filename(self) -> str:
+        return self.journal.base_path
+
+    def run(self):
+        """Записать данные на диск"""
+        try:
+            metadata = dict(self.metadata)
+            if self.snapshot is not None:
+                checksum = self.journal.write_snapshot(self.snapshot, self.generation)
+                written = checksum is not None
+                metadata["checksum"] = checksum
+            else:
+                written = not self.delta or self.journal.append(self.delta, self.generation)
+                if not written:
+                    print(f"[СОХРАНЕНИЕ] Изменения для слота {self.slot} пропущены: снимок уже заменён")
+            if written and self.archive is not None:
+                self.archive.run()
+            if written:
+                self.journal.index.update(
+                    self.slot,
+                    format_version=SAVE_FORMAT_VERSION,
+                    saved_at=datetime.now().isoformat(timespec="seconds"),
+                    **metadata
+                )
+        except Exception:
+            # Неизвестно, что осталось на диске - следующее сохранение будет полным
+            self.journal.invalidate(self.generation)
+            raise
+
+
+def apply_deltas(data: dict, deltas):
+    """Применить записи журнала к словарю сохранения (по порядку)"""
+    deltas = list(deltas)
+    if not deltas:
+        return data
+
+    folders = None
+    email_data = data.get("email_system")
+    for delta in deltas:
+        data.update(delta.get("fields", {}))
+
+        emails = delta.get("emails")
+        if not emails:
+            continue
+
+        if folders is None:
+            if not isinstance(email_data, dict):
+                email_data = {folder: [] for folder in EMAIL_FOLDERS}
+            # Индексируем письма один раз на все записи журнала
+            folders = {
+                folder: {email.get("id"): email for email in email_data.get(folder, [])}
+                for folder in EMAIL_FOLDERS
+            }
+        email_data.update(emails.get("state", {}))
+
+        for email_id in emails.get("delete", []):
+            for folder_emails in folders.values():
+                folder_emails.pop(email_id, None)
+
+        for item in emails.get("upsert", []):
+            email = item["email"]
+            target = item["folder"]
+            for folder, folder_emails in folders.items():
+                if folder != target:
+                    folder_emails.pop(email["id"], None)
+            # dict сохраняет позицию существующего ключа - порядок писем не меняется
+            folders.setdefault(target, {})[email["id"]] = email
+
+    if folders is not None:
+        for folder, folder_emails in folders.items():
+            email_data[folder] = list(folder_emails.values())
+        data["email_system"] = email_data
+    return data
+
+
+def list_slots(saves_dir: str = "saves"):
+    """Номера слотов, для которых есть снимок"""
+    extensions = tuple(serializer.extension for serializer in SERIALIZERS.values())
+    slots = set()
+    if os.path.isdir(saves_dir):
+        for name in os.listdir(saves_dir):
+            stem, extension = os.path.splitext(name)
+            if extension in extensions and stem.startswith("slot_") and stem[5:].isdigit():
+                slots.add(int(stem[5:]))
+    return sorted(slots)
+
+
+# Журналы слотов живут всё время работы игры, чтобы блокировки были общими
+_journals: Dict[tuple, SaveJournal] = {}
+_journals_lock = threading.Lock()
+
+
+def get_save_journal(slot: int, saves_dir: str = "saves") -> SaveJournal:
+    """Получить журнал слота (один объект на слот)"""
+    with _journals_lock:
+        key = (saves_dir, slot)
+        if key not in _journals:
+            _journals[key] = SaveJournal(slot, saves_dir)
+        return _journals[key]
@@ -0,0 +1,184 @@
+# core/save_migrations.py
+"""
+Миграции формата сохранений.
+
+Каждый снимок хранит поле format_version. При загрузке выполняются только
+те шаги, которые нужны, чтобы довести сохранение до SAVE_FORMAT_VERSION;
+после этого слот один раз перезаписывается, и следующие загрузки уже
+ничего не исправляют.
+
+Новая миграция добавляется функцией с декоратором @migration(<из версии>),
+которая изменяет словарь сохранения на месте, и увеличением
+SAVE_FORMAT_VERSION.
+"""
+
+import json
+import os
+from typing import Callable, Dict, Tuple
+
+from core.skills import SKILLS, SKILL_IDS
+from simple_translation import translation
+
+
+# Текущая версия формата сохранений
+SAVE_FORMAT_VERSION = 2
+
+# Версия сохранений, созданных до появления поля format_version
+LEGACY_FORMAT_VERSION = 0
+
+# из версии -> функция(data, slot), переводящая сохранение в версию + 1
+MIGRATIONS: Dict[int, Callable[[dict, int], None]] = {}
+
+
+def migration(from_version: int):
+    """Зарегистрировать шаг миграции from_version -> from_version + 1"""
+    def register(func):
+        MIGRATIONS[from_version] = func
+        return func
+    return register
+
+
+def get_format_version(data: dict) -> int:
+    """Версия формата сохранения"""
+    return data.get("format_version", LEGACY_FORMAT_VERSION)
+
+
+def migrate(data: dict, slot: int = 0) -> Tuple[dict, bool]:
+    """Довести сохранение до текущей версии; возвращает (данные, были ли изменения)"""
+    version = get_format_version(data)
+    if version > SAVE_FORMAT_VERSION:
+        print(f"[СОХРАНЕНИЕ] Слот {slot} сохранён более новой версией игры (формат {version})")
+        return data, False
+
+    migrated = False
+    while version < SAVE_FORMAT_VERSION:
+        step = MIGRATIONS.get(version)
+        if step is None:
+            raise ValueError(f"Нет миграции сохранений с версии {version}")
+        step(data, slot)
+        version += 1
+        data["format_version"] = version
+        migrated = True
+        print(f"[СОХРАНЕНИЕ] Слот {slot} обновлён до формата {version}")
+    return data, migrated
+
+
+def _special_emails_config() -> dict:
+    return {
+        "error_message": {
+            "enabled": True,
+            "required_tasks": 1,
+            "required_time": 30,
+            "description": translation.t("game_state.special_email_config", "Письмо ERROR - отправляется через 30 минут игрового времени после выполнения первой задачи")
+        },
+        "mvd_mission_1_intro": {
+            "enabled": True,
+            "required_tasks": 1,
+            "required_time": 30,
+            "description": translation.t("game_state.special_email_config", "Первое задание МВД - отправляется через 30 минут игрового времени после выполнения первой задачи")
+        }
+    }
+
+
+@migration(0)
+def _migrate_legacy(data: dict, slot: int):
+    """Старые сохранения: имя одной строкой, английские ключи навыков, 1984 год"""
+    # Имя сотрудника одной строкой
+    if data.get('player_name') and not data.get('first_name'):
+        parts = data['player_name'].split()
+        data['first_name'] = parts[0] if len(parts) > 0 else ""
+        data['last_name'] = parts[1] if len(parts) > 1 else ""
+
+    # Названия навыков
+    if 'skills' in data:
+        old_to_new = {
+            'hacking': translation.t("game_state.skill_hacking", "Взлом"),
+            'social_engineering': translation.t("game_state.skill_social_engineering", "Социальная инженерия"),
+            'programming': translation.t("game_state.skill_programming", "Программирование"),
+            'stealth': translation.t("game_state.skill_stealth", "Скрытность"),
+            'analysis': translation.t("game_state.skill_analysis", "Анализ"),
+            'network_security': translation.t("game_state.skill_network_security", "Сетевая безопасность")
+        }
+        skills = {old_to_new.get(key, key): value for key, value in data['skills'].items()}
+
+        # Недостающие навыки
+        for skill in (old_to_new['analysis'], old_to_new['network_security']):
+            skills.setdefault(skill, 1)
+        data['skills'] = skills
+
+    # Недостающие поля
+    default_fields = [
+        ('shift_time', 0),
+        ('energy', 100),
+        ('stress', 0),
+        ('time_paused', False),
+        ('error_email_sent', False),
+        ('mvd_mission_email_sent', False),
+        ('welcome_email_sent', False),
+        ('save_slot', slot),
+        ('last_hour_checked', 9),
+        ('spam_cooldown', {}),
+        ('spam_types_sent_today', []),
+        ('cutscene_shown', False),
+        ('special_emails_config', _special_emails_config())
+    ]
+    for field_name, default_value in default_fields:
+        data.setdefault(field_name, default_value)
+
+    # Игровое время
+    if 'game_time' not in data:
+        data['game_time'] = {
+            'current_hour': 9,
+            'current_minute': 0,
+            'day': data.get('day', 1),
+            'month': 1,
+            'year': 2140,
+            'is_paused': False,
+            'time_speed': 1.0,
+            'workday_start': 9,
+            'workday_end': 18
+        }
+    else:
+        if data['game_time'].get('year', 1984) == 1984:
+            data['game_time']['year'] = 2140
+        data['game_time']['time_speed'] = 1.0
+
+
+def _skill_name_lookup() -> Dict[str, str]:
+    """Название навыка на любом из языков (в нижнем регистре) -> id навыка"""
+    lookup = {}
+    for skill_id, (key, default) in SKILLS.items():
+        lookup[skill_id] = skill_id
+        lookup[default.lower()] = skill_id
+        lookup[translation.t(key, default=default).lower()] = skill_id
+
+    translations_dir = os.path.join(translation.get_base_path(), "translations")
+    if not os.path.isdir(translations_dir):
+        return lookup
+    for name in os.listdir(translations_dir):
+        if not name.endswith(".json"):
+            continue
+        try:
+            with open(os.path.join(translations_dir, name), "r", encoding="utf-8") as f:
+                names = json.load(f).get("game_state", {})
+        except (OSError, ValueError):
+            continue
+        for skill_id, (key, _default) in SKILLS.items():
+            value = names.get(key.split(".", 1)[1])
+            if isinstance(value, str):
+                lookup[value.lower()] = skill_id
+    return lookup
+
+
+@migration(1)
+def _migrate_skill_ids(data: dict, slot: int):
+    """Навыки под переведёнными названиями -> постоянные id"""
+    lookup = _skill_name_lookup()
+    skills = {}
+    for name, level in data.get('skills', {}).items():
+        skill_id = lookup.get(name.strip().lower(), name)
+        # Осиротевшие после смены языка дубликаты: берём больший уровень
+        skills[skill_id] = max(level, skills.get(skill_id, level))
+    for skill_id in SKILL_IDS:
+        skills.setdefault(skill_id, 1)
+    data['skills'] = skills
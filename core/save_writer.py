@@ -0,0 +1,151 @@
+# core/save_writer.py
+"""
+Надёжная запись файлов сохранений и конфигурации.
+
+- write_atomic: запись во временный файл + fsync + атомарное переименование,
+  поэтому при падении игры на диске остаётся либо старый, либо новый файл,
+  но никогда не обрезанный.
+- append: дозапись в журнал без немедленного fsync; fsync выполняется пачкой
+  не чаще раза в sync_interval секунд (или явно через sync()). Если новых
+  дозаписей больше нет, отложенный sync() всё равно сработает через
+  sync_interval после первой несброшенной, поэтому хвост журнала не
+  остаётся без fsync до выхода из игры.
+- Ротация резервных копий: перед перезаписью файл копируется в backups/
+  как <имя>.1.bak, старые копии сдвигаются до max_backups.
+"""
+
+import os
+import shutil
+import threading
+import time
+from typing import Optional, Union
+
+
+class SaveWriter:
+    """Атомарная запись файлов с пакетным fsync и ротацией резервных копий"""
+
+    def __init__(self, backups_dir: str = "backups", max_backups: int = 3, sync_interval: float = 2.0):
+        self.backups_dir = backups_dir
+        self.max_backups = max_backups
+        self.sync_interval = sync_interval
+
+        self._lock = threading.Lock()
+        self._pending_sync = set()  # Файлы, дописанные после последнего fsync
+        self._last_sync = time.monotonic()
+        self._sync_timer: Optional[threading.Timer] = None  # Отложенный sync() для хвоста
+
+    def write_atomic(self, path: str, content: Union[str, bytes], backup: bool = False, sync: bool = True):
+        """Атомарно заменить содержимое файла (текст или двоичные данные)"""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        if isinstance(content, str):
+            content = content.encode("utf-8")
+
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(content)
+            f.flush()
+            if sync:
+                os.fsync(f.fileno())
+
+        if backup:
+            self.rotate_backups(path)
+
+        os.replace(tmp_path, path)
+        if sync:
+            self._sync_directory(directory)
+
+        with self._lock:
+            self._pending_sync.discard(path)
+
+    def append(self, path: str, content: Union[str, bytes]):
+        """Дописать текст или двоичные данные в конец файла; fsync выполняется пачкой"""
+        if isinstance(content, str):
+            content = content.encode("utf-8")
+        with open(path, "ab") as f:
+            f.write(content)
+
+        with self._lock:
+            self._pending_sync.add(path)
+            elapsed = time.monotonic() - self._last_sync
+            due = elapsed >= self.sync_interval
+            if not due and self._sync_timer is None:
+                # Последняя дозапись тоже попадёт на диск не позже чем через sync_interval
+                self._sync_timer = threading.Timer(self.sync_interval - elapsed, self.sync)
+                self._sync_timer.daemon = True
+                self._sync_timer.start()
+        if due:
+            self.sync()
+
+    def sync(self):
+        """Сбросить на диск все дописанные с прошлого раза файлы"""
+        with self._lock:
+            paths = list(self._pending_sync)
+            self._pending_sync.clear()
+            self._last_sync = time.monotonic()
+            timer, self._sync_timer = self._sync_timer, None
+        if timer is not None and timer is not threading.current_thread():
+            timer.cancel()
+
+        for path in paths:
+            try:
+                with open(path, "a", encoding="utf-8") as f:
+                    os.fsync(f.fileno())
+            except OSError as e:
+                print(f"[СОХРАНЕНИЕ] Не удалось выполнить fsync для {path}: {e}")
+
+    def remove(self, path: str):
+        """Удалить файл (если есть)"""
+        with self._lock:
+            self._pending_sync.discard(path)
+        if os.path.exists(path):
+            os.remove(path)
+
+    def rotate_backups(self, path: str):
+        """Сдвинуть резервные копии файла и положить текущую версию первой"""
+        if self.max_backups <= 0:
+            return
+        os.makedirs(self.backups_dir, exist_ok=True)
+
+        name = os.path.basename(path)
+
+        def backup_path(index):
+            return os.path.join(self.backups_dir, f"{name}.{index}.bak")
+
+        # Копии сдвигаются, даже если исходного файла нет, чтобы индексы
+        # копий снимка и журнала одного слота оставались согласованными
+        for index in range(self.max_backups - 1, 0, -1):
+            src = backup_path(index)
+            dst = backup_path(index + 1)
+            if os.path.exists(src):
+                os.replace(src, dst)
+            elif os.path.exists(dst):
+                os.remove(dst)
+
+        first = backup_path(1)
+        if os.path.exists(path):
+            shutil.copy2(path, first)
+        elif os.path.exists(first):
+            os.remove(first)
+
+    @staticmethod
+    def _sync_directory(directory: str):
+        """fsync каталога, чтобы переименование пережило сбой питания (только POSIX)"""
+        if os.name != "posix":
+            return
+        try:
+            fd = os.open(directory or ".", os.O_RDONLY)
+        except OSError:
+            return
+        try:
+            os.fsync(fd)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+
+# Общий объект для использования везде
+save_writer = SaveWriter()
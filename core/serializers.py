@@ -0,0 +1,287 @@
+# core/serializers.py
+"""
+Сериализаторы сохранений.
+
+Между GameState/EmailSystem (to_dict/from_dict) и диском стоит сменный
+сериализатор:
+    json   - UTF-8 JSON, читается человеком, используется для экспорта
+    binary - компактный двоичный формат со схемой версий (см. ниже)
+
+Формат читается по содержимому файла (detect_serializer), поэтому слоты
+в разных форматах загружаются одинаково; формат новых снимков задаётся
+настройкой saves.format в config.json.
+
+Двоичный формат:
+    заголовок: b"OHSV" + версия схемы (uint16 LE) + флаги (uint8)
+    флаг 0x01 - тело сжато zlib
+    тело: таблица строк + значение
+
+Все строки (ключи словарей, ключи переводов, даты) записываются один раз
+в таблицу строк и дальше упоминаются номером. Списки словарей с одинаковым
+набором ключей (письма в папках) записываются как таблица: ключи один раз,
+затем только значения по строкам.
+"""
+
+import json
+import struct
+import zlib
+from typing import Dict
+
+
+BINARY_MAGIC = b"OHSV"
+BINARY_SCHEMA_VERSION = 1
+FLAG_ZLIB = 0x01
+
+_HEADER = struct.Struct("<HB")
+_FLOAT = struct.Struct("<d")
+
+# Теги значений двоичного формата
+_T_NONE = 0
+_T_FALSE = 1
+_T_TRUE = 2
+_T_INT = 3
+_T_FLOAT = 4
+_T_STR = 5
+_T_LIST = 6
+_T_DICT = 7
+_T_RECORDS = 8
+
+
+class SaveSerializer:
+    """Базовый класс сериализатора сохранений"""
+
+    name = ""
+    extension = ""
+
+    def dumps(self, data: dict) -> bytes:
+        raise NotImplementedError
+
+    def loads(self, raw: bytes) -> dict:
+        raise NotImplementedError
+
+
+class JsonSerializer(SaveSerializer):
+    """UTF-8 JSON (компактный; pretty=True - для экспорта)"""
+
+    name = "json"
+    extension = ".json"
+
+    def __init__(self, pretty: bool = False):
+        self.pretty = pretty
+
+    def dumps(self, data: dict) -> bytes:
+        if self.pretty:
+            text = json.dumps(data, ensure_ascii=False, indent=2)
+        else:
+            text = json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+        return text.encode("utf-8")
+
+    def loads(self, raw: bytes) -> dict:
+        return json.loads(raw.decode("utf-8-sig"))
+
+
+class BinarySerializer(SaveSerializer):
+    """Компактный двоичный формат с таблицей строк и версией схемы"""
+
+    name = "binary"
+    extension = ".sav"
+
+    def __init__(self, compress: bool = True):
+        self.compress = compress
+
+    def dumps(self, data: dict) -> bytes:
+        strings: Dict[str, int] = {}
+        body = bytearray()
+        _encode_value(data, body, strings)
+
+        payload = bytearray()
+        _write_varint(payload, len(strings))
+        for text in strings:  # dict сохраняет порядок добавления = номера строк
+            encoded = text.encode("utf-8")
+            _write_varint(payload, len(encoded))
+            payload += encoded
+        payload += body
+
+        flags = 0
+        if self.compress:
+            payload = zlib.compress(bytes(payload), 6)
+            flags |= FLAG_ZLIB
+
+        return BINARY_MAGIC + _HEADER.pack(BINARY_SCHEMA_VERSION, flags) + bytes(payload)
+
+    def loads(self, raw: bytes) -> dict:
+        if raw[:4] != BINARY_MAGIC:
+            raise ValueError("Файл не является двоичным сохранением")
+        version, flags = _HEADER.unpack_from(raw, 4)
+        if version > BINARY_SCHEMA_VERSION:
+            raise ValueError(f"Сохранение создано более новой версией игры (схема {version})")
+
+        payload = raw[4 + _HEADER.size:]
+        if flags & FLAG_ZLIB:
+            payload = zlib.decompress(payload)
+
+        decoder = _Decoder(payload)
+        count = decoder.varint()
+        strings = []
+        for _ in range(count):
+            length = decoder.varint()
+            strings.append(payload[decoder.pos:decoder.pos + length].decode("utf-8"))
+            decoder.pos += length
+        decoder.strings = strings
+        return decoder.value()
+
+
+def _write_varint(out: bytearray, value: int):
+    while value > 0x7f:
+        out.append((value & 0x7f) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _string_id(text: str, strings: Dict[str, int]) -> int:
+    index = strings.get(text)
+    if index is None:
+        index = len(strings)
+        strings[text] = index
+    return index
+
+
+def _encode_value(value, out: bytearray, strings: Dict[str, int]):
+    # bool проверяется раньше int: True/False тоже int
+    if value is None:
+        out.append(_T_NONE)
+    elif value is True:
+        out.append(_T_TRUE)
+    elif value is False:
+        out.append(_T_FALSE)
+    elif isinstance(value, int):
+        out.append(_T_INT)
+        _write_varint(out, (value << 1) if value >= 0 else ((-value << 1) - 1))
+    elif isinstance(value, float):
+        out.append(_T_FLOAT)
+        out += _FLOAT.pack(value)
+    elif isinstance(value, str):
+        out.append(_T_STR)
+        _write_varint(out, _string_id(value, strings))
+    elif isinstance(value, dict):
+        out.append(_T_DICT)
+        _write_varint(out, len(value))
+        for key, item in value.items():
+            _write_varint(out, _string_id(str(key), strings))
+            _encode_value(item, out, strings)
+    elif isinstance(value, (list, tuple, set)):
+        _encode_sequence(list(value), out, strings)
+    else:
+        raise TypeError(f"Неподдерживаемый тип в сохранении: {type(value).__name__}")
+
+
+def _encode_sequence(items: list, out: bytearray, strings: Dict[str, int]):
+    keys = None
+    if len(items) > 1 and isinstance(items[0], dict):
+        keys = tuple(items[0])
+        for item in items:
+            if not isinstance(item, dict) or tuple(item) != keys:
+                keys = None
+                break
+
+    if keys is None:
+        out.append(_T_LIST)
+        _write_varint(out, len(items))
+        for item in items:
+            _encode_value(item, out, strings)
+        return
+
+    # Таблица записей: ключи один раз, дальше только значения
+    out.append(_T_RECORDS)
+    _write_varint(out, len(items))
+    _write_varint(out, len(keys))
+    for key in keys:
+        _write_varint(out, _string_id(str(key), strings))
+    for item in items:
+        for item_value in item.values():
+            _encode_value(item_value, out, strings)
+
+
+class _Decoder:
+    """Разбор тела двоичного сохранения"""
+
+    def __init__(self, payload: bytes):
+        self.payload = payload
+        self.pos = 0
+        self.strings = []
+
+    def varint(self) -> int:
+        payload = self.payload
+        result = 0
+        shift = 0
+        while True:
+            byte = payload[self.pos]
+            self.pos += 1
+            result |= (byte & 0x7f) << shift
+            if byte < 0x80:
+                return result
+            shift += 7
+
+    def value(self):
+        tag = self.payload[self.pos]
+        self.pos += 1
+
+        if tag == _T_STR:
+            return self.strings[self.varint()]
+        if tag == _T_INT:
+            raw = self.varint()
+            return (raw >> 1) if not raw & 1 else -((raw + 1) >> 1)
+        if tag == _T_NONE:
+            return None
+        if tag == _T_TRUE:
+            return True
+        if tag == _T_FALSE:
+            return False
+        if tag == _T_FLOAT:
+            result = _FLOAT.unpack_from(self.payload, self.pos)[0]
+            self.pos += _FLOAT.size
+            return result
+        if tag == _T_DICT:
+            count = self.varint()
+            result = {}
+            for _ in range(count):
+                key = self.strings[self.varint()]
+                result[key] = self.value()
+            return result
+        if tag == _T_LIST:
+            return [self.value() for _ in range(self.varint())]
+        if tag == _T_RECORDS:
+            rows = self.varint()
+            keys = [self.strings[self.varint()] for _ in range(self.varint())]
+            value = self.value
+            return [{key: value() for key in keys} for _ in range(rows)]
+        raise ValueError(f"Повреждённое сохранение: неизвестный тег {tag}")
+
+
+SERIALIZERS = {
+    JsonSerializer.name: JsonSerializer(),
+    BinarySerializer.name: BinarySerializer(),
+}
+
+_default_format = JsonSerializer.name
+
+
+def get_serializer(name: str = None) -> SaveSerializer:
+    """Сериализатор по имени (по умолчанию - формат из настроек)"""
+    return SERIALIZERS.get(name or _default_format, SERIALIZERS[JsonSerializer.name])
+
+
+def set_default_format(name: str):
+    """Выбрать формат новых снимков ("json" или "binary")"""
+    global _default_format
+    if name not in SERIALIZERS:
+        print(f"[СОХРАНЕНИЕ] Неизвестный формат сохранений: {name}, используется json")
+        name = JsonSerializer.name
+    _default_format = name
+
+
+def detect_serializer(raw: bytes) -> SaveSerializer:
+    """Определить формат по содержимому файла"""
+    if raw[:4] == BINARY_MAGIC:
+        return SERIALIZERS[BinarySerializer.name]
+    return SERIALIZERS[JsonSerializer.name]
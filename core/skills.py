@@ -0,0 +1,39 @@
+# core/skills.py
+"""
+Навыки сотрудника.
+
+В GameState.skills навыки хранятся под постоянными id (hacking, stealth, ...),
+не зависящими от языка. Название получается через перевод только при
+отображении, поэтому смена языка не трогает состояние, а сохранения
+переносятся между языками.
+"""
+
+from typing import Dict
+
+from simple_translation import translation
+
+
+# id навыка -> (ключ перевода названия, название по умолчанию)
+SKILLS = {
+    "hacking": ("game_state.skill_hacking", "Взлом"),
+    "social_engineering": ("game_state.skill_social_engineering", "Социальная инженерия"),
+    "programming": ("game_state.skill_programming", "Программирование"),
+    "stealth": ("game_state.skill_stealth", "Скрытность"),
+    "analysis": ("game_state.skill_analysis", "Анализ"),
+    "network_security": ("game_state.skill_network_security", "Сетевая безопасность"),
+}
+
+SKILL_IDS = tuple(SKILLS)
+
+
+def default_skills() -> Dict[str, int]:
+    """Навыки нового сотрудника"""
+    return {skill_id: 1 for skill_id in SKILL_IDS}
+
+
+def get_skill_name(skill_id: str) -> str:
+    """Название навыка на текущем языке"""
+    if skill_id not in SKILLS:
+        return skill_id
+    key, default = SKILLS[skill_id]
+    return translation.t(key, default=default)
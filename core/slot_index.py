@@ -0,0 +1,99 @@
+# core/slot_index.py
+"""
+Индекс слотов сохранений (saves/index.json).
+
+Хранит краткие сведения о каждом слоте - имя сотрудника, день, баланс,
+время сохранения, версию формата и контрольную сумму снимка, - чтобы
+диалоги загрузки/сохранения не разбирали полные файлы слотов.
+Индекс обновляется при каждом сохранении (SaveJob.run) и при уплотнении
+журнала.
+"""
+
+import json
+import os
+import threading
+import zlib
+from typing import Dict, Optional, Union
+
+from core.save_writer import save_writer
+
+
+def text_checksum(content: Union[str, bytes]) -> str:
+    """Контрольная сумма содержимого снимка"""
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+    return f"{zlib.crc32(content) & 0xffffffff:08x}"
+
+
+class SlotIndex:
+    """Индекс метаданных слотов сохранений"""
+
+    def __init__(self, saves_dir: str = "saves"):
+        self.saves_dir = saves_dir
+        self.path = os.path.join(saves_dir, "index.json")
+
+        self._lock = threading.Lock()
+        self._entries: Optional[Dict[str, dict]] = None
+        self._mtime = None
+
+    def _load(self):
+        """Прочитать индекс с диска, если он изменился"""
+        try:
+            mtime = os.path.getmtime(self.path)
+        except OSError:
+            mtime = None
+
+        if self._entries is not None and mtime == self._mtime:
+            return
+
+        entries = {}
+        if mtime is not None:
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    entries = json.load(f).get("slots", {})
+            except Exception as e:
+                print(f"[СОХРАНЕНИЕ] Индекс слотов повреждён, будет пересобран: {e}")
+        self._entries = entries
+        self._mtime = mtime
+
+    def _write(self):
+        text = json.dumps({"slots": self._entries}, ensure_ascii=False, indent=2)
+        save_writer.write_atomic(self.path, text, sync=False)
+        try:
+            self._mtime = os.path.getmtime(self.path)
+        except OSError:
+            self._mtime = None
+
+    def get(self, slot: int) -> Optional[dict]:
+        """Сведения о слоте (или None, если слот не проиндексирован)"""
+        with self._lock:
+            self._load()
+            entry = self._entries.get(str(slot))
+            return dict(entry) if entry else None
+
+    def update(self, slot: int, **fields):
+        """Обновить сведения о слоте"""
+        with self._lock:
+            self._load()
+            entry = self._entries.setdefault(str(slot), {})
+            entry.update(fields)
+            self._write()
+
+    def remove(self, slot: int):
+        """Убрать слот из индекса"""
+        with self._lock:
+            self._load()
+            if self._entries.pop(str(slot), None) is not None:
+                self._write()
+
+
+_indexes: Dict[str, SlotIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_slot_index(saves_dir: str = "saves") -> SlotIndex:
+    """Получить индекс слотов каталога сохранений"""
+    with _indexes_lock:
+        if saves_dir not in _indexes:
+            _indexes[saves_dir] = SlotIndex(saves_dir)
+        return _indexes[saves_dir]
@@ -6,6 +6,10 @@ from PySide6.QtWidgets import *
 from PySide6.QtCore import *
 from PySide6.QtGui import *
 
+from ui.animation_driver import animation_driver
+from ui.particles import ParticleField
+from ui.quality_governor import quality_governor, timed_paint
+
 class HolographicSphere:
     """Голографическая сфера с улучшенными эффектами"""
     def __init__(self, x, y, radius):
@@ -169,7 +173,7 @@ class IntroScreen(QWidget):
         
         # Элементы
         self.sphere = None
-        self.particles = []
+        self.particles = None
         self.scan_lines = []
         self.grid_dots = []
         
@@ -197,9 +201,8 @@ class IntroScreen(QWidget):
         self.message_chars_typed = 0
         self.typing_speed = 2
         
-        # Таймеры
-        self.animation_timer = QTimer()
-        self.animation_timer.timeout.connect(self.update_animation)
+        # Таймеры (кадры анимации - в общем драйвере, их время учитывает регулятор качества)
+        self.animation_timer = animation_driver.register(self, self.update_animation, 16, start=False)
         
         self.message_timer = QTimer()
         self.message_timer.timeout.connect(self.update_message)
@@ -258,24 +261,18 @@ class IntroScreen(QWidget):
         # Создание голографической сферы
         self.sphere = HolographicSphere(center_x, center_y, 120)
         
-        # Создание частиц
-        self.particles = []
-        particle_count = min(100, (self.width() * self.height()) // 5000)
-        for _ in range(particle_count):
-            self.particles.append({
-                'x': random.randint(0, self.width()),
-                'y': random.randint(0, self.height()),
-                'size': random.uniform(1.0, 2.5),
-                'speed_x': random.uniform(-0.5, 0.5),
-                'speed_y': random.uniform(-0.5, 0.5),
-                'color': random.choice([
-                    QColor(0, 120, 255, 100),
-                    QColor(0, 180, 255, 80),
-                    QColor(100, 220, 255, 60),
-                    QColor(200, 240, 255, 40)
-                ]),
-                'phase': random.uniform(0, math.pi * 2)
-            })
+        # Создание частиц: отражаются от краёв и мерцают
+        self.particle_base = min(100, (self.width() * self.height()) // 5000)
+        particle_count = quality_governor.particle_count(self.particle_base)
+        palette = [
+            QColor(0, 120, 255, 100),
+            QColor(0, 180, 255, 80),
+            QColor(100, 220, 255, 60),
+            QColor(200, 240, 255, 40)
+        ]
+        self.particles = ParticleField(particle_count, self.width(), self.height(), palette,
+                                       size=(1.0, 2.5), alpha=None, speed=(0.0, 0.7),
+                                       lifetime=None, bounce=True, flicker=0.3)
             
         # Инициализация точек сетки
         self.init_grid_dots()
@@ -311,7 +308,7 @@ class IntroScreen(QWidget):
         self.message_timer.stop()
         self.fade_timer.stop()
         
-        self.particles.clear()
+        self.particles.set_count(0)
         self.scan_lines.clear()
         self.grid_dots.clear()
         self.sphere = None
@@ -342,16 +339,8 @@ class IntroScreen(QWidget):
             self.sphere.update()
             
         # Обновление частиц
-        for particle in self.particles:
-            particle['x'] += particle['speed_x']
-            particle['y'] += particle['speed_y']
-            particle['phase'] += 0.02
-            
-            # Отражение от границ
-            if particle['x'] < 0 or particle['x'] > self.width():
-                particle['speed_x'] *= -1
-            if particle['y'] < 0 or particle['y'] > self.height():
-                particle['speed_y'] *= -1
+        self.particles.set_count(quality_governor.particle_count(self.particle_base))
+        self.particles.step(self.width(), self.height())
                 
         # Обновление точек сетки
         for dot in self.grid_dots:
@@ -393,6 +382,7 @@ class IntroScreen(QWidget):
                     self.message_chars_typed = 0
                     self.message_progress = 0
                     
+    @timed_paint
     def paintEvent(self, event):
         """Отрисовка интерфейса"""
         if not self.is_running:
@@ -448,14 +438,7 @@ class IntroScreen(QWidget):
             
     def draw_particles(self, painter):
         """Отрисовка частиц"""
-        for particle in self.particles:
-            # Мерцание
-            alpha = int(particle['color'].alpha() * (0.7 + 0.3 * math.sin(particle['phase'])))
-            color = QColor(particle['color'])
-            color.setAlpha(alpha)
-            
-            painter.setPen(QPen(color, particle['size']))
-            painter.drawPoint(int(particle['x']), int(particle['y']))
+        self.particles.draw(painter)
             
     def draw_scan_lines(self, painter):
         """Отрисовка сканирующих линий"""
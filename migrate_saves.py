@@ -0,0 +1,66 @@
+# migrate_saves.py
+"""
+Пакетная миграция сохранений до текущего формата.
+
+    python migrate_saves.py                   - все слоты из saves/
+    python migrate_saves.py --saves old_saves - другой каталог
+    python migrate_saves.py --dry-run         - только показать версии
+
+Каждый устаревший слот проходит нужные шаги из core.save_migrations и
+перезаписывается (старый снимок уходит в backups/).
+"""
+
+import argparse
+import json
+import sys
+
+from core.save_journal import get_save_journal, list_slots
+from core.save_migrations import SAVE_FORMAT_VERSION, get_format_version, migrate
+from simple_translation import translation
+
+
+def load_language(config_path: str = "config.json"):
+    """Язык игры из конфигурации (в нём записываются названия навыков)"""
+    try:
+        with open(config_path, "r", encoding="utf-8") as f:
+            return json.load(f).get("game", {}).get("language", "ru")
+    except (OSError, ValueError):
+        return "ru"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Миграция сохранений Office Hacker")
+    parser.add_argument("--saves", default="saves", help="каталог сохранений")
+    parser.add_argument("--dry-run", action="store_true", help="ничего не записывать")
+    args = parser.parse_args(argv)
+
+    translation.load_translations(load_language())
+
+    slots = list_slots(args.saves)
+    if not slots:
+        print("Сохранения не найдены")
+        return 0
+
+    errors = 0
+    for slot in slots:
+        journal = get_save_journal(slot, args.saves)
+        try:
+            data = journal.read()
+            version = get_format_version(data)
+            if version >= SAVE_FORMAT_VERSION:
+                print(f"Слот {slot}: формат {version}, миграция не нужна")
+                continue
+            if args.dry_run:
+                print(f"Слот {slot}: формат {version} -> {SAVE_FORMAT_VERSION}")
+                continue
+            data, migrated = migrate(data, slot)
+            if migrated:
+                journal.rewrite(data)
+        except Exception as e:
+            errors += 1
+            print(f"Слот {slot}: ошибка - {e}")
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,9 +1,15 @@
 # simple_translation.py
 
-import json
 import os
 import sys
 
+from translation_catalog import catalog, compile_formats, flatten_translations
+
+
+# Отличает "ключа нет" от значения None
+_MISSING = object()
+
+
 class SimpleTranslation:
     """ПРОСТЕЙШИЙ менеджер переводов"""
     
@@ -13,6 +19,26 @@ class SimpleTranslation:
         self.language = "ru"
         self.language_changed_callbacks = []
     
+    @property
+    def translations(self):
+        """Дерево переводов текущего языка"""
+        return self._translations
+    
+    @translations.setter
+    def translations(self, tree):
+        # Дерево компилируется один раз при загрузке языка
+        self._translations = tree
+        self._flat = flatten_translations(tree)
+        self._formats = compile_formats(self._flat)
+    
+    def _notify_language_changed(self):
+        """Вызвать коллбэки для обновления UI"""
+        for callback in self.language_changed_callbacks:
+            try:
+                callback()
+            except Exception as e:
+                print(f"❌ Ошибка в коллбэке: {e}")
+    
     def get_base_path(self):
         """Получить базовый путь (работает и в exe и в исходниках)"""
         if hasattr(sys, '_MEIPASS'):
@@ -24,47 +50,37 @@ class SimpleTranslation:
         return base_path
     
     def load_translations(self, language):
-        """Загрузить переводы из файла"""
-        base_path = self.get_base_path()
-        
-        # Пробуем разные пути
-        possible_paths = [
-            os.path.join(base_path, "translations", f"{language}.json"),
-            os.path.join(os.path.dirname(base_path), "translations", f"{language}.json"),
-            os.path.join(os.getcwd(), "translations", f"{language}.json"),
-            os.path.join(os.path.dirname(sys.executable), "translations", f"{language}.json"),
-        ]
-        
-        if hasattr(sys, 'frozen'):
-            # Добавляем путь рядом с exe файлом
-            exe_dir = os.path.dirname(sys.executable)
-            possible_paths.append(os.path.join(exe_dir, "translations", f"{language}.json"))
-            possible_paths.append(os.path.join(exe_dir, f"{language}.json"))
-        
-        print(f"📂 Ищу файлы переводов для языка: {language}")
+        """Загрузить переводы (из каталога языков: без диска, если язык уже загружен)"""
+        previous = self.language
+        try:
+            compiled = catalog.get(language)
+        except Exception as e:
+            print(f"❌ Ошибка загрузки переводов {language}: {e}")
+            compiled = None
         
-        for file_path in possible_paths:
-            if os.path.exists(file_path):
-                try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        self.translations = json.load(f)
-                    self.language = language
-                    print(f"✅ Загружен язык: {language} из {file_path}")
-                    
-                    # Вызываем коллбэки для обновления UI
-                    for callback in self.language_changed_callbacks:
-                        try:
-                            callback()
-                        except Exception as e:
-                            print(f"❌ Ошибка в коллбэке: {e}")
-                    return True
-                except Exception as e:
-                    print(f"❌ Ошибка загрузки переводов из {file_path}: {e}")
+        if compiled is not None:
+            # Язык уже скомпилирован - только подменяем таблицы
+            self._translations = compiled.tree
+            self._flat = compiled.flat
+            self._formats = compiled.formats
+            self.language = language
+            print(f"✅ Загружен язык: {language} из {compiled.source_path}")
+            
+            self._notify_language_changed()
+            
+            # Остальные языки - в фоне, чтобы любая смена была мгновенной:
+            # первыми вероятный следующий (предыдущий) и русский по умолчанию
+            catalog.preload([previous, "ru", *catalog.languages()])
+            return True
         
         # Если файл не найден, пробуем загрузить встроенные переводы
         print(f"⚠️ Файлы переводов не найдены, загружаю встроенные для {language}")
         return self.load_builtin_translations(language)
     
+    def preload_languages(self, languages):
+        """Заранее загрузить языки в фоне (например, при открытии настроек)"""
+        return catalog.preload(languages)
+    
     def load_builtin_translations(self, language):
         """Загрузить встроенные переводы"""
         builtin_translations = {
@@ -220,11 +236,7 @@ class SimpleTranslation:
             print(f"✅ Загружены встроенные переводы для: {language}")
             
             # Вызываем коллбэки
-            for callback in self.language_changed_callbacks:
-                try:
-                    callback()
-                except Exception as e:
-                    print(f"❌ Ошибка в коллбэке: {e}")
+            self._notify_language_changed()
             return True
         
         print(f"❌ Встроенных переводов для {language} не найдено")
@@ -256,35 +268,35 @@ class SimpleTranslation:
             default: значение по умолчанию если ключ не найден
             **kwargs: переменные для подстановки в строку
         """
-        try:
-            # Ищем ключ в словаре (разделяем по точкам)
-            keys = key.split('.')
-            value = self.translations
-            
-            for k in keys:
-                if isinstance(value, dict) and k in value:
-                    value = value[k]
-                else:
-                    # Если ключ не найден, возвращаем значение по умолчанию или ключ
-                    if default is not None:
-                        return default
-                    return f"[{key}]"
-            
-            # Если есть переменные для замены
-            if kwargs and isinstance(value, str):
-                try:
-                    return value.format(**kwargs)
-                except KeyError as e:
-                    print(f"⚠️ Недостаточно переменных для перевода '{key}': {e}")
-                    return value
-            
-            return str(value) if value is not None else f"[{key}]"
-            
-        except Exception as e:
-            print(f"❌ Ошибка перевода для ключа '{key}': {e}")
+        value = self._flat.get(key, _MISSING)
+        if value is _MISSING:
+            # Если ключ не найден, возвращаем значение по умолчанию или ключ
             if default is not None:
                 return default
             return f"[{key}]"
+        
+        if value.__class__ is str:
+            # Если есть переменные для замены
+            if kwargs:
+                compiled = self._formats.get(key)
+                if compiled is not None:
+                    format_value, fields = compiled
+                    if fields is not None and not fields <= kwargs.keys():
+                        missing = ", ".join(sorted(fields - kwargs.keys()))
+                        print(f"⚠️ Недостаточно переменных для перевода '{key}': {missing}")
+                        return value
+                    try:
+                        return format_value(**kwargs)
+                    except KeyError as e:
+                        print(f"⚠️ Недостаточно переменных для перевода '{key}': {e}")
+                    except Exception as e:
+                        print(f"❌ Ошибка перевода для ключа '{key}': {e}")
+                        if default is not None:
+                            return default
+                        return f"[{key}]"
+            return value
+        
+        return str(value) if value is not None else f"[{key}]"
     
     def get_translation_dict(self):
         """Получить весь словарь переводов"""
@@ -292,28 +304,7 @@ class SimpleTranslation:
     
     def get_available_languages(self):
         """Получить список доступных языков"""
-        languages = []
-        
-        # Проверяем разные пути
-        base_path = self.get_base_path()
-        possible_dirs = [
-            os.path.join(base_path, "translations"),
-            os.path.join(os.path.dirname(base_path), "translations"),
-            os.path.join(os.getcwd(), "translations"),
-            os.path.join(os.path.dirname(sys.executable), "translations"),
-        ]
-        
-        if hasattr(sys, 'frozen'):
-            exe_dir = os.path.dirname(sys.executable)
-            possible_dirs.append(os.path.join(exe_dir, "translations"))
-        
-        for trans_dir in possible_dirs:
-            if os.path.exists(trans_dir):
-                for file in os.listdir(trans_dir):
-                    if file.endswith(".json"):
-                        language = file.replace(".json", "")
-                        if language not in languages:
-                            languages.append(language)
+        languages = catalog.languages()
         
         # Добавляем встроенные языки
         for lang in ["ru", "en", "de", "sp", "la", "fr", "zh", "ja"]:
@@ -328,18 +319,7 @@ class SimpleTranslation:
     
     def has_key(self, key):
         """Проверить наличие ключа перевода"""
-        try:
-            keys = key.split('.')
-            value = self.translations
-            
-            for k in keys:
-                if isinstance(value, dict) and k in value:
-                    value = value[k]
-                else:
-                    return False
-            return True
-        except:
-            return False
+        return key in self._flat
 
 # Создаем глобальный объект для использования везде
 translation = SimpleTranslation()
\ No newline at end of file
@@ -0,0 +1,232 @@
+# simulate.py
+"""
+Ускоренная симуляция игры без интерфейса (без Qt).
+
+    python simulate.py --days 30                     - один прогон на 30 дней
+    python simulate.py --days 30 --runs 200 --seed 1 --csv runs.csv --summary summary.csv
+
+GameState, EmailSystem и генератор спама работают как в игре, но время
+двигают общие игровые часы (core.game_clock) шагами по часу без таймеров:
+смена начинается в 9:00 (start_shift), идёт до конца рабочего дня
+(end_workday с бонусом), затем следующий день. Случайность задаётся
+--seed (прогон N получает seed + N), поэтому прогоны повторяемы - для
+проверки баланса и регрессий. Вывод игры (print) подавляется.
+
+В CSV (--csv) - строка на прогон, в --summary - среднее, минимум,
+максимум и стандартное отклонение каждого показателя по всем прогонам.
+"""
+
+import argparse
+import contextlib
+import csv
+import json
+import os
+import random
+import statistics
+import sys
+import time
+
+from core.email_retention import RetentionPolicy
+from core.game_clock import DayChanged, GameClock
+from core.game_state import GameState
+from core.spam_generator import get_spam_generator
+from simple_translation import translation
+
+
+# Показатели прогона (порядок столбцов CSV)
+FIELDS = ("seed", "days", "hours", "emails", "spam", "important", "mvd", "evicted",
+          "inbox", "unread", "money", "bonuses", "spam_per_day", "seconds")
+
+
+class _NullWriter:
+    """stdout, который ничего не пишет"""
+
+    def write(self, text):
+        return len(text)
+
+    def flush(self):
+        pass
+
+
+class RunStats:
+    """Счётчики одного прогона (по событиям почты и часов)"""
+
+    def __init__(self):
+        self.emails = 0
+        self.spam = 0
+        self.important = 0
+        self.mvd = 0
+        self.evicted = 0
+        self.day_changes = 0
+
+    def on_email(self, event, email=None):
+        if event == "added":
+            self.emails += 1
+            if email.is_spam:
+                self.spam += 1
+            if email.important:
+                self.important += 1
+            if "mvd" in email.template_key:
+                self.mvd += 1
+        elif event == "removed":
+            self.evicted += 1
+
+    def on_day(self, event):
+        self.day_changes += 1
+
+
+def load_config(config_path: str) -> dict:
+    if config_path and os.path.exists(config_path):
+        with open(config_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    return {}
+
+
+def load_policy(config: dict) -> RetentionPolicy:
+    """Правила хранения писем из конфигурации (без архива - у симуляции нет слота)"""
+    policy = RetentionPolicy.from_config(config.get("email", {}))
+    policy.archive = False
+    return policy
+
+
+def run_simulation(days: int, seed: int, policy: RetentionPolicy = None) -> dict:
+    """
+    Прожить days рабочих дней и вернуть показатели.
+
+    Игровые модули берут случайность из общего random, поэтому на время
+    прогона он засевается seed, а затем состояние генератора возвращается -
+    вызывающий код (тесты, другие прогоны) не теряет свою последовательность.
+    """
+    saved_state = random.getstate()
+    random.seed(seed)
+    try:
+        return _run_days(days, seed, policy)
+    finally:
+        random.setstate(saved_state)
+
+
+def _run_days(days: int, seed: int, policy: RetentionPolicy = None) -> dict:
+    get_spam_generator().last_sent_spam.clear()
+
+    started = time.perf_counter()
+    state = GameState(first_name="Иван", last_name="Петров")
+    if policy is not None:
+        state.email_system.retention = policy
+    initial_money = state.money
+
+    stats = RunStats()
+    state.email_system.add_listener(stats.on_email)
+
+    clock = GameClock(minutes_per_tick=60)
+    clock.subscribe(DayChanged, stats.on_day)
+    clock.attach(state)
+    clock.resume()
+
+    hours = 0
+    workday_hours = 24  # Защита от бесконечного цикла, если смена не закончится
+    for _ in range(days):
+        state.start_shift()
+        for _ in range(workday_hours):
+            clock.tick()
+            hours += 1
+            if not state.shift_started:
+                break
+
+    system = state.email_system
+    bonuses = state.money - initial_money
+    return {
+        "seed": seed,
+        "days": stats.day_changes,
+        "hours": hours,
+        "emails": stats.emails,
+        "spam": stats.spam,
+        "important": stats.important,
+        "mvd": stats.mvd,
+        "evicted": stats.evicted,
+        "inbox": system.get_total_count(),
+        "unread": system.get_unread_count(),
+        "money": round(state.money, 2),
+        "bonuses": round(bonuses, 2),
+        "spam_per_day": round(stats.spam / days, 3) if days else 0,
+        "seconds": round(time.perf_counter() - started, 4),
+    }
+
+
+def summarize(rows):
+    """Среднее, минимум, максимум и отклонение каждого показателя"""
+    summary = []
+    for field in FIELDS:
+        if field == "seed":
+            continue
+        values = [row[field] for row in rows]
+        summary.append({
+            "metric": field,
+            "mean": round(statistics.fmean(values), 4),
+            "min": min(values),
+            "max": max(values),
+            "stdev": round(statistics.pstdev(values), 4),
+        })
+    return summary
+
+
+def write_csv(path: str, fieldnames, rows):
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Симуляция Office Hacker без интерфейса")
+    parser.add_argument("--days", type=int, default=30, help="рабочих дней в прогоне")
+    parser.add_argument("--runs", type=int, default=1, help="число прогонов")
+    parser.add_argument("--seed", type=int, default=0, help="seed первого прогона")
+    parser.add_argument("--config", default="config.json",
+                        help="конфигурация: правила хранения писем и язык")
+    parser.add_argument("--language", help="язык писем (по умолчанию из конфигурации)")
+    parser.add_argument("--csv", metavar="FILE", help="показатели каждого прогона")
+    parser.add_argument("--summary", metavar="FILE", help="сводка по всем прогонам")
+    parser.add_argument("--verbose", action="store_true", help="не подавлять вывод игры")
+    args = parser.parse_args(argv)
+
+    config = load_config(args.config)
+    policy = load_policy(config)
+    # Шаблоны писем ищутся в переводах - без загруженного языка письма будут заглушками
+    language = args.language or config.get("game", {}).get("language", "ru")
+    with contextlib.redirect_stdout(_NullWriter()):
+        if not translation.load_translations(language):
+            print(f"Не удалось загрузить язык {language}", file=sys.stderr)
+            return 1
+    rows = []
+    started = time.perf_counter()
+    for number in range(args.runs):
+        seed = args.seed + number
+        if args.verbose:
+            rows.append(run_simulation(args.days, seed, policy))
+        else:
+            with contextlib.redirect_stdout(_NullWriter()):
+                rows.append(run_simulation(args.days, seed, policy))
+    elapsed = time.perf_counter() - started
+
+    total_days = sum(row["days"] for row in rows)
+    print(f"Прогонов: {len(rows)}, игровых дней: {total_days}, время: {elapsed:.2f} с "
+          f"({total_days / elapsed:.0f} дней/с)")
+    summary = summarize(rows)
+    print(f"{'показатель':<14} {'среднее':>10} {'мин':>10} {'макс':>10} {'откл.':>10}")
+    for item in summary:
+        print(f"{item['metric']:<14} {item['mean']:>10} {item['min']:>10} {item['max']:>10} {item['stdev']:>10}")
+
+    if args.csv:
+        write_csv(args.csv, FIELDS, rows)
+        print(f"Прогоны записаны в {args.csv}")
+    if args.summary:
+        write_csv(args.summary, ("metric", "mean", "min", "max", "stdev"), summary)
+        print(f"Сводка записана в {args.summary}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,83 @@
+# tests/test_email_archive.py
+"""Архив писем: сохранения в разные слоты, завершившиеся в любом порядке"""
+
+import os
+import tempfile
+import unittest
+
+from core.email_archive import EmailArchive
+from core.email_system import Email
+
+
+def make_email(email_id: int) -> Email:
+    return Email(email_id, "sender", "subject", "template", {}, "01.01.2024", day=1)
+
+
+def archived_ids(path: str):
+    return [record["email"]["id"] for record in EmailArchive(path).read_range(0, 1000)]
+
+
+class ArchiveCommitOrderTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.slot1 = os.path.join(self.tmp.name, "a1.jsonl")
+        self.slot2 = os.path.join(self.tmp.name, "a2.jsonl")
+        self.archive = EmailArchive(self.slot1)
+        self.next_id = 0
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def add(self, count: int):
+        for _ in range(count):
+            self.archive.add("inbox", make_email(self.next_id), 1)
+            self.next_id += 1
+
+    def prepare_both(self):
+        self.add(3)
+        commit1 = self.archive.prepare_commit(self.slot1)
+        self.add(1)
+        commit2 = self.archive.prepare_commit(self.slot2)
+        self.add(1)
+        return commit1, commit2
+
+    def check(self):
+        self.assertEqual(archived_ids(self.slot1), [0, 1, 2])
+        self.assertEqual(archived_ids(self.slot2), [0, 1, 2, 3])
+        # Письмо 4 убрано после обоих сохранений - оно ждёт следующего сохранения в слот 2
+        self.assertEqual(self.archive.path, self.slot2)
+        self.assertEqual(self.archive.pending_count(), 1)
+        self.assertEqual(self.archive.count(), 5)
+        self.assertEqual([record["email"]["id"] for record in self.archive.read_range(0, 5)],
+                         [0, 1, 2, 3, 4])
+
+        self.archive.prepare_commit(self.slot2).run()
+        self.assertEqual(archived_ids(self.slot2), [0, 1, 2, 3, 4])
+        self.assertEqual(archived_ids(self.slot1), [0, 1, 2])
+        self.assertEqual(self.archive.count(), 5)
+
+    def test_slots_in_order(self):
+        commit1, commit2 = self.prepare_both()
+        commit1.run()
+        commit2.run()
+        self.check()
+
+    def test_slots_out_of_order(self):
+        commit1, commit2 = self.prepare_both()
+        commit2.run()
+        commit1.run()
+        self.check()
+
+    def test_same_slot_saves_do_not_duplicate(self):
+        self.add(2)
+        first = self.archive.prepare_commit(self.slot1)
+        self.add(2)
+        second = self.archive.prepare_commit(self.slot1)
+        first.run()
+        second.run()
+        self.assertEqual(archived_ids(self.slot1), [0, 1, 2, 3])
+        self.assertEqual(self.archive.pending_count(), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
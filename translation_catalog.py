@@ -0,0 +1,335 @@
+# translation_catalog.py
+"""
+Каталог языков интерфейса.
+
+- Языки (translations/<язык>.json) ищутся один раз при первом обращении.
+- Каждый язык компилируется в плоскую таблицу ключей (см. flatten_translations)
+  и сохраняется в cache/translations/<язык>.marshal (рядом с игрой, а не в
+  текущем каталоге) вместе с mtime и размером исходного JSON. Пока JSON не
+  изменился, язык читается из этого файла одним marshal.loads без разбора
+  JSON.
+- Скомпилированные языки держатся в памяти: повторная смена языка не
+  обращается к диску.
+- preload() заранее загружает языки в фоновом потоке (следующий вероятный
+  язык при открытии настроек), поэтому сама смена языка мгновенная.
+- Если рядом с переводами лежит пакет translations/bundles/<язык>.bundle
+  (собирается build_translations.py: проверенный язык, дополненный ключами
+  эталона), берётся он. Пакет устарел, если его исходные JSON изменились
+  после сборки - тогда язык читается из JSON как обычно.
+"""
+
+import json
+import marshal
+import os
+import re
+import string
+import sys
+import threading
+from typing import Dict, Iterable, Optional
+
+
+# Версия формата скомпилированных файлов (кэш и пакеты)
+CACHE_VERSION = 2
+
+# Пакеты языков от build_translations.py: translations/bundles/<язык>.bundle
+BUNDLE_DIR = "bundles"
+BUNDLE_SUFFIX = ".bundle"
+
+_formatter = string.Formatter()
+
+
+def flatten_translations(tree, prefix=""):
+    """
+    Скомпилировать дерево переводов в плоскую таблицу {"a.b.c": значение}.
+
+    Промежуточные словари тоже попадают в таблицу (t() и has_key()
+    работали и для них), поэтому поиск ключа - одно обращение к словарю.
+    """
+    flat = {}
+    stack = [(prefix, tree)]
+    while stack:
+        path, node = stack.pop()
+        for key, value in node.items():
+            full_key = f"{path}.{key}" if path else key
+            flat[full_key] = value
+            if isinstance(value, dict):
+                stack.append((full_key, value))
+    return flat
+
+
+def compile_formats(flat):
+    """
+    Ключи строк с подстановками -> (str.format строки, имена подстановок).
+
+    Строкам без {} форматирование не нужно; имена разобраны заранее,
+    чтобы нехватку переменных проверять без исключения из format().
+    """
+    formats = {}
+    for key, value in flat.items():
+        if isinstance(value, str) and "{" in value:
+            try:
+                fields = frozenset(
+                    re.split(r"[.\[]", field_name, 1)[0]
+                    for _, field_name, _, _ in _formatter.parse(value)
+                    if field_name
+                )
+            except ValueError:
+                fields = None  # Ошибка в строке - пусть её покажет format()
+            formats[key] = (value.format, fields)
+    return formats
+
+
+def file_stamp(path: str) -> tuple:
+    """(mtime_ns, размер) файла - по нему видно, что файл изменился"""
+    stat = os.stat(path)
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def read_compiled(path: str):
+    """Скомпилированный файл (кэш или пакет) -> (stamps, tree, flat); None - не подходит"""
+    try:
+        with open(path, "rb") as f:
+            header, stamps, tree, flat = marshal.loads(f.read())
+    except (OSError, ValueError, EOFError, TypeError):
+        return None
+    if header != (CACHE_VERSION, sys.version_info[:2]) or not isinstance(stamps, dict):
+        return None
+    return {source: tuple(stamp) for source, stamp in stamps.items()}, tree, flat
+
+
+def write_compiled(path: str, stamps: dict, tree: dict, flat: dict):
+    """Записать скомпилированный язык (stamps: исходный файл -> file_stamp)"""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.{threading.get_ident()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(marshal.dumps(((CACHE_VERSION, sys.version_info[:2]), stamps, tree, flat)))
+    os.replace(tmp_path, path)
+
+
+def stamps_changed(stamps: dict, missing_ok: bool = False) -> bool:
+    """Изменился ли какой-нибудь из исходных файлов"""
+    for source, stamp in stamps.items():
+        try:
+            if file_stamp(source) != stamp:
+                return True
+        except OSError:
+            if not missing_ok:
+                return True
+    return False
+
+
+class CompiledLanguage:
+    """Язык, готовый к использованию в SimpleTranslation"""
+
+    __slots__ = ("language", "source_path", "tree", "flat", "formats", "stamps", "bundled")
+
+    def __init__(self, language: str, source_path: str, tree: dict, flat: dict, stamps: dict,
+                 bundled: bool = False):
+        self.language = language
+        self.source_path = source_path
+        self.tree = tree
+        self.flat = flat
+        self.formats = compile_formats(flat)
+        self.stamps = stamps  # исходный JSON -> (mtime_ns, размер)
+        self.bundled = bundled  # Загружен из пакета build_translations.py
+
+
+def base_path() -> str:
+    """Каталог игры (работает и в exe и в исходниках)"""
+    if hasattr(sys, '_MEIPASS'):
+        # Мы в упакованном приложении (exe)
+        return sys._MEIPASS
+    return os.path.dirname(os.path.abspath(__file__))
+
+
+def default_cache_dir() -> str:
+    """Каталог кэша переводов: рядом с exe или с исходниками, не в текущем каталоге"""
+    if hasattr(sys, 'frozen'):
+        # _MEIPASS - временная распаковка exe, кэш там не переживёт перезапуск
+        root = os.path.dirname(os.path.abspath(sys.executable))
+    else:
+        root = os.path.dirname(os.path.abspath(__file__))
+    return os.path.join(root, "cache", "translations")
+
+
+def translation_dirs():
+    """Каталоги, где могут лежать переводы (в порядке приоритета)"""
+    base = base_path()
+    return [
+        os.path.join(base, "translations"),
+        os.path.join(os.path.dirname(base), "translations"),
+        os.path.join(os.getcwd(), "translations"),
+        os.path.join(os.path.dirname(sys.executable), "translations"),
+    ]
+
+
+def _loose_source(language: str) -> Optional[str]:
+    """Файл перевода, положенный прямо рядом с exe"""
+    if not hasattr(sys, 'frozen'):
+        return None
+    path = os.path.join(os.path.dirname(sys.executable), f"{language}.json")
+    return path if os.path.exists(path) else None
+
+
+class TranslationCatalog:
+    """Найденные языки и их скомпилированные таблицы"""
+
+    def __init__(self, cache_dir: Optional[str] = None):
+        self.cache_dir = cache_dir or default_cache_dir()
+        self._sources: Optional[Dict[str, str]] = None  # язык -> путь к JSON
+        self._bundles: Dict[str, str] = {}  # язык -> путь к пакету
+        self._compiled: Dict[str, CompiledLanguage] = {}
+        self._loading: Dict[str, threading.Event] = {}
+        self._lock = threading.Lock()
+
+    def sources(self) -> Dict[str, str]:
+        """Язык -> файл переводов (каталоги просматриваются один раз)"""
+        if self._sources is None:
+            sources = {}
+            bundles = {}
+            for directory in translation_dirs():
+                if not os.path.isdir(directory):
+                    continue
+                directory = os.path.abspath(directory)
+                for name in sorted(os.listdir(directory)):
+                    if name.endswith(".json"):
+                        sources.setdefault(name[:-5], os.path.join(directory, name))
+                bundle_dir = os.path.join(directory, BUNDLE_DIR)
+                if os.path.isdir(bundle_dir):
+                    for name in sorted(os.listdir(bundle_dir)):
+                        if name.endswith(BUNDLE_SUFFIX):
+                            bundles.setdefault(name[:-len(BUNDLE_SUFFIX)], os.path.join(bundle_dir, name))
+            self._bundles = bundles
+            self._sources = sources
+        return self._sources
+
+    def refresh(self):
+        """Заново найти языки (например, после добавления файла перевода)"""
+        with self._lock:
+            self._sources = None
+            self._compiled.clear()
+
+    def languages(self):
+        """Языки, для которых есть файлы переводов или пакеты"""
+        return sorted(set(self.sources()) | set(self._bundles))
+
+    def get(self, language: str) -> Optional[CompiledLanguage]:
+        """Скомпилированный язык (из памяти, если уже загружен)"""
+        while True:
+            with self._lock:
+                compiled = self._compiled.get(language)
+                if compiled is not None:
+                    return compiled
+                loading = self._loading.get(language)
+                if loading is None:
+                    loading = self._loading[language] = threading.Event()
+                    break
+            # Язык как раз загружается в фоне - ждём его, а не читаем второй раз
+            loading.wait()
+
+        try:
+            compiled = self._load(language)
+            with self._lock:
+                if compiled is not None:
+                    self._compiled[language] = compiled
+            return compiled
+        finally:
+            with self._lock:
+                self._loading.pop(language, None)
+            loading.set()
+
+    def is_loaded(self, language: str) -> bool:
+        with self._lock:
+            return language in self._compiled
+
+    def preload(self, languages: Iterable[str]):
+        """Загрузить языки в фоновом потоке (проверяя, не изменились ли файлы)"""
+        languages = [language for language in dict.fromkeys(languages) if language]
+        if not languages:
+            return None
+
+        def run():
+            for language in languages:
+                try:
+                    self._revalidate(language)
+                    self.get(language)
+                except Exception as e:
+                    print(f"❌ Ошибка предзагрузки языка {language}: {e}")
+
+        thread = threading.Thread(target=run, name="translation-preload", daemon=True)
+        thread.start()
+        return thread
+
+    def _revalidate(self, language: str):
+        """Забыть язык в памяти, если его файлы изменились"""
+        with self._lock:
+            compiled = self._compiled.get(language)
+        if compiled is None:
+            return
+        if stamps_changed(compiled.stamps, missing_ok=True):
+            with self._lock:
+                if self._compiled.get(language) is compiled:
+                    del self._compiled[language]
+
+    def _cache_path(self, language: str) -> str:
+        return os.path.join(self.cache_dir, f"{language}.marshal")
+
+    def _load(self, language: str) -> Optional[CompiledLanguage]:
+        source_path = self.sources().get(language) or _loose_source(language)
+
+        compiled = self._read_bundle(language)
+        if compiled is not None:
+            return compiled
+
+        if source_path is None:
+            return None
+        try:
+            stamps = {source_path: file_stamp(source_path)}
+        except OSError:
+            return None
+
+        compiled = self._read_cache(language, source_path, stamps)
+        if compiled is not None:
+            return compiled
+
+        with open(source_path, 'r', encoding='utf-8') as f:
+            tree = json.load(f)
+        flat = flatten_translations(tree)
+        self._write_cache(language, stamps, tree, flat)
+        return CompiledLanguage(language, source_path, tree, flat, stamps)
+
+    def _read_bundle(self, language: str) -> Optional[CompiledLanguage]:
+        """Пакет языка, если он есть и собран из текущих JSON"""
+        bundle_path = self._bundles.get(language)
+        if bundle_path is None:
+            return None
+        compiled = read_compiled(bundle_path)
+        if compiled is None:
+            print(f"⚠️ Пакет переводов {bundle_path} не подходит (другая версия формата или Python)")
+            return None
+        stamps, tree, flat = compiled
+        # Без JSON (например, в exe только пакеты) пакет считается актуальным
+        if stamps_changed(stamps, missing_ok=True):
+            print(f"⚠️ Пакет переводов {bundle_path} устарел, загружаю JSON")
+            return None
+        return CompiledLanguage(language, bundle_path, tree, flat, stamps, bundled=True)
+
+    def _read_cache(self, language: str, source_path: str, stamps: dict) -> Optional[CompiledLanguage]:
+        compiled = read_compiled(self._cache_path(language))
+        if compiled is None or compiled[0] != stamps:
+            return None
+        _, tree, flat = compiled
+        return CompiledLanguage(language, source_path, tree, flat, stamps)
+
+    def _write_cache(self, language: str, stamps: dict, tree: dict, flat: dict):
+        # Кэш - только ускорение: если каталог недоступен для записи, работаем без него
+        try:
+            write_compiled(self._cache_path(language), stamps, tree, flat)
+        except (OSError, ValueError) as e:
+            print(f"⚠️ Не удалось записать кэш переводов {language}: {e}")
+
+
+# Общий каталог языков
+catalog = TranslationCatalog()
@@ -4,6 +4,7 @@ from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout,
 from PySide6.QtCore import Qt, Signal
 from PySide6.QtGui import QDesktopServices
 from simple_translation import translation  # Добавляем импорт системы перевода
+from ui.retranslation import retranslation
 
 class AboutWidget(QWidget):
     back_requested = Signal()  # Изменено имя сигнала
@@ -19,10 +20,10 @@ class AboutWidget(QWidget):
         self.text_browser = None
         self.back_btn = None
         
-        # Подписываемся на смену языка
-        translation.on_language_changed(self.update_translations)
-        
         self.init_ui()
+        
+        # Подписываемся на смену языка
+        retranslation.register(self, self.update_translations)
         self.update_translations()
         
     def update_translations(self):
@@ -0,0 +1,249 @@
+# ui/animation_driver.py
+"""
+Общий драйвер анимаций.
+
+Вместо собственного QTimer у каждого эффекта (частицы, пульсация, мигание)
+виджеты регистрируют шаг анимации в одном драйвере:
+
+    self.effect_timer = animation_driver.register(self, self.update_effects, 50)
+
+Драйвер тикает не чаще performance.max_fps из config.json и вызывает шаг
+не чаще его интервала (50 мс - 20 раз в секунду, как прежний таймер; если
+кадры реже интервала, шаг догоняет пропущенное, но не больше MAX_CATCH_UP
+раз за кадр). Шаги пропускаются, если виджет скрыт (другая страница
+QStackedWidget, закрытое окно), полностью закрыт другими виджетами или
+его окно свёрнуто. Когда анимировать нечего, драйвер переходит на редкие
+проверки (IDLE_INTERVAL_MS), а показ зарегистрированного виджета сразу
+возвращает обычную частоту - поэтому в простое процессор почти не занят.
+
+Время каждого шага копится по виджетам (stats()) - видно, какой эффект
+сколько стоит. Слушатели кадров (add_frame_listener) получают время кадра
+и суммарное время его шагов - по ним регулируется качество эффектов.
+
+Регистрация возвращает AnimationHandle с методами start()/stop()/isActive()
+как у QTimer, поэтому остановка и перезапуск эффектов в виджетах не меняются.
+"""
+
+import time
+import weakref
+from typing import Callable, Dict, List, Optional
+
+from PySide6.QtCore import QEvent, QObject, Qt, QTimer
+
+
+# Частота кадров по умолчанию (performance.max_fps)
+DEFAULT_MAX_FPS = 60
+
+# Период проверок, когда видимых анимаций нет
+IDLE_INTERVAL_MS = 250
+
+# Сколько пропущенных шагов анимации догонять за один кадр
+MAX_CATCH_UP = 3
+
+
+class AnimationHandle:
+    """Зарегистрированный шаг анимации виджета (интерфейс как у QTimer)"""
+
+    __slots__ = ("driver", "widget", "callback", "name", "interval_ms", "active",
+                 "due", "calls", "skipped", "total_time", "max_time", "__weakref__")
+
+    def __init__(self, driver: 'AnimationDriver', widget, callback, interval_ms: int, name: str):
+        self.driver = driver
+        self.widget = weakref.ref(widget)
+        # Связанный метод виджета держим слабо, чтобы не продлевать ему жизнь
+        if getattr(callback, "__self__", None) is widget:
+            self.callback = weakref.WeakMethod(callback)
+        else:
+            self.callback = lambda callback=callback: callback
+        self.name = name
+        self.interval_ms = max(1, int(interval_ms))
+        self.active = False
+        self.due = 0.0  # Когда шаг нужен в следующий раз (time.perf_counter)
+        self.calls = 0
+        self.skipped = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+
+    def start(self, interval_ms: Optional[int] = None):
+        if interval_ms is not None:
+            self.interval_ms = max(1, int(interval_ms))
+        self.active = True
+        self.due = time.perf_counter() + self.interval_ms / 1000.0
+        self.driver._wake()
+
+    def stop(self):
+        self.active = False
+
+    def isActive(self) -> bool:
+        return self.active
+
+    def interval(self) -> int:
+        return self.interval_ms
+
+    def setInterval(self, interval_ms: int):
+        self.interval_ms = max(1, int(interval_ms))
+
+
+class AnimationDriver(QObject):
+    """Один таймер кадров для всех анимированных виджетов"""
+
+    def __init__(self, max_fps: int = DEFAULT_MAX_FPS):
+        super().__init__()
+        self._handles: List[AnimationHandle] = []
+        self._watched = set()  # id виджетов, на которых стоит фильтр событий
+        self._frame_listeners: List[Callable[[float, float], None]] = []
+        self.max_fps = max_fps
+        self.idle = False
+        self.timer = QTimer(self)
+        self.timer.setTimerType(Qt.PreciseTimer)
+        self.timer.timeout.connect(self.tick)
+
+    @property
+    def frame_interval_ms(self) -> int:
+        return max(1, int(1000 / self.max_fps))
+
+    def set_max_fps(self, max_fps):
+        """Частота кадров из performance.max_fps"""
+        try:
+            max_fps = int(max_fps)
+        except (TypeError, ValueError):
+            max_fps = DEFAULT_MAX_FPS
+        self.max_fps = max(1, min(240, max_fps))
+        if self.timer.isActive() and not self.idle:
+            self.timer.setInterval(self.frame_interval_ms)
+        print(f"[АНИМАЦИЯ] Частота кадров: {self.max_fps} FPS")
+
+    def register(self, widget, callback, interval_ms: int, name: Optional[str] = None,
+                 start: bool = True) -> AnimationHandle:
+        """Вызывать callback() каждые interval_ms, пока widget виден"""
+        name = name or f"{type(widget).__name__}.{getattr(callback, '__name__', 'step')}"
+        handle = AnimationHandle(self, widget, callback, interval_ms, name)
+        self._handles.append(handle)
+        key = id(widget)
+        if key not in self._watched:
+            self._watched.add(key)
+            widget.installEventFilter(self)
+            widget.destroyed.connect(lambda *_, key=key: self._forget(key))
+        if start:
+            handle.start()
+        return handle
+
+    def add_frame_listener(self, callback: Callable[[float, float], None]):
+        """Вызывать callback(время кадра, время шагов в секундах) после кадров с анимацией"""
+        self._frame_listeners.append(callback)
+
+    def _forget(self, key: int):
+        self._watched.discard(key)
+        self._handles = [handle for handle in self._handles if handle.widget() is not None
+                         and id(handle.widget()) != key]
+
+    def eventFilter(self, obj, event):
+        # Показ виджета или разворачивание окна - сразу обычная частота кадров
+        if event.type() == QEvent.Show and self.idle:
+            self._wake()
+        return False
+
+    def _wake(self):
+        if self.idle or not self.timer.isActive():
+            self.idle = False
+            self.timer.start(self.frame_interval_ms)
+
+    def _can_animate(self, widget, windows: Dict[int, bool]) -> bool:
+        """Виджет виден на экране: не скрыт, не закрыт целиком, окно не свёрнуто"""
+        if not widget.isVisible():
+            return False
+        window = widget.window()
+        visible = windows.get(id(window))
+        if visible is None:
+            visible = windows[id(window)] = not window.isMinimized()
+        if not visible:
+            return False
+        return not widget.visibleRegion().isEmpty()
+
+    def tick(self):
+        now = time.perf_counter()
+        windows: Dict[int, bool] = {}
+        animated = 0
+        active = 0
+        busy = 0.0
+        alive = []
+        for handle in self._handles:
+            widget = handle.widget()
+            callback = handle.callback()
+            if widget is None or callback is None:
+                continue
+            alive.append(handle)
+            if not handle.active:
+                continue
+            active += 1
+            try:
+                if not self._can_animate(widget, windows):
+                    handle.skipped += 1
+                    # Вернувшись на экран, анимация продолжится без рывка
+                    handle.due = now
+                    continue
+            except RuntimeError:
+                # Объект Qt уже удалён
+                alive.pop()
+                continue
+            animated += 1
+            if now < handle.due:
+                continue
+
+            interval = handle.interval_ms / 1000.0
+            steps = min(MAX_CATCH_UP, 1 + int((now - handle.due) / interval))
+            handle.due = max(handle.due + steps * interval, now)
+            started = time.perf_counter()
+            try:
+                for _ in range(steps):
+                    callback()
+            except Exception as e:
+                print(f"[АНИМАЦИЯ] Ошибка в {handle.name}: {e}")
+                handle.active = False
+            elapsed = time.perf_counter() - started
+            handle.calls += steps
+            handle.total_time += elapsed
+            handle.max_time = max(handle.max_time, elapsed)
+            busy += elapsed
+        if len(alive) != len(self._handles):
+            self._handles = alive
+
+        if not active:
+            # Все анимации остановлены - таймер не нужен до следующего start()
+            self.idle = True
+            self.timer.stop()
+        elif animated and self.idle:
+            self.idle = False
+            self.timer.setInterval(self.frame_interval_ms)
+        if animated:
+            for callback in self._frame_listeners:
+                callback(now, busy)
+        elif not animated and not self.idle:
+            # Видимых анимаций нет - редкие проверки вместо кадров
+            self.idle = True
+            self.timer.setInterval(IDLE_INTERVAL_MS)
+
+    def stats(self) -> List[dict]:
+        """Стоимость шагов анимации по виджетам (самые дорогие первыми)"""
+        rows = []
+        for handle in self._handles:
+            rows.append({
+                "name": handle.name,
+                "active": handle.active,
+                "calls": handle.calls,
+                "skipped": handle.skipped,
+                "total_ms": handle.total_time * 1000,
+                "avg_ms": handle.total_time * 1000 / handle.calls if handle.calls else 0.0,
+                "max_ms": handle.max_time * 1000,
+            })
+        rows.sort(key=lambda row: row["total_ms"], reverse=True)
+        return rows
+
+    def reset_stats(self):
+        for handle in self._handles:
+            handle.calls = handle.skipped = 0
+            handle.total_time = handle.max_time = 0.0
+
+
+# Общий драйвер анимаций
+animation_driver = AnimationDriver()
@@ -0,0 +1,34 @@
+# ui/clock_driver.py
+"""
+Qt-драйвер игровых часов: единственный таймер игрового времени.
+
+Таймер работает только пока часы идут (не на паузе и есть игра), его
+интервал следует масштабу времени часов.
+"""
+
+from PySide6.QtCore import QObject, QTimer
+
+from core.game_clock import GameClock, game_clock
+
+
+class QtClockDriver(QObject):
+    """Двигает GameClock по QTimer"""
+
+    def __init__(self, clock: GameClock = game_clock, parent=None):
+        super().__init__(parent)
+        self.clock = clock
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(clock.tick)
+        clock.on_state_changed(self.sync)
+        self.sync()
+
+    def sync(self):
+        """Запустить, остановить или перенастроить таймер по состоянию часов"""
+        if self.clock.running:
+            if self.timer.interval() != self.clock.interval_ms or not self.timer.isActive():
+                self.timer.start(self.clock.interval_ms)
+        elif self.timer.isActive():
+            self.timer.stop()
+
+    def stop(self):
+        self.timer.stop()
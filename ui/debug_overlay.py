@@ -0,0 +1,203 @@
+# ui/debug_overlay.py
+"""
+Отладочный оверлей производительности (debug.show_fps, F3).
+
+Поверх главного окна, без перехвата мыши, раз в полсекунды выводит:
+    - FPS драйвера анимаций и качество эффектов (с последней сменой);
+    - время отрисовки виджетов с @timed_paint (отрисовок в секунду и
+      среднее время) и самые дорогие шаги анимаций;
+    - пробуждения таймеров в секунду - все события Timer приложения
+      (включая 12 в секунду самого оверлея);
+    - задержку цикла событий - насколько опаздывает пробный таймер 100 мс;
+    - кучу Python (число выделенных блоков, с tracemalloc - ещё и байты).
+Пока оверлей скрыт, замеры не ведутся: фильтр событий приложения и
+пробный таймер работают только при показе.
+"""
+
+import sys
+import time
+import tracemalloc
+
+from PySide6.QtCore import QEvent, QTimer, Qt
+from PySide6.QtGui import QColor, QFont, QFontMetrics, QPainter
+from PySide6.QtWidgets import QApplication, QWidget
+
+from ui.animation_driver import animation_driver
+from ui.quality_governor import quality_governor
+from ui.profiler import hot_path_profiler
+
+
+# Период обновления оверлея
+REFRESH_MS = 500
+
+# Период пробного таймера задержки цикла событий
+PROBE_MS = 100
+
+# Сколько виджетов и шагов анимации показывать
+TOP_ROWS = 5
+
+
+class DebugOverlay(QWidget):
+    """Полупрозрачная панель замеров в правом верхнем углу окна"""
+
+    def __init__(self, parent):
+        super().__init__(parent)
+        self.setAttribute(Qt.WA_TransparentForMouseEvents)
+        self.setFocusPolicy(Qt.NoFocus)
+        self.overlay_font = QFont("Consolas", 9)
+        self.lines = []
+        self.active = False
+
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.timeout.connect(self.refresh)
+        self.probe_timer = QTimer(self)
+        self.probe_timer.setTimerType(Qt.PreciseTimer)
+        self.probe_timer.timeout.connect(self.probe)
+
+        self.frames = 0
+        self.timer_events = 0
+        self.latency_total = 0.0
+        self.latency_max = 0.0
+        self.probes = 0
+        self.probe_expected = 0.0
+        self.sample_started = time.perf_counter()
+        self.paint_snapshot = {}
+        self.step_snapshot = {}
+
+        animation_driver.add_frame_listener(self.on_frame)
+        parent.installEventFilter(self)
+        self.hide()
+
+    # --- Включение ---
+
+    def set_active(self, active: bool):
+        if active == self.active:
+            return
+        self.active = active
+        app = QApplication.instance()
+        if active:
+            self.reset_sample()
+            self.paint_snapshot = self.paint_totals()
+            self.step_snapshot = self.step_totals()
+            app.installEventFilter(self)
+            self.probe_expected = time.perf_counter() + PROBE_MS / 1000.0
+            self.probe_timer.start(PROBE_MS)
+            self.refresh_timer.start(REFRESH_MS)
+            self.lines = ["Сбор замеров..."]
+            self.reposition()
+            self.show()
+            self.raise_()
+        else:
+            app.removeEventFilter(self)
+            self.probe_timer.stop()
+            self.refresh_timer.stop()
+            self.hide()
+        print(f"[ОТЛАДКА] Оверлей производительности {'включён' if active else 'выключен'}")
+
+    # --- Замеры ---
+
+    def on_frame(self, now: float, busy: float):
+        self.frames += 1
+
+    def eventFilter(self, obj, event):
+        event_type = event.type()
+        if event_type == QEvent.Timer:
+            self.timer_events += 1
+        elif obj is self.parent() and event_type == QEvent.Resize:
+            self.reposition()
+        return False
+
+    def probe(self):
+        now = time.perf_counter()
+        latency = max(0.0, now - self.probe_expected)
+        self.latency_total += latency
+        self.latency_max = max(self.latency_max, latency)
+        self.probes += 1
+        self.probe_expected = now + PROBE_MS / 1000.0
+
+    def reset_sample(self):
+        self.sample_started = time.perf_counter()
+        self.frames = 0
+        self.timer_events = 0
+        self.latency_total = 0.0
+        self.latency_max = 0.0
+        self.probes = 0
+
+    @staticmethod
+    def paint_totals():
+        return {name: (stats[0], stats[1]) for name, stats in quality_governor.paint_stats.items()}
+
+    @staticmethod
+    def step_totals():
+        return {row["name"]: (row["calls"], row["total_ms"]) for row in animation_driver.stats()}
+
+    @staticmethod
+    def deltas(current, previous):
+        """Вызовы и время (как в totals) за интервал, самые дорогие первыми"""
+        rows = []
+        for name, (count, total) in current.items():
+            old_count, old_total = previous.get(name, (0, 0.0))
+            if count > old_count:
+                rows.append((name, count - old_count, total - old_total))
+        rows.sort(key=lambda row: row[2], reverse=True)
+        return rows[:TOP_ROWS]
+
+    def refresh(self):
+        elapsed = max(1e-6, time.perf_counter() - self.sample_started)
+        paints = self.paint_totals()
+        steps = self.step_totals()
+
+        lines = [
+            f"FPS анимаций: {self.frames / elapsed:5.1f} (цель {animation_driver.max_fps})"
+            f"{'  простой' if animation_driver.idle else ''}",
+            f"Качество: {quality_governor.level.name}, кадр {quality_governor.last_frame_ms:.1f} мс",
+        ]
+        if quality_governor.history:
+            change = quality_governor.history[-1]
+            lines.append(f"  {change['time']} {change['from']} -> {change['to']}")
+
+        lines.append("Отрисовка (раз/с, мс):")
+        for name, count, total in self.deltas(paints, self.paint_snapshot):
+            lines.append(f"  {name:<18} {count / elapsed:5.1f} {total * 1000 / count:6.2f}")
+        lines.append("Шаги анимаций (раз/с, мс):")
+        for name, count, total in self.deltas(steps, self.step_snapshot):
+            lines.append(f"  {name[:30]:<30} {count / elapsed:5.1f} {total / count:6.2f}")
+
+        average = self.latency_total * 1000 / self.probes if self.probes else 0.0
+        lines.append(f"Таймеры: {self.timer_events / elapsed:.0f} пробуждений/с")
+        lines.append(f"Задержка цикла: {average:.1f} мс, макс. {self.latency_max * 1000:.1f} мс")
+
+        heap = f"Куча Python: {sys.getallocatedblocks() / 1000:.0f} тыс. блоков"
+        if tracemalloc.is_tracing():
+            current, peak = tracemalloc.get_traced_memory()
+            heap += f", {current / 1048576:.1f} МБ (пик {peak / 1048576:.1f})"
+        lines.append(heap)
+        if hot_path_profiler.running:
+            lines.append("Идёт запись профиля...")
+
+        self.lines = lines
+        self.paint_snapshot = paints
+        self.step_snapshot = steps
+        self.reset_sample()
+        self.reposition()
+        self.update()
+
+    # --- Отрисовка ---
+
+    def reposition(self):
+        metrics = QFontMetrics(self.overlay_font)
+        width = max((metrics.horizontalAdvance(line) for line in self.lines), default=100) + 16
+        height = metrics.height() * max(1, len(self.lines)) + 12
+        parent = self.parent()
+        self.setGeometry(parent.width() - width - 10, 30, width, height)
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.fillRect(self.rect(), QColor(0, 0, 0, 170))
+        painter.setPen(QColor(0, 255, 120))
+        painter.setFont(self.overlay_font)
+        metrics = QFontMetrics(self.overlay_font)
+        y = 6 + metrics.ascent()
+        for line in self.lines:
+            painter.drawText(8, y, line)
+            y += metrics.height()
@@ -1,15 +1,22 @@
 # ui/game_widget.py
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, 
                                QLabel, QPushButton, QTextEdit, QFrame,
-                               QListWidget, QListWidgetItem, QDialog,
+                               QListView, QDialog, QLineEdit,
                                QStackedWidget, QMessageBox, QTextBrowser)
 from PySide6.QtCore import Qt, QTimer, Signal, QUrl
 from PySide6.QtGui import QFont, QPainter, QColor, QBrush, QLinearGradient, QPen, QRadialGradient
 from ui.terminal_widget import TerminalWidget
 from ui.time_widget import TimeWidget
+from ui.mail_model import MailListModel
+from core.mail_search import email_matches
+from core.game_clock import ClockTick, HourChanged, game_clock
 from simple_translation import translation
+from ui.animation_driver import animation_driver
+from ui.layer_cache import LayerCache
+from ui.particles import ParticleField
+from ui.quality_governor import quality_governor, timed_paint
+from ui.retranslation import retranslation
 import random
-import math
 import time
 
 
@@ -27,6 +34,9 @@ class GameWidget(QWidget):
         
         self.main_window = parent
         
+        # Тексты обновляются после смены языка (скрытый виджет - при показе)
+        retranslation.register(self, self.retranslate_ui)
+        
     def init_ui(self):
         main_layout = QHBoxLayout()
         main_layout.setContentsMargins(10, 10, 10, 10)
@@ -313,9 +323,9 @@ class GameWidget(QWidget):
         
     def setup_timers(self):
         """Настройка таймеров для обновления игры"""
-        self.update_timer = QTimer()
-        self.update_timer.timeout.connect(self.update_ui)
-        self.update_timer.start(1000)
+        # Игровое время двигают общие часы: виджет только подписан на их события
+        game_clock.subscribe(ClockTick, self.on_clock_tick)
+        game_clock.subscribe(HourChanged, self.on_hour_changed)
         
         self.log_timer = QTimer()
         self.log_timer.timeout.connect(self.random_security_event)
@@ -325,27 +335,19 @@ class GameWidget(QWidget):
         self.special_email_timer.timeout.connect(self.check_special_emails)
         self.special_email_timer.start(30000)
         
-        self.game_time_timer = QTimer()
-        self.game_time_timer.timeout.connect(self.update_game_time)
-        self.game_time_timer.start(1000)
-        
-    def update_game_time(self):
-        """Обновить игровое время"""
-        if not self.game_state.time_paused:
-            previous_hour = self.game_state.game_time.get('current_hour', 9)
-            
-            self.game_state.update_time(1)
-            
-            if hasattr(self, 'time_widget'):
-                self.time_widget.update_display()
-            
-            self.update_ui()
-            
-            if hasattr(self, 'right_stack') and self.right_stack.currentIndex() == 1:
-                current_hour = self.game_state.game_time.get('current_hour', 9)
-                if current_hour != previous_hour:
-                    if hasattr(self, 'mail_widget'):
-                        self.mail_widget.load_emails()
+    def on_clock_tick(self, event):
+        """Игровое время продвинулось (часы обновляет сам TimeWidget)"""
+        if not self.isVisible():
+            # Скрытый виджет обновит MainWindow.update_game_interface при показе
+            return
+        self.update_game_data()
+        self.update_mail_button()
+    
+    def on_hour_changed(self, event):
+        """Сменился игровой час: могла прийти новая почта"""
+        if self.isVisible() and hasattr(self, 'right_stack') and self.right_stack.currentIndex() == 1:
+            if hasattr(self, 'mail_widget'):
+                self.mail_widget.load_emails()
         
     def update_game_data(self):
         """Обновить данные игры в виджете"""
@@ -562,11 +564,6 @@ class GameWidget(QWidget):
     def resizeEvent(self, event):
         """Обработчик изменения размера окна"""
         super().resizeEvent(event)
-    
-    def closeEvent(self, event):
-        """Сохранить игру при закрытии"""
-        self.game_state.save()
-        event.accept()
 
 
 class MailWidget(QWidget):
@@ -620,9 +617,35 @@ class MailWidget(QWidget):
         self.mail_list_label = QLabel(translation.t("email.inbox_messages"))
         self.mail_list_label.setStyleSheet("font-weight: bold; color: #9370db; font-size: 13px;")
         
-        self.mail_list = QListWidget()
+        # Поиск по письмам: слова (по началу слова) и фильтры is:unread,
+        # is:important, is:mvd, is:spam, spam:<тип>
+        self.search_edit = QLineEdit()
+        self.search_edit.setClearButtonEnabled(True)
+        self.search_edit.setPlaceholderText(self.search_placeholder())
+        self.search_edit.textChanged.connect(self.apply_search)
+        self.search_edit.setStyleSheet("""
+            QLineEdit {
+                background-color: #000000;
+                border: 1px solid #4b0082;
+                border-radius: 5px;
+                padding: 5px;
+                color: #cccccc;
+                font-size: 12px;
+            }
+            QLineEdit:focus {
+                border-color: #8a2be2;
+            }
+        """)
+        
+        # Список писем - представление над моделью: строки создаются
+        # только для видимой части списка
+        self.mail_model = MailListModel(self)
+        self.mail_list = QListView()
+        self.mail_list.setModel(self.mail_model)
+        self.mail_list.setUniformItemSizes(True)
+        self.mail_list.setEditTriggers(QListView.NoEditTriggers)
         self.mail_list.setStyleSheet("""
-            QListWidget {
+            QListView {
                 background-color: #000000;
                 border: 1px solid #4b0082;
                 border-radius: 5px;
@@ -630,16 +653,16 @@ class MailWidget(QWidget):
                 color: #cccccc;
                 font-size: 12px;
             }
-            QListWidget::item {
+            QListView::item {
                 padding: 8px;
                 border-bottom: 1px solid #333333;
             }
-            QListWidget::item:selected {
+            QListView::item:selected {
                 background-color: #4b0082;
                 border: 1px solid #9370db;
                 border-radius: 3px;
             }
-            QListWidget::item:hover {
+            QListView::item:hover {
                 background-color: #2d004d;
             }
             QScrollBar:vertical {
@@ -730,7 +753,9 @@ class MailWidget(QWidget):
         button_layout.addWidget(self.delete_button)
         button_layout.addStretch()
         
-        self.mail_list.currentRowChanged.connect(self.show_mail_content)
+        self.mail_list.selectionModel().currentRowChanged.connect(
+            lambda current, previous: self.show_mail_content(current.row())
+        )
         
         self.mail_view.anchorClicked.connect(self.on_link_clicked)
         
@@ -738,6 +763,7 @@ class MailWidget(QWidget):
         layout.addWidget(self.mail_stats)
         layout.addWidget(separator)
         layout.addWidget(self.mail_list_label)
+        layout.addWidget(self.search_edit)
         layout.addWidget(self.mail_list)
         layout.addWidget(self.mail_view_label)
         layout.addWidget(self.mail_view)
@@ -747,8 +773,8 @@ class MailWidget(QWidget):
         
         self.load_emails()
         
-        if self.mail_list.count() > 0:
-            self.mail_list.setCurrentRow(0)
+        if self.mail_model.rowCount() > 0:
+            self.mail_list.setCurrentIndex(self.mail_model.index(0, 0))
     
     def update_game_state(self, new_game_state):
         """Обновить игровое состояние"""
@@ -767,54 +793,46 @@ class MailWidget(QWidget):
     
     def load_emails(self):
         """Загрузить письма"""
-        self.mail_list.clear()
-        
-        if self.game_state and self.game_state.email_system:
-            emails = self.game_state.email_system.get_emails("inbox")
-            
-            sorted_emails = sorted(emails, 
-                                  key=lambda e: (
-                                      not e.important,
-                                      not ("мвд" in e.sender_key.lower() or "mvd" in e.sender_key.lower()),
-                                      not e.read,
-                                      e.date
-                                  ), 
-                                  reverse=False)
-            
-            for email in sorted_emails:
-                icon = "✉" if not email.read else "✓"
-                if email.important:
-                    icon = "⚠" if not email.read else "✓⚠"
-                
-                sender = email.get_sender()
-                subject = email.get_subject()
-                item_text = f"{icon} [{email.date}] {sender}: {subject}"
-                item = QListWidgetItem(item_text)
-                
-                if not email.read:
-                    item.setForeground(QColor("#ffffff"))
-                    item.setFont(QFont("Arial", 13, QFont.Bold))
-                else:
-                    item.setForeground(QColor("#888888"))
-                    item.setFont(QFont("Arial", 12, QFont.Normal))
-                
-                if email.important and not email.read:
-                    item.setBackground(QColor(100, 0, 0, 50))
-                
-                item.setData(Qt.UserRole, email.id)
-                self.mail_list.addItem(item)
+        # Модель сама следит за изменениями почты; здесь только смена
+        # системы почты и пересортировка строк с изменённым статусом
+        email_system = self.game_state.email_system if self.game_state else None
+        if email_system is not self.mail_model.email_system:
+            self.mail_model.set_email_system(email_system)
+            self.apply_search()
+        self.mail_model.resort()
         
         self.update_mail_stats()
     
+    def search_placeholder(self) -> str:
+        """Подсказка в строке поиска"""
+        return translation.t("email.search_placeholder", "Поиск: слова, is:unread, is:important, is:mvd, spam:<тип>")
+    
+    def apply_search(self, query: str = None):
+        """Оставить в списке только письма, подходящие под запрос"""
+        if query is None:
+            query = self.search_edit.text()
+        email_system = self.mail_model.email_system
+        if not query.strip() or email_system is None:
+            if self.mail_model.is_filtered():
+                self.mail_model.set_filter(None)
+            return
+        self.mail_model.set_filter(email_system.search(query),
+                                   lambda email: email_matches(email, query))
+    
     def show_mail_content(self, index):
         """Показать содержимое письма"""
         if index >= 0 and self.game_state and self.game_state.email_system:
-            item = self.mail_list.item(index)
-            if item:
-                email_id = item.data(Qt.UserRole)
+            if self.mail_model.is_archived_row(index):
+                # Письмо из архива: только просмотр
+                email = self.mail_model.email_at(index)
+                if email:
+                    self.mail_view.setHtml(email.get_html_content())
+                return
+            email_id = self.mail_model.email_id_at(index)
+            if email_id is not None:
                 email = self.game_state.email_system.get_email_by_id(email_id)
                 if email:
-                    html_content = email.get_html_content()
+                    html_content = self.game_state.email_system.render_html(email_id)
                     self.mail_view.setHtml(html_content)
                     
                     # Если письмо не прочитано, отправляем сигнал о прочтении
@@ -838,26 +856,12 @@ class MailWidget(QWidget):
     
     def mark_as_read(self):
         """Пометить письмо как прочитанное"""
-        index = self.mail_list.currentRow()
+        index = self.mail_list.currentIndex().row()
         if index >= 0 and self.game_state and self.game_state.email_system:
-            item = self.mail_list.item(index)
-            if item:
-                email_id = item.data(Qt.UserRole)
-                
-                email = self.game_state.email_system.get_email_by_id(email_id)
-                if not email:
-                    return
-                
+            email_id = self.mail_model.email_id_at(index)
+            if email_id is not None:
+                # Строку списка обновит модель по событию системы почты
                 if self.game_state.email_system.mark_as_read(email_id):
-                    icon = "✓" + ("⚠" if email.important else "")
-                    sender = email.get_sender()
-                    subject = email.get_subject()
-                    item_text = f"{icon} [{email.date}] {sender}: {subject}"
-                    item.setText(item_text)
-                    item.setForeground(QColor("#888888"))
-                    item.setFont(QFont("Arial", 12, QFont.Normal))
-                    item.setBackground(QColor(0, 0, 0, 0))
-                    
                     self.update_mail_stats()
                     
                     # Отправляем специальный сигнал для отметки как прочитанного
@@ -865,14 +869,11 @@ class MailWidget(QWidget):
     
     def delete_mail(self):
         """Удалить письмо"""
-        index = self.mail_list.currentRow()
+        index = self.mail_list.currentIndex().row()
         if index >= 0 and self.game_state and self.game_state.email_system:
-            item = self.mail_list.item(index)
-            if item:
-                email_id = item.data(Qt.UserRole)
-                
+            email_id = self.mail_model.email_id_at(index)
+            if email_id is not None:
                 if self.game_state.email_system.delete_email(email_id):
-                    self.mail_list.takeItem(index)
                     self.mail_view.setHtml("""<div style="color: #cccccc; font-family: 'Courier New', monospace; padding: 10px;">
                         Письмо удалено
                     </div>""")
@@ -885,9 +886,14 @@ class MailWidget(QWidget):
         self.mail_view_label.setText(translation.t("email.view_message"))
         self.read_button.setText(translation.t("email.mark_as_read"))
         self.delete_button.setText(translation.t("email.delete"))
+        self.search_edit.setPlaceholderText(self.search_placeholder())
         
         self.update_mail_stats()
-        self.load_emails()
+        self.mail_model.retranslate()
+        
+        # Тексты писем на новом языке - другие результаты поиска
+        if self.search_edit.text().strip():
+            self.apply_search()
 
 
 class OfficeView(QWidget):
@@ -906,34 +912,26 @@ class OfficeView(QWidget):
         self.blink_state = 0
         self.scan_line_y = 0
         self.scan_line_speed = 2
-        self.static_particles = []
         self.camera_glitch = False
         self.camera_glitch_timer = 0
         
+        # Фон, сетка, окна и столы не двигаются - рисуются один раз на размер
+        self.layers = LayerCache(self)
+        
         self.init_effects()
         self.setup_animation()
         
     def init_effects(self):
         """Инициализация эффектов"""
-        for _ in range(20):
-            self.static_particles.append({
-                'x': random.randint(0, self.width()),
-                'y': random.randint(0, self.height()),
-                'size': random.randint(1, 2),
-                'alpha': random.randint(20, 60),
-                'speed': random.uniform(0.5, 1.0),
-                'direction': random.uniform(0, 2 * math.pi),
-                'lifetime': random.randint(30, 100)
-            })
+        palette = [QColor(255, 0, 0), QColor(230, 60, 40), QColor(255, 100, 100), QColor(210, 30, 80)]
+        self.static_particles = ParticleField(20, self.width(), self.height(), palette,
+                                              size=(1, 2), alpha=(20, 60),
+                                              speed=(0.5, 1.0), lifetime=(30, 100))
             
-        self.effect_timer = QTimer()
-        self.effect_timer.timeout.connect(self.update_camera_effects)
-        self.effect_timer.start(50)
+        self.effect_timer = animation_driver.register(self, self.update_camera_effects, 50)
         
     def setup_animation(self):
-        self.timer = QTimer()
-        self.timer.timeout.connect(self.update_animation)
-        self.timer.start(500)
+        self.timer = animation_driver.register(self, self.update_animation, 500)
         
     def update_animation(self):
         """Обновление анимации"""
@@ -949,20 +947,8 @@ class OfficeView(QWidget):
         """Обновление эффектов камеры"""
         self.scan_line_y = (self.scan_line_y + self.scan_line_speed) % (self.height() + 30)
         
-        for particle in self.static_particles:
-            particle['x'] += math.cos(particle['direction']) * particle['speed']
-            particle['y'] += math.sin(particle['direction']) * particle['speed']
-            particle['lifetime'] -= 1
-            
-            if (particle['x'] < 0 or particle['x'] > self.width() or 
-                particle['y'] < 0 or particle['y'] > self.height() or
-                particle['lifetime'] <= 0):
-                particle.update({
-                    'x': random.randint(0, self.width()),
-                    'y': random.randint(0, self.height()),
-                    'lifetime': random.randint(30, 100),
-                    'alpha': random.randint(20, 60)
-                })
+        self.static_particles.set_count(quality_governor.particle_count(20))
+        self.static_particles.step(self.width(), self.height())
         
         if random.random() < 0.02 and not self.camera_glitch:
             self.camera_glitch = True
@@ -975,22 +961,78 @@ class OfficeView(QWidget):
         
         self.update()
         
+    @timed_paint
     def paintEvent(self, event):
         """Отрисовка офиса"""
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing)
         
-        bg_gradient = QLinearGradient(0, 0, 0, self.height())
+        painter.drawPixmap(0, 0, self.layers.get("room", self.render_room))
+        
+        glow = quality_governor.level.glow
+        painter.setFont(QFont("Arial", 8, QFont.Bold))
+        for person in self.people:
+            if glow:
+                glow_radius = 12
+                glow_gradient = QRadialGradient(
+                    person["x"] + 7, person["y"] + 7, 
+                    glow_radius
+                )
+                glow_gradient.setColorAt(0, QColor(person["color"].red(), 
+                                                 person["color"].green(), 
+                                                 person["color"].blue(), 100))
+                glow_gradient.setColorAt(1, QColor(person["color"].red(), 
+                                                 person["color"].green(), 
+                                                 person["color"].blue(), 0))
+                
+                painter.setBrush(glow_gradient)
+                painter.setPen(Qt.NoPen)
+                painter.drawEllipse(person["x"] - 5, person["y"] - 5, 
+                                  glow_radius * 2, glow_radius * 2)
+            
+            painter.setBrush(person["color"])
+            painter.setPen(QPen(QColor(255, 255, 255, 150), 1))
+            painter.drawEllipse(person["x"], person["y"], 15, 15)
+            
+            painter.setPen(QColor(220, 220, 220))
+            painter.drawText(person["x"] - 15, person["y"] - 8, person["name"])
+            
+            status_color = QColor(0, 255, 0) if person["status"] == translation.t("office.status_working") else QColor(255, 165, 0)
+            painter.setPen(status_color)
+            painter.setFont(QFont("Arial", 7))
+            painter.drawText(person["x"] - 10, person["y"] + 30, person["status"])
+            
+            if person["typing"] and self.blink_state:
+                typing_color = QColor(255, 255, 200)
+                painter.setBrush(typing_color)
+                painter.setPen(Qt.NoPen)
+                
+                for i in range(3):
+                    rect_width = random.randint(10, 20)
+                    rect_height = 3
+                    rect_x = person["x"] + 10 + i * 25
+                    rect_y = person["y"] - 5 + random.randint(0, 3)
+                    
+                    painter.setOpacity(0.7 - i * 0.2)
+                    painter.drawRect(rect_x, rect_y, rect_width, rect_height)
+                
+                painter.setOpacity(1.0)
+        
+        self.draw_camera_effects(painter)
+        
+    def render_room(self, painter, width, height):
+        """Статичный слой офиса: фон, сетка, окна и столы"""
+        bg_gradient = QLinearGradient(0, 0, 0, height)
         bg_gradient.setColorAt(0, QColor(20, 20, 40))
         bg_gradient.setColorAt(1, QColor(10, 10, 25))
-        painter.fillRect(self.rect(), bg_gradient)
+        painter.fillRect(0, 0, width, height, bg_gradient)
         
         painter.setPen(QPen(QColor(40, 40, 80, 100), 1))
         grid_size = 20
-        for x in range(0, self.width(), grid_size):
-            painter.drawLine(x, 0, x, self.height())
-        for y in range(0, self.height(), grid_size):
-            painter.drawLine(0, y, self.width(), y)
+        for x in range(0, width, grid_size):
+            painter.drawLine(x, 0, x, height)
+        for y in range(0, height, grid_size):
+            painter.drawLine(0, y, width, y)
         
         painter.setBrush(QColor(30, 30, 60, 150))
         painter.setPen(QPen(QColor(100, 100, 200, 200), 1))
@@ -1022,75 +1064,10 @@ class OfficeView(QWidget):
                 y_offset = desk[1] + 10 + i * 5
                 painter.drawLine(desk[0] + 5, y_offset, desk[0] + 55, y_offset)
         
-        painter.setFont(QFont("Arial", 8, QFont.Bold))
-        for person in self.people:
-            glow_radius = 12
-            glow_gradient = QRadialGradient(
-                person["x"] + 7, person["y"] + 7, 
-                glow_radius
-            )
-            glow_gradient.setColorAt(0, QColor(person["color"].red(), 
-                                             person["color"].green(), 
-                                             person["color"].blue(), 100))
-            glow_gradient.setColorAt(1, QColor(person["color"].red(), 
-                                             person["color"].green(), 
-                                             person["color"].blue(), 0))
-            
-            painter.setBrush(glow_gradient)
-            painter.setPen(Qt.NoPen)
-            painter.drawEllipse(person["x"] - 5, person["y"] - 5, 
-                              glow_radius * 2, glow_radius * 2)
-            
-            painter.setBrush(person["color"])
-            painter.setPen(QPen(QColor(255, 255, 255, 150), 1))
-            painter.drawEllipse(person["x"], person["y"], 15, 15)
-            
-            painter.setPen(QColor(220, 220, 220))
-            painter.drawText(person["x"] - 15, person["y"] - 8, person["name"])
-            
-            status_color = QColor(0, 255, 0) if person["status"] == translation.t("office.status_working") else QColor(255, 165, 0)
-            painter.setPen(status_color)
-            painter.setFont(QFont("Arial", 7))
-            painter.drawText(person["x"] - 10, person["y"] + 30, person["status"])
-            
-            if person["typing"] and self.blink_state:
-                typing_color = QColor(255, 255, 200)
-                painter.setBrush(typing_color)
-                painter.setPen(Qt.NoPen)
-                
-                for i in range(3):
-                    rect_width = random.randint(10, 20)
-                    rect_height = 3
-                    rect_x = person["x"] + 10 + i * 25
-                    rect_y = person["y"] - 5 + random.randint(0, 3)
-                    
-                    painter.setOpacity(0.7 - i * 0.2)
-                    painter.drawRect(rect_x, rect_y, rect_width, rect_height)
-                
-                painter.setOpacity(1.0)
-        
-        self.draw_camera_effects(painter)
-        
     def draw_camera_effects(self, painter):
         """Рисование эффектов камеры"""
         painter.setOpacity(0.1)
-        for particle in self.static_particles:
-            alpha = particle['alpha'] * (particle['lifetime'] / 100.0)
-            color = QColor(
-                random.randint(200, 255),
-                random.randint(0, 100),
-                random.randint(0, 100),
-                int(alpha)
-            )
-            
-            painter.setBrush(color)
-            painter.setPen(Qt.NoPen)
-            painter.drawRect(
-                int(particle['x']),
-                int(particle['y']),
-                particle['size'],
-                particle['size']
-            )
+        self.static_particles.draw(painter)
         
         scan_height = 25
         scan_gradient = QLinearGradient(0, self.scan_line_y, 0, self.scan_line_y + scan_height)
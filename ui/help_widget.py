@@ -5,6 +5,7 @@ from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout,
 from PySide6.QtCore import Qt, Signal
 from PySide6.QtGui import QFont
 from simple_translation import translation
+from ui.retranslation import retranslation
 
 class HelpWidget(QWidget):
     back_clicked = Signal()  # Изменено на back_clicked для совместимости
@@ -13,9 +14,9 @@ class HelpWidget(QWidget):
         super().__init__(parent)
         self.parent = parent
         self.translation = translation
-        # Подписываемся на смену языка
-        translation.on_language_changed(self.update_texts)
         self.init_ui()
+        # Подписываемся на смену языка
+        retranslation.register(self, self.update_texts)
         
     def init_ui(self):
         layout = QVBoxLayout()
@@ -0,0 +1,64 @@
+# ui/layer_cache.py
+"""
+Кэш статичных слоёв отрисовки.
+
+Неподвижные части эффектов (сетка и мебель офиса, виньетка, подписи,
+рисунок сканирующих линий) рисуются один раз в QPixmap и в каждом кадре
+только накладываются drawPixmap. Слой перерисовывается, когда меняется
+размер виджета, масштаб экрана или вариант слоя (variant, например шаг
+линий при другом качестве), либо после invalidate() (например, при смене
+оформления).
+
+    self.layers = LayerCache(self)
+    painter.drawPixmap(0, 0, self.layers.get("room", self.render_room))
+
+render(painter, width, height) рисует слой в логических координатах
+виджета на прозрачном фоне.
+"""
+
+from typing import Callable, Dict, Optional, Tuple
+
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QPainter, QPixmap
+
+
+class LayerCache:
+    """Слои одного виджета: имя -> QPixmap под текущий размер"""
+
+    def __init__(self, widget):
+        self.widget = widget
+        self._layers: Dict[str, Tuple[tuple, QPixmap]] = {}
+        self.renders = 0  # Сколько раз слои перерисовывались (для отладки)
+
+    def get(self, name: str, render: Callable, width: Optional[int] = None,
+            height: Optional[int] = None, variant=None) -> QPixmap:
+        """Слой name; render(painter, width, height) вызывается только при промахе"""
+        width = self.widget.width() if width is None else width
+        height = self.widget.height() if height is None else height
+        ratio = self.widget.devicePixelRatioF()
+        key = (width, height, ratio, variant)
+
+        cached = self._layers.get(name)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        pixmap = QPixmap(max(1, round(width * ratio)), max(1, round(height * ratio)))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.transparent)
+        painter = QPainter(pixmap)
+        try:
+            painter.setRenderHint(QPainter.Antialiasing)
+            render(painter, width, height)
+        finally:
+            painter.end()
+
+        self._layers[name] = (key, pixmap)
+        self.renders += 1
+        return pixmap
+
+    def invalidate(self, name: Optional[str] = None):
+        """Перерисовать слой name (или все) при следующем get()"""
+        if name is None:
+            self._layers.clear()
+        else:
+            self._layers.pop(name, None)
@@ -0,0 +1,243 @@
+# ui/mail_model.py
+from bisect import bisect_left
+from typing import Dict, List, Optional
+
+from PySide6.QtCore import QAbstractListModel, QModelIndex, Qt
+from PySide6.QtGui import QColor, QFont
+
+from core.email_system import Email
+
+
+class MailListModel(QAbstractListModel):
+    """
+    Модель списка входящих писем поверх EmailSystem.
+
+    Порядок строк (важные, письма МВД, непрочитанные, по времени)
+    поддерживается отсортированным списком ключей: добавление и удаление
+    письма - бинарный поиск и один сигнал о строке. Текст строк не
+    хранится, а собирается только для видимых строк в data().
+
+    Смена флага прочтения обновляет строку на месте, как раньше в
+    QListWidget; строка переезжает на своё место при resort().
+
+    set_filter() оставляет в списке только результаты поиска.
+
+    После свежей почты идут письма из архива слота (от новых к старым):
+    они подгружаются страницами через canFetchMore/fetchMore, когда
+    список прокручен до конца, и доступны только для чтения.
+    """
+
+    EmailIdRole = Qt.UserRole
+
+    ARCHIVE_PAGE_SIZE = 100  # Писем архива за одну подгрузку
+    ARCHIVE_SCAN_LIMIT = 2000  # Сколько записей архива просмотреть за раз при поиске
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.email_system = None
+        self._rows: List[tuple] = []  # Ключи сортировки строк (последний элемент - id письма)
+        self._keys: Dict[int, tuple] = {}  # id письма -> ключ его строки
+        self._stale = set()  # Письма, ключ которых устарел (ждут resort)
+        self._filter = None  # id писем, оставленных поиском (None - все письма)
+        self._archive_match = None  # Проверка писем архива при поиске
+        self._archive_rows: List[Email] = []  # Подгруженные письма архива
+        self._archive_position = 0  # Номер записи архива, с которой продолжать (к старым)
+
+        self._unread_font = QFont("Arial", 13, QFont.Bold)
+        self._read_font = QFont("Arial", 12, QFont.Normal)
+        self._unread_color = QColor("#ffffff")
+        self._read_color = QColor("#888888")
+        self._important_background = QColor(100, 0, 0, 50)
+        self._archived_color = QColor("#666666")
+
+    def set_email_system(self, email_system):
+        """Показать письма другой системы почты"""
+        if email_system is self.email_system:
+            return
+        if self.email_system is not None:
+            self.email_system.remove_listener(self.on_email_changed)
+        self.email_system = email_system
+        if email_system is not None:
+            email_system.add_listener(self.on_email_changed)
+        self.rebuild()
+
+    def set_filter(self, email_ids=None, archive_match=None):
+        """Показывать только письма с этими id и письма архива, для которых archive_match(email)"""
+        self._filter = set(email_ids) if email_ids is not None else None
+        self._archive_match = archive_match if email_ids is not None else None
+        self.rebuild()
+
+    def is_filtered(self) -> bool:
+        """Включён ли фильтр поиска"""
+        return self._filter is not None
+
+    def sort_key(self, email) -> tuple:
+        """Ключ порядка писем в списке"""
+        return (not email.important, not self.email_system.is_mvd(email.id),
+                not email.read, email.date, email.id)
+
+    def rebuild(self):
+        """Заново построить список строк"""
+        self.beginResetModel()
+        self._stale.clear()
+        if self.email_system is not None:
+            emails = self.email_system.get_emails("inbox")
+            if self._filter is not None:
+                emails = [email for email in emails if email.id in self._filter]
+            self._keys = {email.id: self.sort_key(email) for email in emails}
+        else:
+            self._keys = {}
+        self._rows = sorted(self._keys.values())
+        self._archive_rows = []
+        self._archive_position = self.email_system.archive.count() if self.email_system is not None else 0
+        self.endResetModel()
+
+    def resort(self):
+        """Переставить строки, у которых изменился ключ сортировки"""
+        if not self._stale or self.email_system is None:
+            return
+
+        self.layoutAboutToBeChanged.emit()
+        old_rows = self._rows
+        for email_id in self._stale:
+            email = self.email_system.get_email_by_id(email_id)
+            if email is not None and email_id in self._keys:
+                self._keys[email_id] = self.sort_key(email)
+        self._stale.clear()
+        self._rows = sorted(self._keys.values())
+
+        # Выделение и текущая строка переезжают вместе с письмами
+        new_positions = {key[-1]: row for row, key in enumerate(self._rows)}
+        old_indexes = self.persistentIndexList()
+        new_indexes = [self.index(new_positions[old_rows[index.row()][-1]], 0)
+                       for index in old_indexes]
+        self.changePersistentIndexList(old_indexes, new_indexes)
+        self.layoutChanged.emit()
+
+    def row_of(self, email_id: int) -> int:
+        """Номер строки письма (или -1)"""
+        key = self._keys.get(email_id)
+        if key is None:
+            return -1
+        return bisect_left(self._rows, key)
+
+    def email_id_at(self, row: int) -> Optional[int]:
+        """id письма в строке"""
+        if 0 <= row < len(self._rows):
+            return self._rows[row][-1]
+        if 0 <= row - len(self._rows) < len(self._archive_rows):
+            return self._archive_rows[row - len(self._rows)].id
+        return None
+
+    def email_at(self, row: int) -> Optional[Email]:
+        """Письмо в строке (из почты или из архива)"""
+        if 0 <= row < len(self._rows):
+            return self.email_system.get_email_by_id(self._rows[row][-1])
+        if 0 <= row - len(self._rows) < len(self._archive_rows):
+            return self._archive_rows[row - len(self._rows)]
+        return None
+
+    def is_archived_row(self, row: int) -> bool:
+        """Строка с письмом из архива"""
+        return 0 <= row - len(self._rows) < len(self._archive_rows)
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self._archive_position > 0
+
+    def fetchMore(self, parent=QModelIndex()):
+        """Подгрузить следующую страницу писем архива"""
+        if parent.isValid() or self.email_system is None:
+            return
+        page = []
+        scanned = 0
+        for position, record in self.email_system.archive.iter_newest(self._archive_position):
+            scanned += 1
+            if record and record.get("email"):
+                email = Email.from_dict(record["email"])
+                if self.email_system.get_email_by_id(email.id) is None and (
+                        self._archive_match is None or self._archive_match(email)):
+                    page.append(email)
+            if len(page) >= self.ARCHIVE_PAGE_SIZE or scanned >= self.ARCHIVE_SCAN_LIMIT:
+                break
+        else:
+            position = 0
+        self._archive_position = position
+
+        if page:
+            first = self.rowCount()
+            self.beginInsertRows(QModelIndex(), first, first + len(page) - 1)
+            self._archive_rows.extend(page)
+            self.endInsertRows()
+
+    def on_email_changed(self, event: str, email):
+        """Изменение в EmailSystem (вызывается самой системой почты)"""
+        if event == "reset":
+            self.rebuild()
+        elif event == "added":
+            if self.email_system.get_email_folder(email.id) != "inbox":
+                return
+            if self._filter is not None and email.id not in self._filter:
+                # Новое письмо попадёт в выдачу при следующем поиске
+                return
+            key = self.sort_key(email)
+            row = bisect_left(self._rows, key)
+            self.beginInsertRows(QModelIndex(), row, row)
+            self._rows.insert(row, key)
+            self._keys[email.id] = key
+            self.endInsertRows()
+        elif event == "removed":
+            row = self.row_of(email.id)
+            if row < 0:
+                return
+            self.beginRemoveRows(QModelIndex(), row, row)
+            del self._rows[row]
+            del self._keys[email.id]
+            self._stale.discard(email.id)
+            self.endRemoveRows()
+        elif event == "updated":
+            row = self.row_of(email.id)
+            if row < 0:
+                return
+            self._stale.add(email.id)
+            index = self.index(row, 0)
+            self.dataChanged.emit(index, index)
+
+    def retranslate(self):
+        """Тексты строк зависят от языка - перерисовать все"""
+        if self.rowCount():
+            self.dataChanged.emit(self.index(0, 0), self.index(self.rowCount() - 1, 0))
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._rows) + len(self._archive_rows)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or self.email_system is None:
+            return None
+        if role == self.EmailIdRole:
+            return self.email_id_at(index.row())
+
+        email = self.email_at(index.row())
+        if email is None:
+            return None
+        archived = self.is_archived_row(index.row())
+
+        if role == Qt.DisplayRole:
+            icon = "✉" if not email.read else "✓"
+            if email.important:
+                icon = "⚠" if not email.read else "✓⚠"
+            if archived:
+                icon = "▤"
+            return f"{icon} [{email.date}] {email.get_sender()}: {email.get_subject()}"
+        if role == Qt.ForegroundRole:
+            if archived:
+                return self._archived_color
+            return self._read_color if email.read else self._unread_color
+        if role == Qt.FontRole:
+            return self._read_font if email.read else self._unread_font
+        if role == Qt.BackgroundRole:
+            if email.important and not email.read:
+                return self._important_background
+            return None
+        return None
@@ -10,7 +10,13 @@ from PySide6.QtGui import QKeySequence, QShortcut, QCloseEvent, QAction, QScreen
 from PySide6.QtWidgets import (QMainWindow, QStackedWidget, QWidget, QVBoxLayout, 
                                QMessageBox, QMenuBar, QMenu, QStatusBar)
 
+from core.email_retention import RetentionPolicy, set_default_policy
+from core.game_clock import HourChanged, game_clock
 from core.game_state import GameState
+from core.save_journal import get_save_journal
+from core.save_writer import save_writer
+from core.serializers import set_default_format
+from core.slot_index import get_slot_index
 from audio_manager import AudioManager
 from simple_translation import translation
 from ui.menu_widget import MenuWidget
@@ -21,6 +27,13 @@ from ui.about_widget import AboutWidget
 from ui.help_widget import HelpWidget
 from ui.name_input_dialog import NameInputDialog
 from ui.cutscene_widget import CutsceneWidget
+from ui.save_worker import SaveWorker
+from ui.clock_driver import QtClockDriver
+from ui.animation_driver import animation_driver
+from ui.quality_governor import quality_governor
+from ui.debug_overlay import DebugOverlay
+from ui.profiler import DEFAULT_SECONDS, hot_path_profiler
+from ui.retranslation import retranslation
 # ИМПОРТИРУЕМ БРАУЗЕР
 from ui.browser.browser_window import BrowserWindow
 
@@ -38,9 +51,23 @@ class MainWindow(QMainWindow):
         self.game_state: Optional[GameState] = None
         self.audio_manager = AudioManager()
         self.config = self.load_config()
+        
+        # Отложенная запись конфигурации: частые изменения сливаются в одну запись
+        self.config_save_timer = QTimer(self)
+        self.config_save_timer.setSingleShot(True)
+        self.config_save_timer.setInterval(500)
+        self.config_save_timer.timeout.connect(self.flush_config)
+        
         self.cutscene_widget: Optional[CutsceneWidget] = None
         self.browser_windows = []  # ДОБАВЛЯЕМ список открытых браузеров
         
+        # Сохранения пишутся в фоновом потоке
+        self.save_worker = SaveWorker(self)
+        self.save_worker.save_finished.connect(self.on_save_finished)
+        self.apply_save_settings()
+        self.apply_email_settings()
+        self.apply_performance_settings()
+        
         # Установка языка из конфигурации
         lang = self.config.get("game", {}).get("language", "ru")
         translation.load_translations(lang)
@@ -54,6 +81,13 @@ class MainWindow(QMainWindow):
         self.setup_shortcuts()
         self.setup_game_timer()
         
+        # Отладочный оверлей производительности (debug.show_fps)
+        self.debug_overlay = DebugOverlay(self)
+        self.apply_debug_settings()
+        
+        # Заголовок и меню-бар обновляются вместе с остальными виджетами
+        retranslation.register(self, self.retranslate_ui)
+        
         # Применяем настройки графики из конфига
         self.apply_graphics_settings()
         
@@ -138,25 +172,39 @@ class MainWindow(QMainWindow):
             }
         """)
         
-        # Если хотим оставить меню, создаем его
-        file_menu = menubar.addMenu("Файл")
+        # Если хотим оставить меню, создаем его (один раз - при смене языка меняются только подписи)
+        self.file_menu = menubar.addMenu("")
+        
+        self.new_game_action = QAction(self)
+        self.new_game_action.setShortcut(QKeySequence.New)
+        self.new_game_action.triggered.connect(self.show_name_input_dialog)
+        self.file_menu.addAction(self.new_game_action)
         
-        new_game_action = QAction("Новая игра", self)
-        new_game_action.setShortcut(QKeySequence.New)
-        new_game_action.triggered.connect(self.show_name_input_dialog)
-        file_menu.addAction(new_game_action)
+        self.load_game_action = QAction(self)
+        self.load_game_action.setShortcut(QKeySequence.Open)
+        self.load_game_action.triggered.connect(self.show_load_game_dialog)
+        self.file_menu.addAction(self.load_game_action)
         
-        load_game_action = QAction("Загрузить игру", self)
-        load_game_action.setShortcut(QKeySequence.Open)
-        load_game_action.triggered.connect(self.show_load_game_dialog)
-        file_menu.addAction(load_game_action)
+        self.file_menu.addSeparator()
         
-        file_menu.addSeparator()
+        self.exit_action = QAction(self)
+        self.exit_action.setShortcut(QKeySequence.Quit)
+        self.exit_action.triggered.connect(self.close)
+        self.file_menu.addAction(self.exit_action)
         
-        exit_action = QAction("Выход", self)
-        exit_action.setShortcut(QKeySequence.Quit)
-        exit_action.triggered.connect(self.close)
-        file_menu.addAction(exit_action)
+        self.retranslate_menubar()
+    
+    def retranslate_menubar(self):
+        """Обновить подписи меню-бара"""
+        self.file_menu.setTitle(translation.t("menubar.file", "Файл"))
+        self.new_game_action.setText(translation.t("menubar.new_game", "Новая игра"))
+        self.load_game_action.setText(translation.t("menubar.load_game", "Загрузить игру"))
+        self.exit_action.setText(translation.t("menubar.exit", "Выход"))
+    
+    def retranslate_ui(self):
+        """Обновить заголовок окна и меню-бар на текущем языке"""
+        self.setWindowTitle(translation.t("app.title", "SIBERIA-SOFTWARE - СИМУЛЯТОР КИБЕРБЕЗОПАСНОСТИ"))
+        self.retranslate_menubar()
     
     def setup_shortcuts(self):
         """Настройка горячих клавиш"""
@@ -180,18 +228,27 @@ class MainWindow(QMainWindow):
         fullscreen_shortcut = QShortcut(QKeySequence("F11"), self)
         fullscreen_shortcut.activated.connect(self.toggle_fullscreen)
         
+        # Оверлей производительности F3
+        overlay_shortcut = QShortcut(QKeySequence("F3"), self)
+        overlay_shortcut.activated.connect(self.toggle_debug_overlay)
+        
+        # Профиль горячих путей Ctrl+Shift+P
+        profile_shortcut = QShortcut(QKeySequence("Ctrl+Shift+P"), self)
+        profile_shortcut.activated.connect(self.start_profiling)
+        
         # Выход из игры Esc (только в игровом режиме)
         self.escape_shortcut = QShortcut(QKeySequence("Escape"), self)
         self.escape_shortcut.activated.connect(self.handle_escape)
     
     def setup_game_timer(self):
-        """Настройка таймера игрового времени"""
-        self.game_timer = QTimer()
-        self.game_timer.timeout.connect(self.update_game_time)
+        """Настройка игровых часов (единственный таймер игрового времени)"""
+        self.clock_driver = QtClockDriver(game_clock, self)
+        
+        # Конец рабочего дня - по событию смены часа, а не проверкой на каждом тике
+        game_clock.subscribe(HourChanged, self.on_game_hour_changed)
         
         # Начальное состояние - остановлено
-        self.game_time_paused = True
-        self.game_timer_interval = 1000  # 1 секунда
+        game_clock.pause()
         
         # Загружаем настройки времени из конфига
         time_config = self.config.get("game_time", {})
@@ -294,6 +351,18 @@ class MainWindow(QMainWindow):
         # Применяем настройки времени
         self.apply_time_settings()
         
+        # Применяем настройки сохранений
+        self.apply_save_settings()
+        
+        # Применяем правила хранения писем
+        self.apply_email_settings()
+        
+        # Применяем частоту кадров анимаций
+        self.apply_performance_settings()
+        
+        # Применяем отладочные настройки
+        self.apply_debug_settings()
+        
         # Обновляем все виджеты если нужно
         self.update_all_widgets()
         
@@ -308,6 +377,44 @@ class MainWindow(QMainWindow):
             self.audio_manager.update_settings(audio_config)
             print("[MainWindow] Аудио настройки применены")
     
+    def apply_save_settings(self):
+        """Применить настройки сохранений (формат новых снимков)"""
+        save_format = self.config.get("saves", {}).get("format", "json")
+        set_default_format(save_format)
+        print(f"[MainWindow] Формат сохранений: {save_format}")
+    
+    def apply_email_settings(self):
+        """Применить правила хранения писем (email.max_emails, auto_delete_old)"""
+        policy = RetentionPolicy.from_config(self.config.get("email", {}))
+        set_default_policy(policy)
+        print(f"[MainWindow] Правила хранения писем: {policy}")
+        
+        # Текущий ящик сразу приводится к новым правилам
+        if self.game_state and self.game_state.email_system:
+            self.game_state.email_system.enforce_retention()
+    
+    def apply_performance_settings(self):
+        """Применить частоту кадров анимаций и потолок качества эффектов (performance)"""
+        performance = self.config.get("performance", {})
+        animation_driver.set_max_fps(performance.get("max_fps", 60))
+        quality_governor.configure(self.config)
+    
+    def apply_debug_settings(self):
+        """Применить отладочные настройки (debug.show_fps)"""
+        show_fps = bool(self.config.get("debug", {}).get("show_fps", False))
+        self.debug_overlay.set_active(show_fps)
+    
+    def toggle_debug_overlay(self):
+        """Показать/скрыть оверлей производительности (F3)"""
+        self.config.setdefault("debug", {})["show_fps"] = not self.debug_overlay.active
+        self.apply_debug_settings()
+        self.save_config()
+    
+    def start_profiling(self):
+        """Записать профиль горячих путей в logs/ (Ctrl+Shift+P)"""
+        seconds = self.config.get("debug", {}).get("profile_seconds", DEFAULT_SECONDS)
+        hot_path_profiler.start(seconds)
+    
     def apply_time_settings(self):
         """Применить настройки времени"""
         time_config = self.config.get("game_time", {})
@@ -351,7 +458,7 @@ class MainWindow(QMainWindow):
             self.game_state.last_name = last_name
         
             # Сохраняем начальное состояние
-            self.game_state.save()
+            self.save_worker.submit(self.game_state)
         
             # Создаем и показываем кат-сцену
             self.show_cutscene()
@@ -417,7 +524,7 @@ class MainWindow(QMainWindow):
         # Сохраняем, что кат-сцена была показана
         if self.game_state:
             self.game_state.cutscene_shown = True
-            self.game_state.save()
+            self.save_worker.submit(self.game_state)
         
         # Начинаем смену в игре
         if self.game_state:
@@ -447,7 +554,7 @@ class MainWindow(QMainWindow):
         
         dialog = QDialog(self)
         dialog.setWindowTitle(translation.t("load.title", "Загрузить игру"))
-        dialog.setFixedSize(300, 200)
+        dialog.setFixedSize(400, 200)
         
         layout = QVBoxLayout(dialog)
         
@@ -455,23 +562,25 @@ class MainWindow(QMainWindow):
         
         # Кнопки для слотов 0-3
         for slot in range(4):
-            save_path = save_dir / f"slot_{slot}.json"
-            if save_path.exists():
-                try:
-                    with open(save_path, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                        name = f"{data.get('first_name', '')} {data.get('last_name', '')}".strip()
-                        if name:
-                            btn_text = translation.t("load.slot_with_name", "Слот {slot}: {name}").format(slot=slot, name=name)
-                        else:
-                            btn_text = translation.t("load.slot", "Слот {slot}").format(slot=slot)
-                except:
-                    btn_text = translation.t("load.slot_corrupted", "Слот {slot} (поврежден)").format(slot=slot)
+            status, info = self.get_slot_info(slot)
+            if status == "ok":
+                name = f"{info.get('first_name', '')} {info.get('last_name', '')}".strip()
+                if name:
+                    btn_text = translation.t("load.slot_details", "Слот {slot}: {name} — день {day}, {money}").format(
+                        slot=slot, name=name, day=info.get('day', 1), money=self.format_slot_money(info.get('money', 0))
+                    )
+                else:
+                    btn_text = translation.t("load.slot", "Слот {slot}").format(slot=slot)
+            elif status == "corrupted":
+                btn_text = translation.t("load.slot_corrupted", "Слот {slot} (поврежден)").format(slot=slot)
             else:
                 btn_text = translation.t("load.slot_empty", "Слот {slot} (пусто)").format(slot=slot)
             
             btn = QPushButton(btn_text)
-            btn.setEnabled(save_path.exists())
+            btn.setEnabled(status != "empty")
+            if info and info.get('saved_at'):
+                btn.setToolTip(translation.t("load.saved_at", "Сохранено: {time}").format(
+                    time=info['saved_at'].replace('T', ' ')))
             btn.clicked.connect(lambda checked, s=slot: self.load_game_and_close(dialog, s))
             layout.addWidget(btn)
         
@@ -490,9 +599,11 @@ class MainWindow(QMainWindow):
     def load_game(self, slot=0):
         """Загрузить игру из указанного слота"""
         try:
-            # Останавливаем текущий игровой таймер
-            if hasattr(self, 'game_timer') and self.game_timer.isActive():
-                self.game_timer.stop()
+            # Останавливаем часы: старая игра больше не должна идти
+            game_clock.attach(None)
+            
+            # Дожидаемся записи сохранений, поставленных в очередь
+            self.save_worker.wait()
             
             # Загружаем сохранение
             self.game_state = GameState.load(slot)
@@ -523,8 +634,8 @@ class MainWindow(QMainWindow):
     
     def start_game_timer(self):
         """Запустить игровой таймер"""
-        if not self.game_time_paused and self.game_state:
-            self.game_timer.start(self.game_timer_interval)
+        # Часы идут, если привязаны к игре и не на паузе
+        game_clock.attach(self.game_state)
     
     def save_game(self, slot=None):
         """Сохранить игру"""
@@ -536,20 +647,13 @@ class MainWindow(QMainWindow):
             # Используем save_slot из GameState или 0 по умолчанию
             slot_to_save = slot if slot is not None else getattr(self.game_state, 'save_slot', 0)
             
-            # Сохраняем игру
-            self.game_state.save(slot_to_save)
-            
-            # Обновляем save_slot в GameState
-            if slot is not None:
-                self.game_state.save_slot = slot
+            # Снимок состояния берётся здесь, запись идёт в фоновом потоке
+            self.save_worker.submit(self.game_state, slot_to_save)
             
             self.status_bar.showMessage(
-                translation.t("game.saved", "Игра сохранена в слот {slot}").format(slot=slot_to_save),
-                3000
+                translation.t("game.saving", "Сохранение в слот {slot}...").format(slot=slot_to_save)
             )
             
-            print(f"[MainWindow] Игра сохранена в слот {slot_to_save}")
-            
         except Exception as e:
             print(f"[MainWindow] Ошибка сохранения игры: {e}")
             QMessageBox.critical(
@@ -558,6 +662,22 @@ class MainWindow(QMainWindow):
                 translation.t("error.save_failed", "Не удалось сохранить игру: {error}").format(error=str(e))
             )
     
+    def on_save_finished(self, slot, success, error):
+        """Фоновое сохранение завершено"""
+        if success:
+            self.status_bar.showMessage(
+                translation.t("game.saved", "Игра сохранена в слот {slot}").format(slot=slot),
+                3000
+            )
+            print(f"[MainWindow] Игра сохранена в слот {slot}")
+        else:
+            print(f"[MainWindow] Ошибка сохранения игры: {error}")
+            QMessageBox.critical(
+                self,
+                translation.t("error.title", "Ошибка"),
+                translation.t("error.save_failed", "Не удалось сохранить игру: {error}").format(error=error)
+            )
+    
     def save_game_as(self):
         """Сохранить игру как..."""
         if not self.game_state:
@@ -568,7 +688,7 @@ class MainWindow(QMainWindow):
         
         dialog = QDialog(self)
         dialog.setWindowTitle(translation.t("save.title", "Сохранить игру"))
-        dialog.setFixedSize(300, 200)
+        dialog.setFixedSize(400, 200)
         
         layout = QVBoxLayout(dialog)
         
@@ -576,22 +696,24 @@ class MainWindow(QMainWindow):
         
         # Кнопки для слотов 0-3
         for slot in range(4):
-            save_path = Path("saves") / f"slot_{slot}.json"
-            if save_path.exists():
-                try:
-                    with open(save_path, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                        name = f"{data.get('first_name', '')} {data.get('last_name', '')}".strip()
-                        if name:
-                            btn_text = translation.t("save.overwrite_slot", "Слот {slot}: {name} (перезаписать)").format(slot=slot, name=name)
-                        else:
-                            btn_text = translation.t("save.overwrite", "Слот {slot} (перезаписать)").format(slot=slot)
-                except:
-                    btn_text = translation.t("save.slot", "Слот {slot}").format(slot=slot)
+            status, info = self.get_slot_info(slot)
+            if status == "ok":
+                name = f"{info.get('first_name', '')} {info.get('last_name', '')}".strip()
+                if name:
+                    btn_text = translation.t("save.overwrite_slot_details", "Слот {slot}: {name}, день {day} (перезаписать)").format(
+                        slot=slot, name=name, day=info.get('day', 1)
+                    )
+                else:
+                    btn_text = translation.t("save.overwrite", "Слот {slot} (перезаписать)").format(slot=slot)
+            elif status == "corrupted":
+                btn_text = translation.t("save.slot", "Слот {slot}").format(slot=slot)
             else:
                 btn_text = translation.t("save.slot_empty", "Слот {slot} (пусто)").format(slot=slot)
             
             btn = QPushButton(btn_text)
+            if info and info.get('saved_at'):
+                btn.setToolTip(translation.t("load.saved_at", "Сохранено: {time}").format(
+                    time=info['saved_at'].replace('T', ' ')))
             btn.clicked.connect(lambda checked, s=slot: self.save_game_and_close(dialog, s))
             layout.addWidget(btn)
         
@@ -602,6 +724,40 @@ class MainWindow(QMainWindow):
         
         dialog.exec()
     
+    def get_slot_info(self, slot):
+        """
+        Сведения о слоте из индекса сохранений, без чтения полного файла.
+        
+        Возвращает (статус, сведения), статус - "ok", "empty" или "corrupted".
+        """
+        journal = get_save_journal(slot)
+        if not journal.exists():
+            return "empty", None
+        
+        index = get_slot_index()
+        info = index.get(slot)
+        if info is None or 'day' not in info:
+            # Сохранение старой версии без записи в индексе - разбираем один раз
+            try:
+                data = journal.read()
+                info = {
+                    'first_name': data.get('first_name', ''),
+                    'last_name': data.get('last_name', ''),
+                    'day': data.get('day', 1),
+                    'money': data.get('money', 0)
+                }
+                index.update(slot, **info)
+            except Exception as e:
+                print(f"[MainWindow] Слот {slot} не читается: {e}")
+                return "corrupted", None
+        
+        return "ok", info
+    
+    @staticmethod
+    def format_slot_money(money):
+        """Баланс в том же виде, что и в игре"""
+        return f"{money:,.2f} ₽".replace(',', ' ')
+    
     def save_game_and_close(self, dialog, slot):
         """Сохранить игру в слот и закрыть диалог"""
         dialog.accept()
@@ -628,6 +784,9 @@ class MainWindow(QMainWindow):
         """Показать игровой интерфейс"""
         print("[MainWindow] Показываю игровой интерфейс")
         
+        # Часы идут для этой игры (новой или загруженной)
+        game_clock.attach(self.game_state)
+        
         # Создаем игровой виджет, если его нет
         if self.game_widget is None:
             print("[MainWindow] Создаю новый GameWidget")
@@ -808,8 +967,9 @@ class MainWindow(QMainWindow):
     
     def change_language(self, lang_code):
         """Сменить язык интерфейса"""
-        # Загружаем новый язык
-        translation.load_translations(lang_code)
+        # Загружаем новый язык (настройки уже могли его загрузить)
+        if translation.get_current_language() != lang_code:
+            translation.load_translations(lang_code)
         
         # Обновляем конфигурацию
         if "game" not in self.config:
@@ -817,10 +977,7 @@ class MainWindow(QMainWindow):
         self.config["game"]["language"] = lang_code
         self.save_config()
         
-        # Обновляем заголовок окна
-        self.setWindowTitle(translation.t("app.title", "SIBERIA-SOFTWARE - СИМУЛЯТОР КИБЕРБЕЗОПАСНОСТИ"))
-        
-        # Обновляем все виджеты
+        # Обновляем все виджеты (заголовок окна - вместе с ними)
         self.update_all_widgets()
         
         # Отправляем сигнал о смене языка
@@ -841,65 +998,26 @@ class MainWindow(QMainWindow):
     
     def update_all_widgets(self):
         """Обновить все виджеты при смене языка"""
-        # Обновляем меню
-        if hasattr(self, 'menu_widget') and self.menu_widget:
-            if hasattr(self.menu_widget, 'retranslate_ui'):
-                self.menu_widget.retranslate_ui()
-        
-        # Обновляем игровой виджет
-        if hasattr(self, 'game_widget') and self.game_widget:
-            if hasattr(self.game_widget, 'retranslate_ui'):
-                self.game_widget.retranslate_ui()
-        
-        # Обновляем виджет навыков
-        if hasattr(self, 'skills_widget') and self.skills_widget:
-            if hasattr(self.skills_widget, 'update_translations'):
-                self.skills_widget.update_translations()
-        
-        # Обновляем настройки
-        if hasattr(self, 'settings_widget') and self.settings_widget:
-            if hasattr(self.settings_widget, 'retranslate_ui'):
-                self.settings_widget.retranslate_ui()
-        
-        # Обновляем about
-        if hasattr(self, 'about_widget') and self.about_widget:
-            if hasattr(self.about_widget, 'retranslate_ui'):
-                self.about_widget.retranslate_ui()
-        
-        # Обновляем help
-        if hasattr(self, 'help_widget') and self.help_widget:
-            if hasattr(self.help_widget, 'retranslate_ui'):
-                self.help_widget.retranslate_ui()
-        
-        # Обновляем меню бар
-        self.setup_menubar()
+        # Видимые виджеты обновятся одним проходом на следующем обороте цикла
+        # событий, скрытые (другие страницы стека) - когда их покажут
+        retranslation.invalidate()
     
-    def update_game_time(self):
-        """Обновить игровое время"""
-        if self.game_state and not self.game_time_paused:
-            # Обновляем время в состоянии игры
-            self.game_state.update_time()
-            
-            # Обновляем виджет времени, если он существует
-            if self.game_widget and hasattr(self.game_widget, 'time_widget'):
-                self.game_widget.time_widget.update_display()
-            
-            # Проверяем конец рабочего дня
-            if hasattr(self.game_state, 'is_workday_over') and self.game_state.is_workday_over():
-                self.end_workday()
+    def on_game_hour_changed(self, event):
+        """Смена игрового часа: конец рабочего дня"""
+        if not self.game_state:
+            return
+        workday_end = self.game_state.game_time.get('workday_end', 18)
+        # Только при переходе через конец дня - раньше игра сохранялась на каждом тике после него
+        if event.previous_hour < workday_end <= event.hour:
+            self.end_workday()
     
     def set_game_time_speed(self, speed):
         """Установить скорость игрового времени"""
-        # Преобразуем скорость в интервал таймера
         if speed <= 0:
             speed = 0.1  # Минимальная скорость
         
-        # Вычисляем интервал таймера (в миллисекундах)
-        self.game_timer_interval = int(1000 / speed)
-        
-        # Обновляем таймер, если он запущен
-        if self.game_timer.isActive():
-            self.game_timer.setInterval(self.game_timer_interval)
+        # Интервал тиков пересчитывают часы, драйвер перенастраивает таймер
+        game_clock.set_time_scale(speed)
         
         # Сохраняем настройку в конфиг
         if "game_time" not in self.config:
@@ -909,32 +1027,28 @@ class MainWindow(QMainWindow):
     
     def toggle_game_time(self):
         """Переключить паузу игрового времени"""
-        if self.game_time_paused:
+        if game_clock.paused:
             self.resume_game_time()
         else:
             self.pause_game_time()
     
     def pause_game_time(self):
         """Приостановить игровое время"""
-        if self.game_timer.isActive():
-            self.game_timer.stop()
-            self.game_time_paused = True
+        if game_clock.running:
             self.status_bar.showMessage(translation.t("game.time_paused", "Время приостановлено"), 2000)
         
-        # Также пауза в состоянии игры
-        if self.game_state:
-            self.game_state.pause_game_time()
+        # Пауза часов ставит на паузу и состояние игры
+        game_clock.pause()
     
     def resume_game_time(self):
         """Возобновить игровое время"""
-        if not self.game_timer.isActive() and self.game_state:
-            self.game_timer.start(self.game_timer_interval)
-            self.game_time_paused = False
+        if not self.game_state:
+            return
+        if not game_clock.running:
+            game_clock.attach(self.game_state)
             self.status_bar.showMessage(translation.t("game.time_resumed", "Время возобновлено"), 2000)
         
-        # Также возобновление в состоянии игры
-        if self.game_state:
-            self.game_state.resume_game_time()
+        game_clock.resume()
     
     def toggle_game_pause(self):
         """Переключить паузу игры"""
@@ -1039,14 +1153,30 @@ class MainWindow(QMainWindow):
                 "show_time_widget": True,
                 "start_year": 2140
             },
+            "email": {
+                "max_emails": 100,
+                "auto_delete_old": False,
+                "max_email_age_days": 7,
+                "spam_first_eviction": True,
+                "archive_evicted": True,
+                "archive_read_after_days": 3
+            },
+            "saves": {
+                "format": "json"
+            },
             "intro_shown": False
         }
     
     def save_config(self):
+        """Запланировать сохранение конфигурации (запись выполнится одна на серию изменений)"""
+        self.config_save_timer.start()
+    
+    def flush_config(self):
         """Сохранить конфигурацию в файл"""
+        self.config_save_timer.stop()
         try:
-            with open("config.json", 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, ensure_ascii=False, indent=2)
+            text = json.dumps(self.config, ensure_ascii=False, indent=2)
+            save_writer.write_atomic("config.json", text)
             print("[MainWindow] Конфигурация сохранена")
         except Exception as e:
             print(f"[MainWindow] Ошибка сохранения конфигурации: {e}")
@@ -1074,8 +1204,8 @@ class MainWindow(QMainWindow):
             self.config["graphics"]["window_width"] = self.width()
             self.config["graphics"]["window_height"] = self.height()
         
-        # Сохраняем конфигурация
-        self.save_config()
+        # Сохраняем конфигурацию сразу, не дожидаясь отложенной записи
+        self.flush_config()
         
         # Сохраняем игру, если есть активная
         if self.game_state:
@@ -1084,9 +1214,14 @@ class MainWindow(QMainWindow):
             except:
                 pass
         
+        # Дожидаемся фоновых сохранений и сбрасываем на диск хвосты журналов
+        self.save_worker.shutdown()
+        save_writer.sync()
+        
         # Останавливаем таймеры
-        if hasattr(self, 'game_timer'):
-            self.game_timer.stop()
+        if hasattr(self, 'clock_driver'):
+            game_clock.pause()
+            self.clock_driver.stop()
         
         print("[MainWindow] Приложение завершает работу")
         event.accept()
\ No newline at end of file
@@ -5,8 +5,11 @@ from PySide6.QtCore import Qt, QTimer, Signal, QPropertyAnimation, QEasingCurve
 from PySide6.QtGui import (QPainter, QLinearGradient, QColor, QPen, QBrush, 
                           QFont, QRadialGradient, QFontMetrics)
 from simple_translation import translation
+from ui.animation_driver import animation_driver
+from ui.particles import ParticleField
+from ui.quality_governor import quality_governor, timed_paint
+from ui.retranslation import retranslation
 import random
-import math
 import json
 import os
 
@@ -66,7 +69,7 @@ class MenuWidget(QWidget):
         QTimer.singleShot(100, self.start_animations)
         
         # Подписываемся на смену языка СРАЗУ
-        translation.on_language_changed(self.retranslate_ui)
+        retranslation.register(self, self.retranslate_ui)
         
         # Вызываем обновление переводов сразу после инициализации
         QTimer.singleShot(50, self.retranslate_ui)
@@ -474,13 +477,10 @@ class MenuWidget(QWidget):
         if not self.config.get("graphics", {}).get("enable_effects", True):
             return
         
-        # Таймер для обновления эффектов
-        self.effect_timer = QTimer()
-        self.effect_timer.timeout.connect(self.update_effects)
-        self.effect_timer.start(30)
+        # Шаг эффектов в общем драйвере анимаций
+        self.effect_timer = animation_driver.register(self, self.update_effects, 30)
         
         # Частицы для эффектов
-        self.particles = []
         self.init_particles(20)
         
         # Эффект сканирующих линий
@@ -499,21 +499,11 @@ class MenuWidget(QWidget):
     
     def init_particles(self, count):
         """Инициализация частиц"""
-        for _ in range(count):
-            self.particles.append({
-                'x': random.randint(0, self.width()),
-                'y': random.randint(0, self.height()),
-                'size': random.randint(1, 3),
-                'speed': random.uniform(0.5, 2.0),
-                'color': QColor(
-                    random.randint(0, 100),
-                    random.randint(150, 255),
-                    random.randint(200, 255),
-                    random.randint(30, 80)
-                ),
-                'direction': random.uniform(0, 2 * math.pi),
-                'lifetime': random.randint(100, 300)
-            })
+        self.particle_base = count  # Число частиц при высоком качестве
+        palette = [QColor(0, 150, 255), QColor(50, 200, 230), QColor(100, 255, 255), QColor(20, 180, 210)]
+        self.particles = ParticleField(count, self.width(), self.height(), palette,
+                                       size=(1, 3), alpha=(30, 80), speed=(0.5, 2.0),
+                                       lifetime=(100, 300), round_points=True)
     
     def update_effects(self):
         """Обновление всех эффектов"""
@@ -521,20 +511,8 @@ class MenuWidget(QWidget):
             return
         
         # Обновление частиц
-        for particle in self.particles:
-            particle['x'] += math.cos(particle['direction']) * particle['speed']
-            particle['y'] += math.sin(particle['direction']) * particle['speed']
-            particle['lifetime'] -= 1
-            
-            # Пересоздаем частицы, которые вышли за границы
-            if (particle['x'] < 0 or particle['x'] > self.width() or 
-                particle['y'] < 0 or particle['y'] > self.height() or
-                particle['lifetime'] <= 0):
-                particle.update({
-                    'x': random.randint(0, self.width()),
-                    'y': random.randint(0, self.height()),
-                    'lifetime': random.randint(100, 300)
-                })
+        self.particles.set_count(quality_governor.particle_count(self.particle_base))
+        self.particles.step(self.width(), self.height())
         
         # Обновление сканирующей линии
         self.scan_line_y = (self.scan_line_y + self.scan_line_speed) % (self.height() + 30)
@@ -574,6 +552,7 @@ class MenuWidget(QWidget):
             
             QTimer.singleShot(300, lambda: button.setStyleSheet(original_style))
     
+    @timed_paint
     def paintEvent(self, event):
         """Отрисовка эффектов"""
         super().paintEvent(event)
@@ -585,20 +564,8 @@ class MenuWidget(QWidget):
         painter.setRenderHint(QPainter.Antialiasing)
         
         # Эффект частиц
-        for particle in self.particles:
-            alpha = particle['color'].alpha() * (particle['lifetime'] / 300.0)
-            color = QColor(particle['color'])
-            color.setAlpha(int(alpha))
-            
-            painter.setBrush(color)
-            painter.setPen(Qt.NoPen)
-            painter.setOpacity(0.3)
-            painter.drawEllipse(
-                int(particle['x']),
-                int(particle['y']),
-                particle['size'],
-                particle['size']
-            )
+        painter.setOpacity(0.3)
+        self.particles.draw(painter)
         
         # Сканирующие линии
         scan_height = 25
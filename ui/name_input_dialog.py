@@ -5,6 +5,7 @@ from PySide6.QtCore import Qt, Signal
 from PySide6.QtGui import QFont, QColor, QPalette
 
 from simple_translation import translation
+from ui.retranslation import retranslation
 
 
 class NameInputDialog(QDialog):
@@ -22,7 +23,7 @@ class NameInputDialog(QDialog):
         self.setup_styles()
         
         # Подключаем переводы
-        translation.on_language_changed(self.retranslate_ui)
+        retranslation.register(self, self.retranslate_ui)
     
     def setup_ui(self):
         """Настройка интерфейса"""
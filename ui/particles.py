@@ -0,0 +1,233 @@
+# ui/particles.py
+"""
+Общий движок частиц на NumPy.
+
+Частицы фона (терминал, офис, меню, настройки, заставка, карточки навыков)
+хранятся не списками словарей, а массивами: координаты, скорости, время
+жизни, прозрачность, размер и номер цвета палитры. Шаг анимации - несколько
+векторных операций над всеми частицами сразу, вышедшие за границы или
+отжившие частицы пересоздаются по маске. Отрисовка идёт пачками: частицы с
+одинаковым цветом, уровнем прозрачности и размером рисуются одним вызовом
+drawPoints, поэтому тысячи частиц стоят десятков вызовов QPainter.
+
+    self.particles = ParticleField(30, self.width(), self.height(), palette,
+                                   lifetime=(50, 150), alpha=(20, 80))
+    self.particles.step(self.width(), self.height())   # в update_*
+    self.particles.draw(painter)                        # в paintEvent
+
+Случайность берётся из собственного генератора (seed), поэтому поведение
+поля воспроизводимо.
+"""
+
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+from PySide6.QtCore import QPointF, Qt
+from PySide6.QtGui import QColor, QPen, QPolygonF
+
+
+# Уровни прозрачности при группировке в пачки
+ALPHA_LEVELS = 16
+
+# Шаг размера частиц при группировке (полпикселя)
+SIZE_STEP = 0.5
+
+
+class ParticleField:
+    """Поле частиц одного виджета"""
+
+    def __init__(self, count: int, width: int, height: int, palette: Sequence[QColor], *,
+                 size: Tuple[float, float] = (1.0, 3.0),
+                 alpha: Optional[Tuple[int, int]] = (20, 80),
+                 speed: Tuple[float, float] = (0.5, 1.5),
+                 lifetime: Optional[Tuple[int, int]] = (50, 150),
+                 bounce: bool = False,
+                 flicker: float = 0.0,
+                 margin: float = 0.0,
+                 round_points: bool = False,
+                 seed: Optional[int] = None):
+        """
+        palette   - цвета частиц;
+        alpha     - диапазон прозрачности, None - прозрачность цвета палитры;
+        lifetime  - диапазон жизни в шагах, None - частицы живут вечно;
+        bounce    - отражаться от границ вместо пересоздания;
+        flicker   - глубина мерцания прозрачности (0 - без мерцания);
+        margin    - на сколько частица может выйти за край до пересоздания.
+        """
+        self.rng = np.random.default_rng(seed)
+        self.palette = [QColor(color) for color in palette]
+        self.spawn_colors = len(self.palette)  # Пересоздаются только в базовых цветах
+        self.size_range = size
+        self.alpha_range = alpha
+        self.speed_range = speed
+        self.lifetime_range = lifetime
+        # Прозрачность гаснет к концу жизни: alpha * life / fade_life
+        self.fade_life = float(lifetime[1]) if lifetime else 0.0
+        self.bounce = bounce
+        self.flicker = flicker
+        self.margin = margin
+        self.round_points = round_points
+        self.width = max(1, width)
+        self.height = max(1, height)
+        self.origin: Optional[Tuple[float, float]] = None  # Точка пересоздания (None - случайно)
+
+        self.x = np.empty(0)
+        self.y = np.empty(0)
+        self.vx = np.empty(0)
+        self.vy = np.empty(0)
+        self.life = np.empty(0)
+        self.alpha = np.empty(0)
+        self.size = np.empty(0)
+        self.color = np.empty(0, dtype=np.int32)
+        self.phase = np.empty(0)
+        self._append(self._random_state(count))
+
+    def __len__(self) -> int:
+        return len(self.x)
+
+    # --- Создание ---
+
+    def _random_velocity(self, count: int):
+        direction = self.rng.uniform(0, 2 * np.pi, count)
+        speed = self.rng.uniform(*self.speed_range, count)
+        return np.cos(direction) * speed, np.sin(direction) * speed
+
+    def _random_life(self, count: int):
+        if not self.lifetime_range:
+            return np.full(count, np.inf)
+        low, high = self.lifetime_range
+        return self.rng.integers(low, high + 1, count).astype(float)
+
+    def _random_position(self, count: int):
+        if self.origin is not None:
+            return np.full(count, float(self.origin[0])), np.full(count, float(self.origin[1]))
+        return (self.rng.uniform(0, self.width, count),
+                self.rng.uniform(0, self.height, count))
+
+    def _random_state(self, count: int) -> dict:
+        x, y = self._random_position(count)
+        vx, vy = self._random_velocity(count)
+        color = self.rng.integers(0, self.spawn_colors, count).astype(np.int32)
+        if self.alpha_range is None:
+            palette_alpha = np.array([c.alpha() for c in self.palette[:self.spawn_colors]], dtype=float)
+            alpha = palette_alpha[color]
+        else:
+            alpha = self.rng.integers(self.alpha_range[0], self.alpha_range[1] + 1, count).astype(float)
+        return {
+            "x": x, "y": y, "vx": vx, "vy": vy,
+            "life": self._random_life(count),
+            "alpha": alpha,
+            "size": self.rng.uniform(*self.size_range, count),
+            "color": color,
+            "phase": self.rng.uniform(0, 2 * np.pi, count),
+        }
+
+    def _append(self, state: dict):
+        for name, values in state.items():
+            setattr(self, name, np.concatenate((getattr(self, name), values)))
+
+    def set_count(self, count: int):
+        """Изменить число частиц (лишние удаляются, недостающие создаются)"""
+        count = max(0, int(count))
+        if count < len(self):
+            for name in ("x", "y", "vx", "vy", "life", "alpha", "size", "color", "phase"):
+                setattr(self, name, getattr(self, name)[:count])
+        elif count > len(self):
+            self._append(self._random_state(count - len(self)))
+
+    def emit(self, count: int, x: float, y: float, color: QColor, *,
+             speed: Tuple[float, float] = (1.0, 3.0),
+             alpha: Tuple[int, int] = (120, 200),
+             lifetime: Tuple[int, int] = (30, 60),
+             size: Tuple[float, float] = (0.8, 2.0)):
+        """Выброс частиц из точки во все стороны (например, при повышении уровня)"""
+        self.palette.append(QColor(color))
+        direction = self.rng.uniform(0, 2 * np.pi, count)
+        velocity = self.rng.uniform(*speed, count)
+        self._append({
+            "x": np.full(count, float(x)),
+            "y": np.full(count, float(y)),
+            "vx": np.cos(direction) * velocity,
+            "vy": np.sin(direction) * velocity,
+            "life": self.rng.integers(lifetime[0], lifetime[1] + 1, count).astype(float),
+            "alpha": self.rng.integers(alpha[0], alpha[1] + 1, count).astype(float),
+            "size": self.rng.uniform(*size, count),
+            "color": np.full(count, len(self.palette) - 1, dtype=np.int32),
+            "phase": self.rng.uniform(0, 2 * np.pi, count),
+        })
+
+    # --- Шаг ---
+
+    def step(self, width: int, height: int):
+        """Один шаг: движение, старение и пересоздание по маске"""
+        if not len(self):
+            return
+        self.width = max(1, width)
+        self.height = max(1, height)
+        self.x += self.vx
+        self.y += self.vy
+        if self.flicker:
+            self.phase += 0.02
+
+        if self.bounce:
+            # Отражение от границ
+            self.vx[(self.x < 0) | (self.x > self.width)] *= -1
+            self.vy[(self.y < 0) | (self.y > self.height)] *= -1
+            return
+
+        self.life -= 1
+        margin = self.margin
+        dead = ((self.x < -margin) | (self.x > self.width + margin) |
+                (self.y < -margin) | (self.y > self.height + margin) |
+                (self.life <= 0))
+        count = int(np.count_nonzero(dead))
+        if count:
+            state = self._random_state(count)
+            for name, values in state.items():
+                getattr(self, name)[dead] = values
+            # Частицы выброса пересоздаются обычными; отработанные цвета выброса не нужны
+            if len(self.palette) > self.spawn_colors and not np.any(self.color >= self.spawn_colors):
+                del self.palette[self.spawn_colors:]
+
+    # --- Отрисовка ---
+
+    def current_alpha(self) -> np.ndarray:
+        alpha = self.alpha
+        if self.fade_life:
+            alpha = alpha * np.clip(self.life / self.fade_life, 0.0, 1.0)
+        if self.flicker:
+            alpha = alpha * (1.0 - self.flicker + self.flicker * np.sin(self.phase))
+        return alpha
+
+    def draw(self, painter):
+        """Нарисовать все частицы пачками по цвету, прозрачности и размеру"""
+        if not len(self):
+            return
+        alpha = self.current_alpha()
+        levels = np.clip((alpha * ALPHA_LEVELS / 256).astype(np.int32), 0, ALPHA_LEVELS - 1)
+        sizes = np.maximum(1, np.rint(self.size / SIZE_STEP)).astype(np.int32)
+        visible = alpha >= 1
+        if not np.any(visible):
+            return
+
+        max_size = int(sizes.max()) + 1
+        keys = (self.color * ALPHA_LEVELS + levels) * max_size + sizes
+        indices = np.flatnonzero(visible)
+        indices = indices[np.argsort(keys[indices], kind="stable")]
+        sorted_keys = keys[indices]
+        groups = np.split(indices, np.flatnonzero(np.diff(sorted_keys)) + 1)
+
+        cap = Qt.RoundCap if self.round_points else Qt.SquareCap
+        painter.setBrush(Qt.NoBrush)
+        for group in groups:
+            first = group[0]
+            size = sizes[first] * SIZE_STEP
+            color = QColor(self.palette[self.color[first]])
+            color.setAlpha(int((levels[first] + 0.5) * 256 / ALPHA_LEVELS))
+            pen = QPen(color, size)
+            pen.setCapStyle(cap)
+            painter.setPen(pen)
+            half = size / 2
+            points = QPolygonF([QPointF(x + half, y + half)
+                                for x, y in zip(self.x[group].tolist(), self.y[group].tolist())])
+            painter.drawPoints(points)
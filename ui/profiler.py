@@ -0,0 +1,88 @@
+# ui/profiler.py
+"""
+Профилирование горячих путей без внешних инструментов.
+
+hot_path_profiler.start(seconds) включает cProfile на seconds секунд
+игры, затем пишет в logs/:
+    profile_<дата>_<время>.prof - полный профиль (pstats, snakeviz и т.п.);
+    profile_<дата>_<время>.txt  - 40 самых дорогих функций по суммарному
+                                  времени и 40 - по собственному.
+Профилируется главный поток - тот, где работают paintEvent и шаги
+анимаций (update_*).
+"""
+
+import cProfile
+import io
+import os
+import pstats
+import time
+from typing import Optional
+
+from PySide6.QtCore import QTimer
+
+
+# Каталог профилей
+PROFILE_DIR = "logs"
+
+# Длительность записи по умолчанию (debug.profile_seconds)
+DEFAULT_SECONDS = 10
+
+# Сколько строк статистики писать в текстовую сводку
+TOP_FUNCTIONS = 40
+
+
+class HotPathProfiler:
+    """Запись cProfile на заданное время"""
+
+    def __init__(self, directory: str = PROFILE_DIR):
+        self.directory = directory
+        self.profile: Optional[cProfile.Profile] = None
+        self.started = 0.0
+        self.runs = 0  # Номер записи: отложенная остановка не касается следующей
+        self.last_path: Optional[str] = None
+
+    @property
+    def running(self) -> bool:
+        return self.profile is not None
+
+    def start(self, seconds: float = DEFAULT_SECONDS) -> bool:
+        """Начать запись; через seconds секунд профиль сохранится сам"""
+        if self.running:
+            print("[ПРОФИЛЬ] Запись уже идёт")
+            return False
+        self.profile = cProfile.Profile()
+        self.started = time.perf_counter()
+        self.runs += 1
+        run = self.runs
+        self.profile.enable()
+        QTimer.singleShot(int(seconds * 1000), lambda: self.runs == run and self.stop())
+        print(f"[ПРОФИЛЬ] Запись на {seconds:g} с")
+        return True
+
+    def stop(self) -> Optional[str]:
+        """Остановить запись и сохранить профиль; вернуть путь к .prof"""
+        if not self.running:
+            return None
+        profile, self.profile = self.profile, None
+        profile.disable()
+        elapsed = time.perf_counter() - self.started
+
+        os.makedirs(self.directory, exist_ok=True)
+        base = os.path.join(self.directory, time.strftime("profile_%Y%m%d_%H%M%S"))
+        profile.dump_stats(base + ".prof")
+
+        summary = io.StringIO()
+        summary.write(f"Профиль {elapsed:.1f} с\n\n")
+        stats = pstats.Stats(profile, stream=summary)
+        stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(TOP_FUNCTIONS)
+        stats.sort_stats(pstats.SortKey.TIME).print_stats(TOP_FUNCTIONS)
+        with open(base + ".txt", "w", encoding="utf-8") as f:
+            f.write(summary.getvalue())
+
+        self.last_path = base + ".prof"
+        print(f"[ПРОФИЛЬ] Профиль за {elapsed:.1f} с сохранён: {self.last_path}")
+        return self.last_path
+
+
+# Общий профилировщик
+hot_path_profiler = HotPathProfiler()
@@ -0,0 +1,206 @@
+# ui/quality_governor.py
+"""
+Адаптивное качество эффектов по измеренному времени кадра.
+
+Драйвер анимаций сообщает время шагов каждого кадра, а paintEvent
+анимированных виджетов (терминал, камера офиса, заставка, меню) обёрнуты
+в @timed_paint. Раз в секунду регулятор сравнивает среднюю стоимость кадра
+(шаги + отрисовка) и фактическую частоту кадров с бюджетом
+performance.max_fps:
+    - две секунды подряд бюджет превышен - качество на ступень ниже
+      (меньше частиц, сканирующие линии через 4 пикселя, без искажения
+      линий, без свечения);
+    - пять секунд подряд кадр занимает меньше половины бюджета - на
+      ступень выше.
+Каждая смена пишется в лог и в history (для отладочного оверлея).
+
+Флаги performance.particle_effects / glow_effects / scan_lines и
+graphics.effect_intensity задают потолок: регулятор может только снижать
+качество относительно настроек. performance.adaptive_quality = false
+выключает регулирование.
+
+Виджеты не подписываются на смену качества, а читают quality_governor.level
+при шаге и отрисовке.
+"""
+
+import functools
+import time
+from collections import deque
+from dataclasses import dataclass, replace
+from typing import Dict, List
+
+from ui.animation_driver import DEFAULT_MAX_FPS, animation_driver
+
+
+@dataclass(frozen=True)
+class QualityLevel:
+    """Ступень качества эффектов"""
+    name: str
+    particle_scale: float   # Доля частиц от базового числа
+    scan_line_spacing: int  # Шаг сканирующих линий в пикселях, 0 - без линий
+    distortion: bool        # Волновое искажение сканирующих линий
+    glow: bool              # Свечение рамок и фигур
+
+
+QUALITY_LEVELS = (
+    QualityLevel("высокое", 1.0, 2, True, True),
+    QualityLevel("среднее", 0.6, 2, False, True),
+    QualityLevel("низкое", 0.3, 4, False, False),
+    QualityLevel("минимальное", 0.1, 4, False, False),
+)
+
+# Окно усреднения замеров, секунды
+WINDOW_SECONDS = 1.0
+
+# Сколько окон подряд нужно для понижения / повышения качества
+DOWN_WINDOWS = 2
+UP_WINDOWS = 5
+
+# Пауза между кадрами, после которой замеры начинаются заново (драйвер простаивал)
+GAP_SECONDS = 0.2
+
+# Интенсивность эффектов по умолчанию (graphics.effect_intensity) - базовое число частиц
+DEFAULT_INTENSITY = 70
+
+
+class QualityGovernor:
+    """Понижает и повышает качество эффектов по времени кадра"""
+
+    def __init__(self):
+        self.index = 0
+        self.adaptive = True
+        self.max_fps = DEFAULT_MAX_FPS
+        self.intensity = 1.0
+        self.particle_effects = True
+        self.glow_effects = True
+        self.scan_lines = True
+        self.level = QUALITY_LEVELS[0]
+        self.history = deque(maxlen=20)  # Смены качества для оверлея
+        self.last_frame_ms = 0.0
+        self.last_fps = 0.0
+        self.paint_stats: Dict[str, List[float]] = {}  # имя -> [вызовы, всего с, максимум с]
+        self._bad_windows = 0
+        self._good_windows = 0
+        self._reset_window(0.0)
+        animation_driver.add_frame_listener(self.on_frame)
+
+    def configure(self, config: dict):
+        """Потолок качества и частота кадров из config.json"""
+        performance = config.get("performance", {})
+        graphics = config.get("graphics", {})
+        self.adaptive = bool(performance.get("adaptive_quality", True))
+        self.max_fps = animation_driver.max_fps
+        self.particle_effects = bool(performance.get("particle_effects", True))
+        self.glow_effects = bool(performance.get("glow_effects", True))
+        self.scan_lines = bool(performance.get("scan_lines", True))
+        try:
+            intensity = float(graphics.get("effect_intensity", DEFAULT_INTENSITY))
+        except (TypeError, ValueError):
+            intensity = DEFAULT_INTENSITY
+        self.intensity = max(0.0, intensity) / DEFAULT_INTENSITY
+        if not self.adaptive:
+            self.index = 0
+        self._apply()
+        print(f"[КАЧЕСТВО] Качество эффектов: {self.level.name}"
+              f"{'' if self.adaptive else ' (без адаптации)'}")
+
+    def _apply(self):
+        """Ступень с учётом ограничений из настроек"""
+        base = QUALITY_LEVELS[self.index]
+        self.level = replace(
+            base,
+            particle_scale=base.particle_scale * self.intensity if self.particle_effects else 0.0,
+            scan_line_spacing=base.scan_line_spacing if self.scan_lines else 0,
+            distortion=base.distortion and self.scan_lines,
+            glow=base.glow and self.glow_effects,
+        )
+
+    def particle_count(self, base: int) -> int:
+        """Сколько частиц держать при текущем качестве"""
+        return max(0, int(round(base * self.level.particle_scale)))
+
+    # --- Замеры ---
+
+    def record_paint(self, name: str, seconds: float):
+        self._paint += seconds
+        stats = self.paint_stats.get(name)
+        if stats is None:
+            stats = self.paint_stats[name] = [0, 0.0, 0.0]
+        stats[0] += 1
+        stats[1] += seconds
+        stats[2] = max(stats[2], seconds)
+
+    def _reset_window(self, now: float):
+        self._window_start = now
+        self._last_frame = now
+        self._frames = 0
+        self._busy = 0.0
+        self._paint = 0.0
+
+    def on_frame(self, now: float, busy: float):
+        """Кадр драйвера анимаций: now - время кадра, busy - время шагов"""
+        if now - self._last_frame > GAP_SECONDS:
+            # Драйвер простаивал - окно с паузой ничего не говорит о нагрузке
+            self._reset_window(now)
+            return
+        self._last_frame = now
+        self._frames += 1
+        self._busy += busy
+        elapsed = now - self._window_start
+        if elapsed >= WINDOW_SECONDS:
+            self._evaluate(elapsed)
+            self._reset_window(now)
+
+    def _evaluate(self, elapsed: float):
+        if not self._frames:
+            return
+        budget_ms = 1000.0 / self.max_fps
+        self.last_frame_ms = (self._busy + self._paint) * 1000.0 / self._frames
+        self.last_fps = self._frames / elapsed
+        if not self.adaptive:
+            return
+
+        if self.last_frame_ms > budget_ms * 0.8 or self.last_fps < self.max_fps * 0.75:
+            self._bad_windows += 1
+            self._good_windows = 0
+            if self._bad_windows >= DOWN_WINDOWS and self.index < len(QUALITY_LEVELS) - 1:
+                self._step(1, budget_ms)
+        elif self.last_frame_ms < budget_ms * 0.5 and self.last_fps >= self.max_fps * 0.9:
+            self._good_windows += 1
+            self._bad_windows = 0
+            if self._good_windows >= UP_WINDOWS and self.index > 0:
+                self._step(-1, budget_ms)
+        else:
+            self._bad_windows = self._good_windows = 0
+
+    def _step(self, direction: int, budget_ms: float):
+        previous = self.level.name
+        self.index += direction
+        self._apply()
+        self._bad_windows = self._good_windows = 0
+        reason = (f"кадр {self.last_frame_ms:.1f} мс из {budget_ms:.1f} мс, "
+                  f"{self.last_fps:.0f} FPS")
+        self.history.append({
+            "time": time.strftime("%H:%M:%S"),
+            "from": previous,
+            "to": self.level.name,
+            "reason": reason,
+        })
+        arrow = "понижено" if direction > 0 else "повышено"
+        print(f"[КАЧЕСТВО] Качество {arrow}: {previous} -> {self.level.name} ({reason})")
+
+
+# Общий регулятор качества
+quality_governor = QualityGovernor()
+
+
+def timed_paint(method):
+    """Учитывать время paintEvent виджета в стоимости кадра"""
+    @functools.wraps(method)
+    def wrapper(widget, event):
+        started = time.perf_counter()
+        try:
+            return method(widget, event)
+        finally:
+            quality_governor.record_paint(type(widget).__name__, time.perf_counter() - started)
+    return wrapper
@@ -0,0 +1,109 @@
+# ui/retranslation.py
+"""
+Отложенное обновление текстов виджетов при смене языка.
+
+Виджеты регистрируют свой метод обновления текстов (retranslate_ui и т.п.)
+вместо translation.on_language_changed. При смене языка все они только
+помечаются устаревшими:
+    - видимые обновляются одним проходом на следующем обороте цикла событий,
+      поэтому повторные сигналы о смене языка (настройки + главное окно)
+      дают одно обновление, и новый язык появляется в одном кадре;
+    - скрытые (другие страницы стека, закрытые окна) обновляются при
+      показе - событие Show приходит до первой отрисовки, поэтому старые
+      тексты не мелькают.
+Виджеты хранятся по слабым ссылкам: закрытые диалоги не копятся в списке
+коллбэков и не вызываются после удаления.
+"""
+
+import weakref
+
+from PySide6.QtCore import QEvent, QObject, QTimer
+
+from simple_translation import translation
+
+
+class _Entry:
+    __slots__ = ("widget", "callback", "dirty")
+
+    def __init__(self, widget, callback):
+        self.widget = weakref.ref(widget)
+        # Связанный метод самого виджета держим слабо, чтобы не продлевать ему жизнь
+        if getattr(callback, "__self__", None) is widget:
+            self.callback = weakref.WeakMethod(callback)
+        else:
+            self.callback = lambda callback=callback: callback
+        self.dirty = False
+
+
+class RetranslationScheduler(QObject):
+    """Виджеты, тексты которых обновляются после смены языка"""
+
+    def __init__(self):
+        super().__init__()
+        self._entries = {}  # id(виджета) -> _Entry
+        self._scheduled = False
+        translation.on_language_changed(self.invalidate)
+
+    def register(self, widget, callback):
+        """Обновлять тексты widget вызовом callback после смены языка"""
+        key = id(widget)
+        if key not in self._entries:
+            widget.installEventFilter(self)
+            widget.destroyed.connect(lambda *_, key=key: self._entries.pop(key, None))
+        self._entries[key] = _Entry(widget, callback)
+
+    def unregister(self, widget):
+        if self._entries.pop(id(widget), None) is not None:
+            widget.removeEventFilter(self)
+
+    def invalidate(self):
+        """Пометить все тексты устаревшими и обновить видимые на следующем обороте цикла"""
+        for entry in self._entries.values():
+            entry.dirty = True
+        if not self._scheduled and self._entries:
+            self._scheduled = True
+            QTimer.singleShot(0, self.flush)
+
+    def flush(self):
+        """Обновить все видимые устаревшие виджеты"""
+        self._scheduled = False
+        count = 0
+        for key, entry in list(self._entries.items()):
+            if not entry.dirty:
+                continue
+            widget = entry.widget()
+            if widget is None:
+                self._entries.pop(key, None)
+                continue
+            try:
+                visible = widget.isVisible()
+            except RuntimeError:
+                # Объект Qt уже удалён
+                self._entries.pop(key, None)
+                continue
+            if visible:
+                self._run(entry)
+                count += 1
+        if count:
+            print(f"🔤 Обновлены тексты {count} видимых виджетов, остальные - при показе")
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Show:
+            entry = self._entries.get(id(obj))
+            if entry is not None and entry.dirty and entry.widget() is obj:
+                self._run(entry)
+        return False
+
+    def _run(self, entry):
+        entry.dirty = False
+        callback = entry.callback()
+        if callback is None:
+            return
+        try:
+            callback()
+        except Exception as e:
+            print(f"❌ Ошибка обновления перевода: {e}")
+
+
+# Общий планировщик обновления текстов
+retranslation = RetranslationScheduler()
@@ -0,0 +1,68 @@
+# ui/save_worker.py
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Dict
+
+from PySide6.QtCore import QObject, Signal
+
+
+class SaveWorker(QObject):
+    """
+    Фоновое сохранение игры.
+
+    В потоке интерфейса снимается неизменяемая копия состояния
+    (GameState.prepare_save), сериализация и запись на диск выполняются
+    в фоновом потоке. У каждого слота свой поток с очередью, поэтому
+    сохранения одного слота записываются строго по порядку.
+    """
+
+    # slot, успех, текст ошибки
+    save_finished = Signal(int, bool, str)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._executors: Dict[int, ThreadPoolExecutor] = {}
+        self._pending = set()
+        self._pending_lock = threading.Lock()
+
+    def submit(self, game_state, slot: int = None):
+        """Поставить сохранение в очередь (вызывать из потока интерфейса)"""
+        job = game_state.prepare_save(slot)
+
+        executor = self._executors.get(job.slot)
+        if executor is None:
+            executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"save-slot-{job.slot}")
+            self._executors[job.slot] = executor
+
+        future = executor.submit(self._run_job, job)
+        with self._pending_lock:
+            self._pending.add(future)
+        future.add_done_callback(self._forget_future)
+        return job.slot
+
+    def _forget_future(self, future):
+        with self._pending_lock:
+            self._pending.discard(future)
+
+    def _run_job(self, job):
+        """Выполняется в фоновом потоке"""
+        try:
+            job.run()
+            print(f"[SaveWorker] Игра сохранена в {job.filename}")
+            self.save_finished.emit(job.slot, True, "")
+        except Exception as e:
+            print(f"[SaveWorker] Ошибка сохранения слота {job.slot}: {e}")
+            self.save_finished.emit(job.slot, False, str(e))
+
+    def wait(self, timeout: float = None):
+        """Дождаться записи всех поставленных в очередь сохранений"""
+        with self._pending_lock:
+            pending = list(self._pending)
+        if pending:
+            wait(pending, timeout=timeout)
+
+    def shutdown(self):
+        """Дождаться очереди и остановить потоки"""
+        for executor in self._executors.values():
+            executor.shutdown(wait=True)
+        self._executors.clear()
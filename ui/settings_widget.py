@@ -7,9 +7,13 @@ from PySide6.QtGui import QPainter, QColor, QLinearGradient, QPen, QBrush, QFont
 import json
 import os
 import random
-import math
 
+from core.save_writer import save_writer
 from simple_translation import translation
+from ui.animation_driver import animation_driver
+from ui.particles import ParticleField
+from ui.quality_governor import quality_governor, timed_paint
+from ui.retranslation import retranslation
 
 
 class SettingsWidget(QWidget):
@@ -33,7 +37,7 @@ class SettingsWidget(QWidget):
         
         self.load_ui_from_config()
         
-        translation.on_language_changed(self.retranslate_ui)
+        retranslation.register(self, self.retranslate_ui)
     
     def load_default_config(self):
         """Загрузить значения по умолчанию"""
@@ -285,6 +289,10 @@ class SettingsWidget(QWidget):
         self.language_combo.addItem("🇯🇵 日本語 70%", "ja")
         
         self.language_combo.currentIndexChanged.connect(self.on_language_changed)
+        # Язык под курсором загружается заранее, чтобы смена была мгновенной
+        self.language_combo.highlighted.connect(
+            lambda index: translation.preload_languages([self.language_combo.itemData(index)])
+        )
         
         language_selector_layout.addWidget(self.language_label)
         language_selector_layout.addWidget(self.language_combo)
@@ -921,6 +929,13 @@ class SettingsWidget(QWidget):
         self.update_audio_info()
         self.update_time_info()
     
+    def showEvent(self, event):
+        """При открытии настроек языки из списка загружаются в фоне"""
+        super().showEvent(event)
+        translation.preload_languages(
+            [self.language_combo.itemData(i) for i in range(self.language_combo.count())]
+        )
+    
     def update_language_info(self):
         """Обновить информацию о языке"""
         current_lang = self.language_combo.currentText()
@@ -1019,8 +1034,8 @@ class SettingsWidget(QWidget):
     def save_settings_silent(self):
         """Сохранить настройки без эффектов"""
         try:
-            with open("config.json", "w", encoding="utf-8") as f:
-                json.dump(self.config, f, ensure_ascii=False, indent=2)
+            text = json.dumps(self.config, ensure_ascii=False, indent=2)
+            save_writer.write_atomic("config.json", text)
             print(f"[SettingsWidget] Конфиг сохранен. Язык: {self.config['game']['language']}")
             return True
         except Exception as e:
@@ -1065,43 +1080,21 @@ class SettingsWidget(QWidget):
         self.auto_pause_check.setText(translation.t("settings.auto_pause"))
         self.show_time_check.setText(translation.t("settings.show_time_widget"))
         
-        # Обновляем комбобоксы
-        self.display_combo.blockSignals(True)
-        self.display_combo.clear()
-        self.display_combo.addItems([
+        # Обновляем комбобоксы: меняются только подписи, выбор остаётся прежним
+        for index, text in enumerate([
             translation.t("settings.display_modes.windowed", "Оконный режим"),
             translation.t("settings.display_modes.fullscreen", "Полноэкранный режим"),
             translation.t("settings.display_modes.borderless", "Безрамочный режим")
-        ])
-        
-        # Восстанавливаем выбранный режим
-        display_mode = self.config.get("graphics", {}).get("display_mode", "windowed")
-        if display_mode == "windowed":
-            self.display_combo.setCurrentIndex(0)
-        elif display_mode == "fullscreen":
-            self.display_combo.setCurrentIndex(1)
-        elif display_mode == "borderless":
-            self.display_combo.setCurrentIndex(2)
-        self.display_combo.blockSignals(False)
+        ]):
+            self.display_combo.setItemText(index, text)
         
         # Обновляем комбобокс динамического диапазона
-        self.dynamic_range_combo.blockSignals(True)
-        self.dynamic_range_combo.clear()
-        self.dynamic_range_combo.addItems([
+        for index, text in enumerate([
             translation.t("settings.dynamic_range.normal", "Нормальный"),
             translation.t("settings.dynamic_range.wide", "Широкий"),
             translation.t("settings.dynamic_range.night", "Ночной")
-        ])
-        
-        # Восстанавливаем выбранный диапазон
-        dynamic_range = self.config.get("audio", {}).get("dynamic_range", "normal")
-        if dynamic_range == "normal":
-            self.dynamic_range_combo.setCurrentIndex(0)
-        elif dynamic_range == "wide":
-            self.dynamic_range_combo.setCurrentIndex(1)
-        elif dynamic_range == "night":
-            self.dynamic_range_combo.setCurrentIndex(2)
-        self.dynamic_range_combo.blockSignals(False)
+        ]):
+            self.dynamic_range_combo.setItemText(index, text)
         
         # Обновляем кнопки
         self.settings_save_btn.setText(translation.t("settings.apply"))
@@ -1193,13 +1186,10 @@ class SettingsWidget(QWidget):
     
     def setup_effects(self):
         """Настройка эффектов для виджета настроек"""
-        # Таймер для эффектов
-        self.effect_timer = QTimer()
-        self.effect_timer.timeout.connect(self.update_effects)
-        self.effect_timer.start(30)
+        # Шаг эффектов в общем драйвере анимаций
+        self.effect_timer = animation_driver.register(self, self.update_effects, 30)
         
         # Частицы для эффектов
-        self.particles = []
         self.init_particles(30)
         
         # Эффект сканирующих линий
@@ -1212,38 +1202,17 @@ class SettingsWidget(QWidget):
         
     def init_particles(self, count):
         """Инициализация частиц"""
-        for _ in range(count):
-            self.particles.append({
-                'x': random.randint(0, self.width()),
-                'y': random.randint(0, self.height()),
-                'size': random.randint(1, 3),
-                'speed': random.uniform(0.5, 2.0),
-                'color': QColor(
-                    random.randint(0, 100),
-                    random.randint(150, 255),
-                    random.randint(200, 255),
-                    random.randint(30, 80)
-                ),
-                'direction': random.uniform(0, 2 * math.pi),
-                'lifetime': random.randint(100, 300)
-            })
-            
+        self.particle_base = count  # Число частиц при высоком качестве
+        palette = [QColor(0, 150, 255), QColor(50, 200, 230), QColor(100, 255, 255), QColor(20, 180, 210)]
+        self.particles = ParticleField(count, self.width(), self.height(), palette,
+                                       size=(1, 3), alpha=(30, 80), speed=(0.5, 2.0),
+                                       lifetime=(100, 300), round_points=True)
+    
     def update_effects(self):
         """Обновление всех эффектов"""
         # Обновление частиц
-        for particle in self.particles:
-            particle['x'] += math.cos(particle['direction']) * particle['speed']
-            particle['y'] += math.sin(particle['direction']) * particle['speed']
-            particle['lifetime'] -= 1
-            
-            if (particle['x'] < 0 or particle['x'] > self.width() or 
-                particle['y'] < 0 or particle['y'] > self.height() or
-                particle['lifetime'] <= 0):
-                particle.update({
-                    'x': random.randint(0, self.width()),
-                    'y': random.randint(0, self.height()),
-                    'lifetime': random.randint(100, 300)
-                })
+        self.particles.set_count(quality_governor.particle_count(self.particle_base))
+        self.particles.step(self.width(), self.height())
         
         # Обновление сканирующей линии
         self.scan_line_y = (self.scan_line_y + self.scan_line_speed) % (self.height() + 30)
@@ -1289,6 +1258,7 @@ class SettingsWidget(QWidget):
                 
                 QTimer.singleShot(200, lambda e=element, s=original_style: e.setStyleSheet(s))
     
+    @timed_paint
     def paintEvent(self, event):
         """Отрисовка эффектов"""
         super().paintEvent(event)
@@ -1300,20 +1270,8 @@ class SettingsWidget(QWidget):
         painter.setRenderHint(QPainter.Antialiasing)
         
         # Эффект частиц
-        for particle in self.particles:
-            alpha = particle['color'].alpha() * (particle['lifetime'] / 300.0)
-            color = QColor(particle['color'])
-            color.setAlpha(int(alpha))
-            
-            painter.setBrush(color)
-            painter.setPen(Qt.NoPen)
-            painter.setOpacity(0.3)
-            painter.drawEllipse(
-                int(particle['x']),
-                int(particle['y']),
-                particle['size'],
-                particle['size']
-            )
+        painter.setOpacity(0.3)
+        self.particles.draw(painter)
         
         # Сканирующие линии
         scan_height = 25
@@ -11,7 +11,11 @@ import math
 import time
 import random
 
+from core.skills import get_skill_name
 from simple_translation import translation
+from ui.animation_driver import animation_driver
+from ui.particles import ParticleField
+from ui.retranslation import retranslation
 
 
 def tr(key, default=None, **kwargs):
@@ -21,6 +25,39 @@ def tr(key, default=None, **kwargs):
     return translation.t(key, default=default, **kwargs)
 
 
+# Тексты навыков по id: (название, сокращение, описание) - ключ перевода и значение по умолчанию
+SKILL_TEXTS = {
+    "hacking": (("skillsmn.hacking", "Взлом"),
+                ("skillsmn.hacking_short", "ВЗЛОМ"),
+                ("skillsmn.hacking_desc", "Взлом систем, обход защиты, поиск уязвимостей")),
+    "social_engineering": (("skillsmn.social", "Социальная инженерия"),
+                           ("skillsmn.social_short", "СОЦ.ИНЖ"),
+                           ("skillsmn.social_desc", "Манипулирование людьми для получения информации")),
+    "programming": (("skillsmn.programming", "Программирование"),
+                    ("skillsmn.programming_short", "ПРОГРАМ"),
+                    ("skillsmn.programming_desc", "Создание кода, скриптов и автоматизация")),
+    "stealth": (("skillsmn.stealth", "Скрытность"),
+                ("skillsmn.stealth_short", "СКРЫТН"),
+                ("skillsmn.stealth_desc", "Сокрытие следов, анонимность в сети")),
+    "analysis": (("skillsmn.analysis", "Анализ"),
+                 ("skillsmn.analysis_short", "АНАЛИЗ"),
+                 ("skillsmn.analysis_desc", "Анализ данных, выявление закономерностей")),
+    "network_security": (("skillsmn.network", "Сетевая безопасность"),
+                         ("skillsmn.network_short", "СЕТЬ"),
+                         ("skillsmn.network_desc", "Защита сетей, обнаружение вторжений")),
+}
+
+# Цвета навыков по id
+SKILL_COLORS = {
+    "hacking": "#ff0066",
+    "social_engineering": "#ff9900",
+    "programming": "#ffff00",
+    "stealth": "#00ff00",
+    "analysis": "#00ffff",
+    "network_security": "#0066ff",
+}
+
+
 class CyberSkillWidget(QWidget):
     """Киберпанк-виджет для одного навыка с анимациями"""
     
@@ -36,19 +73,18 @@ class CyberSkillWidget(QWidget):
         self._target_level = value
         self.on_level_animation_changed(value)
     
-    def __init__(self, skill_name, level, description, color, parent=None):
+    def __init__(self, skill_id, level, color, parent=None):
         super().__init__(parent)
-        self.skill_name = skill_name
+        self.skill_id = skill_id
         self.current_level = level
         self._target_level = level
         self.max_level = 10
         self.color = QColor(color)
-        self.description = description
+        self.update_texts()
         self.hovered = False
         self.glow_intensity = 0
         self.pulse_intensity = 0
         self.level_up_animation = False
-        self.particles = []
         self.sparks = []
         self.tooltip = None
         self.tooltip_timer = QTimer()
@@ -67,17 +103,9 @@ class CyberSkillWidget(QWidget):
         self.setGraphicsEffect(self.shadow_effect)
         
         # Таймеры для анимаций
-        self.glow_timer = QTimer()
-        self.glow_timer.timeout.connect(self.update_glow)
-        self.glow_timer.start(40)
-        
-        self.pulse_timer = QTimer()
-        self.pulse_timer.timeout.connect(self.update_pulse)
-        self.pulse_timer.start(120)
-        
-        self.particle_timer = QTimer()
-        self.particle_timer.timeout.connect(self.update_particles)
-        self.particle_timer.start(60)
+        self.glow_timer = animation_driver.register(self, self.update_glow, 40)
+        self.pulse_timer = animation_driver.register(self, self.update_pulse, 120)
+        self.particle_timer = animation_driver.register(self, self.update_particles, 60)
         
         # Анимация изменения уровня
         self.level_animation = QPropertyAnimation(self, b"target_level")
@@ -89,18 +117,9 @@ class CyberSkillWidget(QWidget):
     
     def init_particles(self):
         """Инициализация частиц для эффектов"""
-        for _ in range(10):
-            self.particles.append({
-                'x': random.randint(0, self.width()),
-                'y': random.randint(0, self.height()),
-                'size': random.uniform(0.3, 1.5),
-                'alpha': random.randint(20, 40),
-                'speed': random.uniform(0.3, 1.0),
-                'dx': random.uniform(-0.5, 0.5),
-                'dy': random.uniform(-0.5, 0.5),
-                'color': QColor(self.color),
-                'life': random.randint(40, 80)
-            })
+        self.particles = ParticleField(10, self.width(), self.height(), [self.color],
+                                       size=(0.3, 1.5), alpha=(20, 40), speed=(0.1, 0.5),
+                                       lifetime=(40, 80), margin=5, round_points=True)
     
     def update_glow(self):
         """Обновление интенсивности свечения"""
@@ -134,26 +153,9 @@ class CyberSkillWidget(QWidget):
         if not self.hovered and not self.level_up_animation:
             return
             
-        for particle in self.particles:
-            particle['x'] += particle['dx'] * particle['speed']
-            particle['y'] += particle['dy'] * particle['speed']
-            particle['life'] -= 1
-            
-            if (particle['x'] < -5 or particle['x'] > self.width() + 5 or
-                particle['y'] < -5 or particle['y'] > self.height() + 5 or
-                particle['life'] <= 0):
-                
-                particle.update({
-                    'x': random.randint(0, self.width()) if not self.hovered else self.width() // 2,
-                    'y': random.randint(0, self.height()) if not self.hovered else self.height() // 2,
-                    'size': random.uniform(0.3, 1.5),
-                    'alpha': random.randint(20, 40),
-                    'speed': random.uniform(0.3, 1.0),
-                    'dx': random.uniform(-0.5, 0.5),
-                    'dy': random.uniform(-0.5, 0.5),
-                    'color': QColor(self.color),
-                    'life': random.randint(40, 80)
-                })
+        # При наведении частицы рождаются из центра карточки
+        self.particles.origin = (self.width() // 2, self.height() // 2) if self.hovered else None
+        self.particles.step(self.width(), self.height())
         
         # Генерация искр при повышении уровня
         if self.level_up_animation and random.random() < 0.2:
@@ -191,6 +193,20 @@ class CyberSkillWidget(QWidget):
         self.hide_tooltip()
         super().leaveEvent(event)
     
+    def update_texts(self):
+        """Обновить название и описание навыка на текущем языке"""
+        texts = SKILL_TEXTS.get(self.skill_id)
+        if texts:
+            name, short_name, description = texts
+            self.skill_name = tr(*name)
+            self.short_name = tr(*short_name)
+            self.description = tr(*description)
+        else:
+            self.skill_name = get_skill_name(self.skill_id)
+            self.short_name = self.skill_name[:8]
+            self.description = ""
+        self.update()
+    
     def show_tooltip(self):
         """Показать подсказку с описанием навыка"""
         if not self.hovered:
@@ -282,21 +298,8 @@ class CyberSkillWidget(QWidget):
         center_x = self.width() // 2
         center_y = self.height() // 2 - 40
         
-        for _ in range(12):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(1, 3)
-            
-            self.particles.append({
-                'x': center_x,
-                'y': center_y,
-                'size': random.uniform(0.8, 2),
-                'alpha': random.randint(120, 200),
-                'speed': speed,
-                'dx': math.cos(angle) * speed,
-                'dy': math.sin(angle) * speed,
-                'color': QColor(self.color).lighter(150),
-                'life': random.randint(30, 60)
-            })
+        self.particles.emit(12, center_x, center_y, QColor(self.color).lighter(150),
+                            speed=(1, 3), alpha=(120, 200), lifetime=(30, 60), size=(0.8, 2))
     
     def paintEvent(self, event):
         painter = QPainter(self)
@@ -336,15 +339,7 @@ class CyberSkillWidget(QWidget):
             painter.drawPath(path)
         
         # Рисуем частицы
-        for particle in self.particles:
-            alpha = particle['alpha'] * (particle['life'] / 80.0)
-            particle_color = QColor(particle['color'])
-            particle_color.setAlpha(int(alpha))
-            
-            painter.setBrush(particle_color)
-            painter.setPen(Qt.NoPen)
-            painter.drawEllipse(int(particle['x']), int(particle['y']), 
-                              int(particle['size']), int(particle['size']))
+        self.particles.draw(painter)
         
         # Круглый прогресс-бар
         center_x = self.width() // 2
@@ -411,19 +406,8 @@ class CyberSkillWidget(QWidget):
         font = QFont("Source Code Pro", 10, QFont.Bold)
         painter.setFont(font)
         
-        # Сокращаем длинные названия с использованием перевода
-        short_names = {
-            tr("skillsmn.hacking", "Взлом"): tr("skillsmn.hacking_short", "ВЗЛОМ"),
-            tr("skillsmn.social", "Социальная инженерия"): tr("skillsmn.social_short", "СОЦ.ИНЖ"),
-            tr("skillsmn.programming", "Программирование"): tr("skillsmn.programming_short", "ПРОГРАМ"),
-            tr("skillsmn.stealth", "Скрытность"): tr("skillsmn.stealth_short", "СКРЫТН"),
-            tr("skillsmn.analysis", "Анализ"): tr("skillsmn.analysis_short", "АНАЛИЗ"),
-            tr("skillsmn.network", "Сетевая безопасность"): tr("skillsmn.network_short", "СЕТЬ")
-        }
-        
-        display_name = short_names.get(self.skill_name, self.skill_name[:8])
         painter.drawText(0, circle_y + 45, self.width(), 20, 
-                        Qt.AlignCenter, display_name)
+                        Qt.AlignCenter, self.short_name)
         
         # Уровень мастерства с использованием перевода - ПОЛНЫЙ ТЕКСТ
         level_names = [
@@ -473,6 +457,9 @@ class SkillsWidget(QWidget):
         self.init_ui()
         self.update_translations()
         
+        # Тексты обновляются после смены языка (скрытый виджет - при показе)
+        retranslation.register(self, self.update_translations)
+        
     def init_ui(self):
         layout = QVBoxLayout()
         layout.setContentsMargins(25, 25, 25, 25)
@@ -622,39 +609,18 @@ class SkillsWidget(QWidget):
         
         self.skill_widgets.clear()
         
-        # Описания навыков
-        skill_descriptions = {
-            tr("skillsmn.hacking", "Взлом"): tr("skillsmn.hacking_desc", "Взлом систем, обход защиты, поиск уязвимостей"),
-            tr("skillsmn.social", "Социальная инженерия"): tr("skillsmn.social_desc", "Манипулирование людьми для получения информации"),
-            tr("skillsmn.programming", "Программирование"): tr("skillsmn.programming_desc", "Создание кода, скриптов и автоматизация"),
-            tr("skillsmn.stealth", "Скрытность"): tr("skillsmn.stealth_desc", "Сокрытие следов, анонимность в сети"),
-            tr("skillsmn.analysis", "Анализ"): tr("skillsmn.analysis_desc", "Анализ данных, выявление закономерностей"),
-            tr("skillsmn.network", "Сетевая безопасность"): tr("skillsmn.network_desc", "Защита сетей, обнаружение вторжений")
-        }
-        
-        # Цвета для навыков
-        skill_colors = {
-            tr("skillsmn.hacking", "Взлом"): "#ff0066",
-            tr("skillsmn.social", "Социальная инженерия"): "#ff9900",
-            tr("skillsmn.programming", "Программирование"): "#ffff00",
-            tr("skillsmn.stealth", "Скрытность"): "#00ff00",
-            tr("skillsmn.analysis", "Анализ"): "#00ffff",
-            tr("skillsmn.network", "Сетевая безопасность"): "#0066ff"
-        }
-        
         sorted_skills = sorted(self.game_state.skills.items(), 
                              key=lambda x: x[1], reverse=True)
         
-        for idx, (skill_name, level) in enumerate(sorted_skills):
+        for idx, (skill_id, level) in enumerate(sorted_skills):
             row = idx // 3
             col = idx % 3
             
-            description = skill_descriptions.get(skill_name, "")
-            color = skill_colors.get(skill_name, "#888888")
+            color = SKILL_COLORS.get(skill_id, "#888888")
             
-            skill_widget = CyberSkillWidget(skill_name, level, description, color)
+            skill_widget = CyberSkillWidget(skill_id, level, color)
             self.skills_grid.addWidget(skill_widget, row, col)
-            self.skill_widgets[skill_name] = skill_widget
+            self.skill_widgets[skill_id] = skill_widget
     
     def get_stats_text(self):
         """Получить текст статистики"""
@@ -678,10 +644,15 @@ class SkillsWidget(QWidget):
             total=total,
             avg=avg_level,
             progress=progress_percent,
-            max_name=max_skill[0],
+            max_name=self.get_skill_display_name(max_skill[0]),
             max_level=max_skill[1]
         )
     
+    def get_skill_display_name(self, skill_id):
+        """Название навыка для отображения"""
+        skill_widget = self.skill_widgets.get(skill_id)
+        return skill_widget.skill_name if skill_widget else get_skill_name(skill_id)
+    
     def check_for_updates(self):
         """Проверить обновления уровней навыков"""
         if not self.game_state or not self.game_state.skills:
@@ -720,16 +691,18 @@ class SkillsWidget(QWidget):
         # Обновляем кнопку
         self.back_button.setText(tr("skillsmn.back_button", "НАЗАД"))
         
+        # Навыки хранятся под id - достаточно обновить подписи
+        for skill_widget in self.skill_widgets.values():
+            skill_widget.update_texts()
+        
         # Обновляем статистику
         self.stats_label.setText(self.get_stats_text())
-        
-        # Пересоздаем виджеты навыков с обновленными названиями
-        self.create_skill_widgets()
     
     def set_game_state(self, game_state):
         """Обновить игровое состояние"""
         self.game_state = game_state
         self.previous_levels = game_state.skills.copy() if game_state.skills else {}
+        self.create_skill_widgets()
         self.update_translations()
     
     def showEvent(self, event):
@@ -8,6 +8,16 @@ import random
 import math
 import time
 
+from ui.animation_driver import animation_driver
+from ui.layer_cache import LayerCache
+from ui.particles import ParticleField
+from ui.quality_governor import quality_governor, timed_paint
+
+
+# Высота полосы рисунка сканирующих линий: полоса рисуется один раз и
+# повторяется по высоте, каждая со своим смещением искажения
+SCAN_BAND_HEIGHT = 16
+
 class TerminalWidget(QWidget):
     command_executed = Signal(str)
     
@@ -91,10 +101,11 @@ class TerminalWidget(QWidget):
         
     def setup_effects(self):
         """Настройка эффектов для терминала"""
-        # Таймер для эффектов
-        self.effect_timer = QTimer()
-        self.effect_timer.timeout.connect(self.update_effects)
-        self.effect_timer.start(50)  # 20 FPS
+        # Шаг эффектов в общем драйвере анимаций (20 FPS, только пока терминал виден)
+        self.effect_timer = animation_driver.register(self, self.update_effects, 50)
+        
+        # Статичные слои (рамка, рисунок линий, подписи, виньетка) рисуются один раз на размер
+        self.layers = LayerCache(self)
         
         # Эффект сканирующих линий
         self.scan_lines = []
@@ -102,7 +113,6 @@ class TerminalWidget(QWidget):
         self.scan_line_speed = 3
         
         # Эффект статического шума
-        self.static_particles = []
         self.init_static_particles()
         
         # Эффект свечения
@@ -121,38 +131,19 @@ class TerminalWidget(QWidget):
         
     def init_static_particles(self):
         """Инициализация частиц статического шума"""
-        self.static_particles = []
-        for _ in range(30):
-            self.static_particles.append({
-                'x': random.randint(0, self.width()),
-                'y': random.randint(0, self.height()),
-                'size': random.randint(1, 2),
-                'alpha': random.randint(20, 80),
-                'speed': random.uniform(0.5, 1.5),
-                'direction': random.uniform(0, 2 * math.pi),
-                'lifetime': random.randint(50, 150)
-            })
+        palette = [QColor(0, 255, 0), QColor(60, 230, 40), QColor(100, 255, 100), QColor(30, 210, 80)]
+        self.static_particles = ParticleField(30, self.width(), self.height(), palette,
+                                              size=(1, 2), alpha=(20, 80),
+                                              speed=(0.5, 1.5), lifetime=(50, 150))
         
     def update_effects(self):
         """Обновление всех эффектов"""
         # Обновление сканирующей линии
         self.scan_line_y = (self.scan_line_y + self.scan_line_speed) % (self.height() + 20)
         
-        # Обновление статических частиц
-        for particle in self.static_particles:
-            particle['x'] += math.cos(particle['direction']) * particle['speed']
-            particle['y'] += math.sin(particle['direction']) * particle['speed']
-            particle['lifetime'] -= 1
-            
-            if (particle['x'] < 0 or particle['x'] > self.width() or 
-                particle['y'] < 0 or particle['y'] > self.height() or
-                particle['lifetime'] <= 0):
-                particle.update({
-                    'x': random.randint(0, self.width()),
-                    'y': random.randint(0, self.height()),
-                    'lifetime': random.randint(50, 150),
-                    'alpha': random.randint(20, 80)
-                })
+        # Обновление статических частиц (число зависит от качества эффектов)
+        self.static_particles.set_count(quality_governor.particle_count(30))
+        self.static_particles.step(self.width(), self.height())
         
         # Обновление пульсации свечения
         self.glow_pulse += 0.02 * self.glow_pulse_direction
@@ -189,6 +180,7 @@ class TerminalWidget(QWidget):
         
         self.update()
             
+    @timed_paint
     def paintEvent(self, event):
         """Отрисовка эффектов терминала"""
         super().paintEvent(event)
@@ -197,7 +189,8 @@ class TerminalWidget(QWidget):
         painter.setRenderHint(QPainter.Antialiasing)
         
         # Эффект свечения границы
-        self.draw_glow_effect(painter)
+        if quality_governor.level.glow:
+            self.draw_glow_effect(painter)
         
         # Сканирующие линии
         self.draw_scan_lines(painter)
@@ -217,14 +210,20 @@ class TerminalWidget(QWidget):
         
     def draw_glow_effect(self, painter):
         """Рисование эффекта свечения"""
-        width = self.width()
-        height = self.height()
-        
-        # Внешнее свечение
+        # Рамка и угловые пятна берутся из кэша, во времени меняется только прозрачность
         glow_opacity = 0.2 + 0.1 * math.sin(time.time() * 2)
+        painter.setOpacity(glow_opacity)
+        painter.drawPixmap(0, 0, self.layers.get("border", self.render_border_glow))
+        
+        pulse_value = 0.5 + 0.5 * math.sin(time.time() * 3)
+        painter.setOpacity(0.3 * pulse_value)
+        painter.drawPixmap(0, 0, self.layers.get("corners", self.render_corner_glow))
+        
+    def render_border_glow(self, painter, width, height):
+        """Слой внешнего свечения рамки (прозрачность задаётся при наложении)"""
         for i in range(3):
             glow_size = i * 3
-            glow_color = QColor(0, 255, 0, int(50 * glow_opacity / (i + 1)))
+            glow_color = QColor(0, 255, 0, int(50 / (i + 1)))
             
             painter.setPen(QPen(glow_color, 1))
             painter.setBrush(Qt.NoBrush)
@@ -232,10 +231,10 @@ class TerminalWidget(QWidget):
                            width - 2*glow_size, 
                            height - 2*glow_size)
         
-        # Пульсирующее свечение в углах
+    def render_corner_glow(self, painter, width, height):
+        """Слой свечения в углах (пульсация задаётся прозрачностью при наложении)"""
         corner_radius = 20
-        pulse_value = 0.5 + 0.5 * math.sin(time.time() * 3)
-        glow_color = QColor(0, 255, 0, int(100 * pulse_value))
+        glow_color = QColor(0, 255, 0, 100)
         
         corners = [
             (0, 0),  # левый верхний
@@ -249,7 +248,6 @@ class TerminalWidget(QWidget):
             gradient.setColorAt(0, glow_color)
             gradient.setColorAt(1, QColor(0, 255, 0, 0))
             
-            painter.setOpacity(0.3)
             painter.setBrush(gradient)
             painter.setPen(Qt.NoPen)
             painter.drawEllipse(x - corner_radius, y - corner_radius, 
@@ -258,17 +256,20 @@ class TerminalWidget(QWidget):
     def draw_scan_lines(self, painter):
         """Рисование сканирующих линий"""
         width = self.width()
-        
-        # Основные линии
-        line_spacing = 2
-        painter.setOpacity(0.15)
-        painter.setPen(QPen(QColor(0, 255, 0, 30), 1))
-        
-        for y in range(0, self.height(), line_spacing):
-            # Добавляем легкое искажение
-            distortion = math.sin(y * 0.01 + time.time()) * 1.5
-            painter.drawLine(int(distortion), y, 
-                           width + int(distortion), y)
+        quality = quality_governor.level
+        
+        # Основные линии: одна полоса из кэша, повторённая по высоте с легким искажением
+        if quality.scan_line_spacing:
+            band = self.layers.get("scan_lines", self.render_scan_band, height=SCAN_BAND_HEIGHT,
+                                   variant=quality.scan_line_spacing)
+            painter.setOpacity(0.15)
+            if quality.distortion:
+                now = time.time()
+                for y in range(0, self.height(), SCAN_BAND_HEIGHT):
+                    distortion = math.sin(y * 0.01 + now) * 1.5
+                    painter.drawPixmap(int(distortion), y, band)
+            else:
+                painter.drawTiledPixmap(0, 0, width, self.height(), band)
         
         # Движущаяся линия сканирования
         scan_height = 20
@@ -290,27 +291,17 @@ class TerminalWidget(QWidget):
             painter.setPen(QPen(QColor(0, 255, 0, glow_alpha), 1))
             painter.drawLine(0, glow_y, width, glow_y)
         
+    def render_scan_band(self, painter, width, height):
+        """Полоса рисунка сканирующих линий (шаг зависит от качества эффектов)"""
+        line_spacing = quality_governor.level.scan_line_spacing or 2
+        painter.setPen(QPen(QColor(0, 255, 0, 30), 1))
+        for y in range(0, height, line_spacing):
+            painter.drawLine(0, y, width, y)
+        
     def draw_static_noise(self, painter):
         """Рисование статического шума"""
         painter.setOpacity(0.1)
-        
-        for particle in self.static_particles:
-            alpha = particle['alpha'] * (particle['lifetime'] / 150.0)
-            color = QColor(
-                random.randint(0, 100),
-                random.randint(200, 255),
-                random.randint(0, 100),
-                int(alpha)
-            )
-            
-            painter.setBrush(color)
-            painter.setPen(Qt.NoPen)
-            painter.drawRect(
-                int(particle['x']),
-                int(particle['y']),
-                particle['size'],
-                particle['size']
-            )
+        self.static_particles.draw(painter)
         
         # Крупные частицы шума
         for _ in range(5):
@@ -389,11 +380,16 @@ class TerminalWidget(QWidget):
             painter.drawText(x, y, symbol['char'])
         
         # Постоянные угловые метки
+        painter.setOpacity(1.0)
+        painter.drawPixmap(0, 0, self.layers.get("labels", self.render_corner_labels))
+        
+    def render_corner_labels(self, painter, width, height):
+        """Слой постоянных угловых меток"""
         corner_labels = [
             (5, 20, "┌─ ТЕРМИНАЛ МВД ─┐", QColor(0, 255, 0, 200)),
-            (self.width() - 150, 20, "СЕКУРНОСТЬ: 87%", QColor(0, 255, 0, 150)),
-            (5, self.height() - 10, "MINOS v.7.84", QColor(0, 255, 0, 180)),
-            (self.width() - 120, self.height() - 10, "ДОСТУП: 5/10", QColor(0, 255, 0, 180))
+            (width - 150, 20, "СЕКУРНОСТЬ: 87%", QColor(0, 255, 0, 150)),
+            (5, height - 10, "MINOS v.7.84", QColor(0, 255, 0, 180)),
+            (width - 120, height - 10, "ДОСТУП: 5/10", QColor(0, 255, 0, 180))
         ]
         
         painter.setFont(QFont("Consolas", 8))
@@ -404,9 +400,11 @@ class TerminalWidget(QWidget):
         
     def draw_vignette(self, painter):
         """Рисование эффекта виньетирования"""
-        width = self.width()
-        height = self.height()
+        painter.setOpacity(1.0)
+        painter.drawPixmap(0, 0, self.layers.get("vignette", self.render_vignette))
         
+    def render_vignette(self, painter, width, height):
+        """Слой виньетки"""
         vignette = QRadialGradient(width/2, height/2, max(width, height)/1.5)
         vignette.setColorAt(0, QColor(0, 0, 0, 0))
         vignette.setColorAt(0.7, QColor(0, 0, 0, 0))
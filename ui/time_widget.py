@@ -1,8 +1,11 @@
 from PySide6.QtWidgets import QWidget, QLabel, QVBoxLayout, QHBoxLayout, QFrame
-from PySide6.QtCore import Qt, QTimer
+from PySide6.QtCore import Qt
 from PySide6.QtGui import QFont, QPainter, QColor, QLinearGradient, QPen
 import datetime
 
+from core.game_clock import ClockTick, game_clock
+from ui.animation_driver import animation_driver
+
 class TimeWidget(QWidget):
     def __init__(self, game_state, parent=None):
         super().__init__(parent)
@@ -14,11 +17,13 @@ class TimeWidget(QWidget):
         # Инициализируем таймеры как None
         self.blink_timer = None
         self.pulse_timer = None
-        self.update_timer = None
         
         self.init_ui()
         self.setup_animations()
         
+        # Время на экране меняется только по тикам общих часов
+        game_clock.subscribe(ClockTick, self.on_clock_tick)
+        
     def init_ui(self):
         layout = QVBoxLayout()
         layout.setContentsMargins(0, 0, 0, 0)
@@ -210,20 +215,18 @@ class TimeWidget(QWidget):
         # Останавливаем старые таймеры, если они существуют
         self.stop_animations()
         
-        # Таймер для мигания разделителя
-        self.blink_timer = QTimer()
-        self.blink_timer.timeout.connect(self.update_blink)
-        self.blink_timer.start(500)  # Мигание каждые 500 мс
-        
-        # Таймер для пульсации времени
-        self.pulse_timer = QTimer()
-        self.pulse_timer.timeout.connect(self.update_pulse)
-        self.pulse_timer.start(50)  # Плавная анимация
+        # Анимации идут в общем драйвере; при перезапуске регистрируются один раз
+        if self.blink_timer is None:
+            # Мигание разделителя каждые 500 мс
+            self.blink_timer = animation_driver.register(self, self.update_blink, 500)
+        else:
+            self.blink_timer.start()
         
-        # Таймер для обновления времени
-        self.update_timer = QTimer()
-        self.update_timer.timeout.connect(self.update_display)
-        self.update_timer.start(1000)  # Обновление каждую секунду
+        if self.pulse_timer is None:
+            # Плавная пульсация времени
+            self.pulse_timer = animation_driver.register(self, self.update_pulse, 50)
+        else:
+            self.pulse_timer.start()
     
     def stop_animations(self):
         """Остановка всех анимаций и таймеров"""
@@ -231,8 +234,11 @@ class TimeWidget(QWidget):
             self.blink_timer.stop()
         if self.pulse_timer and self.pulse_timer.isActive():
             self.pulse_timer.stop()
-        if self.update_timer and self.update_timer.isActive():
-            self.update_timer.stop()
+    
+    def on_clock_tick(self, event):
+        """Тик игровых часов"""
+        if self.isVisible():
+            self.update_display()
     
     def restart_animations(self):
         """Перезапуск анимаций после загрузки сохранения"""